@@ -0,0 +1 @@
+"""RH Community Plugins benchmarks."""
@@ -0,0 +1,99 @@
+"""Benchmark JSON encode/decode on a synthetic 10,000-plugin data.json.
+
+Usage: uv run python benchmarks/bench_serialization.py [--plugins 10000]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import serialization
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+LOGGER = logging.getLogger(__name__)
+
+
+def synthetic_plugin(index: int) -> dict[str, Any]:
+    """Build one data.json entry shaped like the real generator output."""
+    releases = [
+        {
+            "assets": [
+                {
+                    "download_count": index * 3 + n,
+                    "name": "plugin.zip",
+                    "sha256": f"{index:032x}{n:032x}",
+                    "size": 12345 + n,
+                }
+            ],
+            "prerelease": n == 0,
+            "published_at": f"2025-0{n + 1}-01T12:00:00Z",
+            "tag_name": f"v1.{index % 10}.{n}",
+        }
+        for n in range(5)
+    ]
+    return {
+        "manifest": {
+            "category": "Utilities",
+            "dependencies": [],
+            "description": f"Synthetic plugin number {index} — für Tests ✅",
+            "documentation_uri": f"https://example.com/plugin-{index}",
+            "domain": f"plugin_{index}",
+            "name": f"Plugin {index}",
+            "version": f"1.{index % 10}.4",
+            "zip_filename": "plugin.zip",
+        },
+        "etag_release": f'W/"{index:040x}"',
+        "etag_repository": f'W/"{index:040x}"',
+        "forks_count": index % 50,
+        "last_fetched": "2025-03-09T14:00:00+00:00",
+        "last_updated": "2025-03-01T10:00:00Z",
+        "last_version": f"v1.{index % 10}.4",
+        "open_issues": index % 7,
+        "releases": releases,
+        "repository": f"owner{index % 500}/plugin-{index}",
+        "stargazers_count": index % 300,
+        "topics": ["rotorhazard", "plugin"],
+        "used_ref": f"v1.{index % 10}.4",
+        "watchers_count": index % 300,
+    }
+
+
+def measure(func: Any, repeat: int) -> float:
+    """Return the best time of `repeat` runs, in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    """Run the benchmark and log a small results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plugins", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = {100_000 + i: synthetic_plugin(i) for i in range(args.plugins)}
+    payload = serialization.dumps_stdlib(data)
+    assert serialization.dumps(data) == payload, "backends disagree on output"  # noqa: S101
+
+    stdlib_encode = measure(lambda: serialization.dumps_stdlib(data), args.repeat)
+    stdlib_decode = measure(lambda: json.loads(payload), args.repeat)
+    fast_encode = measure(lambda: serialization.dumps(data), args.repeat)
+    fast_decode = measure(lambda: serialization.loads(payload), args.repeat)
+
+    LOGGER.info(f"{args.plugins} plugins, {len(payload) / 1e6:.1f} MB")
+    LOGGER.info(f"backend: {serialization.BACKEND}")
+    LOGGER.info(f"{'':8}{'json':>10}{serialization.BACKEND:>10}{'speedup':>10}")
+    for name, slow, fast in (
+        ("encode", stdlib_encode, fast_encode),
+        ("decode", stdlib_decode, fast_decode),
+    ):
+        LOGGER.info(f"{name:8}{slow:>8.1f}ms{fast:>8.1f}ms{slow / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the import time of every command line entry point.
+
+Each module is imported in a fresh interpreter with `-X importtime`, so the
+numbers are cold-start costs without the interpreter's own start-up. Pass
+`--budget` to fail when an entry point is slower than the given median.
+
+Usage: uv run python benchmarks/bench_startup.py [--runs 5] [--budget 150]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+LOGGER = logging.getLogger(__name__)
+
+ENTRY_POINTS = [
+    "check_all",
+    "check_categories",
+    "check_preflight",
+    "check_releases",
+    "check_removed",
+    "purge_cache",
+    "schema_validation",
+    "sort_json",
+    "main",
+    "audit",
+]
+
+
+def import_time(module: str) -> float:
+    """Import `module` in a new interpreter and return its cumulative time in ms."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(ROOT / "metadata"), str(ROOT / "scripts")]),
+    }
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env=env,
+    )
+    # Lines read "import time: <self us> | <cumulative us> | <module>"
+    for line in reversed(result.stderr.splitlines()):
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    msg = f"No import time reported for {module}"
+    raise RuntimeError(msg)
+
+
+def main() -> None:
+    """Parse arguments, time every entry point and log a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, help="maximum median import, ms")
+    args = parser.parse_args()
+
+    LOGGER.info(f"{'':20}{'median':>10}{'min':>10}")
+    over_budget = []
+    for module in ENTRY_POINTS:
+        times = [import_time(module) for _ in range(args.runs)]
+        median = statistics.median(times)
+        LOGGER.info(f"{module:20}{median:>8.1f}ms{min(times):>8.1f}ms")
+        if args.budget is not None and median > args.budget:
+            over_budget.append(module)
+
+    if over_budget:
+        LOGGER.error(f"Over the {args.budget}ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark a client per call against the shared pooled transport.
+
+Requests go to a local stand-in for the GitHub API that adds a fixed delay,
+so the numbers show connection setups and tail latency, not network noise.
+
+Usage: uv run python benchmarks/bench_transport.py [--requests 500]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import aiohttp
+from aiogithubapi import GitHubAPI
+from aiohttp import web
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import transport
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+LOGGER = logging.getLogger(__name__)
+
+
+async def start_stand_in(delay: float) -> tuple[web.AppRunner, str]:
+    """Start the stand-in server and return its runner and base URL."""
+
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(delay)
+        return web.json_response({"full_name": f"owner/{request.match_info['repo']}"})
+
+    app = web.Application()
+    app.router.add_get("/repos/owner/{repo}", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def connection_counter() -> tuple[aiohttp.TraceConfig, list[int]]:
+    """Return a trace config and a one-item list counting new connections."""
+    count = [0]
+
+    async def on_create(*_: object) -> None:
+        count[0] += 1
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_end.append(on_create)
+    return trace, count
+
+
+async def timed_calls(
+    call: Callable[[int], Awaitable[object]], requests: int, concurrency: int
+) -> list[float]:
+    """Run `requests` calls with bounded concurrency and return latencies in ms."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call(index)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return latencies
+
+
+async def per_call_client(
+    config: transport.TransportConfig, requests: int, concurrency: int
+) -> tuple[list[float], int]:
+    """Open a fresh session and client for every request."""
+    trace, count = connection_counter()
+
+    async def call(index: int) -> None:
+        async with (
+            transport.create_session(config, [trace]) as session,
+            GitHubAPI(session=session, base_url=config.base_url) as github,
+        ):
+            await github.generic(f"/repos/owner/repo{index}")
+
+    return await timed_calls(call, requests, concurrency), count[0]
+
+
+async def shared_client(
+    config: transport.TransportConfig, requests: int, concurrency: int
+) -> tuple[list[float], int]:
+    """Send every request through one pooled client."""
+    trace, count = connection_counter()
+    async with (
+        transport.create_session(config, [trace]) as session,
+        transport.github_client(None, config, session=session) as github,
+    ):
+
+        async def call(index: int) -> None:
+            await github.generic(f"/repos/owner/repo{index}")
+
+        latencies = await timed_calls(call, requests, concurrency)
+    return latencies, count[0]
+
+
+def percentile(values: list[float], pct: int) -> float:
+    """Return the `pct` percentile of `values`."""
+    return statistics.quantiles(values, n=100)[pct - 1]
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """Run both scenarios against the stand-in and log a results table."""
+    runner, base_url = await start_stand_in(args.delay / 1000)
+    config = transport.TransportConfig(base_url=base_url)
+    try:
+        results = {
+            "per-call": await per_call_client(config, args.requests, args.concurrency),
+            "shared": await shared_client(config, args.requests, args.concurrency),
+        }
+    finally:
+        await runner.cleanup()
+
+    LOGGER.info(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"server delay {args.delay}ms"
+    )
+    LOGGER.info(f"{'':10}{'conns':>8}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for name, (latencies, connections) in results.items():
+        LOGGER.info(
+            f"{name:10}{connections:>8}"
+            f"{percentile(latencies, 50):>8.1f}ms"
+            f"{percentile(latencies, 95):>8.1f}ms"
+            f"{percentile(latencies, 99):>8.1f}ms"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--delay", type=float, default=5.0, help="server delay, ms")
+    args = parser.parse_args()
+    transport.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
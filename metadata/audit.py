@@ -0,0 +1,264 @@
+"""Audit every listed plugin against the PR validation rules.
+
+The PR checks only validate the repository being added. This command sweeps
+all of `plugins.json` with bounded concurrency over one pooled client and
+writes a JSON report and a Markdown table.
+
+Usage: PYTHONPATH=scripts uv run python metadata/audit.py [--concurrency 16]
+    [--fail-on-error]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import const
+from aiogithubapi import GitHubAPI
+from bootstrap import bootstrap
+from check_removed import removed_repositories
+from const import LOGGER, PLUGIN_LIST_FILE
+from generator import validate_manifest_domain, validate_manifest_version
+from plugin_metadata_generator import PluginMetadataGenerator
+from repo_identity import DEFAULT_CONCURRENCY, RepoIdentityCache
+from serialization import dump, load
+from transport import github_client, run
+
+AUDIT_OUTPUT_DIR = "output/audit"
+REMOVED_LIST_FILE = "removed.json"
+
+# Column order of the report; a check is `None` when an earlier one failed
+CHECKS = {
+    "repository": "Repository",
+    "name": "Name",
+    "not_removed": "Not removed",
+    "release": "Release",
+    "semver": "SemVer",
+    "manifest": "Manifest",
+    "domain": "Domain",
+    "version": "Version",
+}
+
+
+@dataclass(slots=True)
+class AuditResult:
+    """Outcome of all checks for one plugin."""
+
+    repository: str
+    canonical: str | None = None
+    used_ref: str | None = None
+    checks: dict[str, bool | None] = field(
+        default_factory=lambda: dict.fromkeys(CHECKS)
+    )
+    messages: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """Return True if no check failed."""
+        return False not in self.checks.values()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result as a report entry."""
+        return {
+            "repository": self.repository,
+            "canonical": self.canonical,
+            "used_ref": self.used_ref,
+            "passed": self.passed,
+            "checks": self.checks,
+            "messages": self.messages,
+        }
+
+
+async def audit_plugin(
+    github: GitHubAPI, repo: str, removed: set[str]
+) -> tuple[AuditResult, PluginMetadataGenerator]:
+    """Run every check against a single plugin repository.
+
+    Args:
+    ----
+        github: GitHubAPI instance.
+        repo: Repository name as listed in plugins.json.
+        removed: Lower-cased names of removed repositories.
+
+    Returns:
+    -------
+        tuple[AuditResult, PluginMetadataGenerator]: The result, and the
+        generator that holds the fetched repository data.
+
+    """
+    result = AuditResult(repo)
+    generator = PluginMetadataGenerator(repo)
+    checks = result.checks
+    checks["not_removed"] = repo.lower() not in removed
+
+    try:
+        checks["repository"] = await generator.fetch_repository_info(github)
+        if not checks["repository"]:
+            return result, generator
+        result.canonical = generator.repo
+        checks["name"] = generator.repo == repo
+        if generator.repo_metadata.archived:
+            checks["repository"] = False
+            generator.log("Repository is archived.", level=logging.ERROR)
+            return result, generator
+
+        checks["release"] = await generator.fetch_github_releases(github)
+        if not checks["release"]:
+            return result, generator
+        result.used_ref = generator.used_ref
+        checks["semver"] = (
+            generator.release_index.versions[generator.used_ref] is not None
+        )
+        if not checks["semver"]:
+            generator.log(
+                "Release tag '%s' does not follow SemVer.",
+                generator.used_ref,
+                level=logging.ERROR,
+            )
+
+        checks["manifest"] = await generator.validate_plugin_repository(
+            github
+        ) and await generator.fetch_manifest_file(github)
+        if not checks["manifest"]:
+            return result, generator
+
+        checks["domain"] = validate_manifest_domain(
+            generator.domain, generator.manifest_data, generator.logger
+        )
+        checks["version"] = validate_manifest_version(
+            generator.manifest_data, generator.used_ref, generator.logger
+        )
+    finally:
+        result.messages = [
+            message
+            for level, message in generator.logger.buffer
+            if level >= logging.WARNING
+        ]
+    return result, generator
+
+
+async def audit_registry(
+    repos: list[str],
+    removed: set[str],
+    github_token: str | None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[AuditResult]:
+    """Audit all plugins with bounded concurrency.
+
+    Canonical names seen along the way are recorded in the repository
+    identity cache, as the metadata generator does.
+
+    Args:
+    ----
+        repos: Repository names as listed in plugins.json.
+        removed: Names of removed repositories as listed, in any letter case.
+        github_token: GitHub token for API access.
+        concurrency: Maximum number of plugins audited at once.
+
+    Returns:
+    -------
+        list[AuditResult]: One result per plugin, in input order.
+
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    identities = RepoIdentityCache.from_env().load()
+    removed = {repo.lower() for repo in removed}
+
+    async def audit_one(
+        github: GitHubAPI, repo: str
+    ) -> tuple[AuditResult, PluginMetadataGenerator]:
+        async with semaphore:
+            return await audit_plugin(github, repo, removed)
+
+    async with github_client(github_token) as github:
+        audited = await asyncio.gather(*(audit_one(github, repo) for repo in repos))
+
+    for result, generator in audited:
+        if result.canonical and generator.repo_metadata:
+            identities.record(
+                generator.repo_metadata.id, result.canonical, result.repository
+            )
+    identities.save()
+    return [result for result, _ in audited]
+
+
+def build_report(results: list[AuditResult]) -> dict[str, Any]:
+    """Build the machine-readable audit report."""
+    failed = [result.repository for result in results if not result.passed]
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "total_plugins": len(results),
+        "passed_plugins": len(results) - len(failed),
+        "failed_plugins": failed,
+        "plugins": [result.as_dict() for result in results],
+    }
+
+
+def render_markdown(results: list[AuditResult]) -> str:
+    """Render the audit results as a Markdown table."""
+    symbols = {True: "✅", False: "❌", None: "-"}
+    lines = [
+        "| Plugin | Ref | " + " | ".join(CHECKS.values()) + " |",
+        "| --- | --- | " + " | ".join("---" for _ in CHECKS) + " |",
+    ]
+    for result in results:
+        cells = " | ".join(symbols[result.checks[name]] for name in CHECKS)
+        lines.append(f"| `{result.repository}` | {result.used_ref or '-'} | {cells} |")
+    passed = sum(result.passed for result in results)
+    lines.append("")
+    lines.append(f"{passed} of {len(results)} plugins passed all checks.")
+    return "\n".join(lines) + "\n"
+
+
+def write_outputs(results: list[AuditResult], output_dir: str) -> None:
+    """Write `audit.json` and `audit.md`, and the step summary in CI."""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    dump(f"{output_dir}/audit.json", build_report(results))
+    markdown = render_markdown(results)
+    Path(f"{output_dir}/audit.md").write_text(markdown, encoding="utf-8")
+
+    step_summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if step_summary:
+        with Path(step_summary).open("a", encoding="utf-8") as summary:
+            summary.write(f"## Registry audit\n\n{markdown}")
+
+
+def main() -> None:
+    """Entry point for the audit command."""
+    bootstrap()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plugins-file", default=PLUGIN_LIST_FILE)
+    parser.add_argument("--removed-file", default=REMOVED_LIST_FILE)
+    parser.add_argument("--output-dir", default=AUDIT_OUTPUT_DIR)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--fail-on-error",
+        action="store_true",
+        help="Exit with status 1 if any plugin fails a check",
+    )
+    args = parser.parse_args()
+
+    repos = load(args.plugins_file)
+    removed = removed_repositories(load(args.removed_file))
+    results = run(audit_registry(repos, removed, const.GITHUB_TOKEN, args.concurrency))
+    write_outputs(results, args.output_dir)
+
+    for result in results:
+        if not result.passed:
+            details = "; ".join(result.messages) or "see audit report"
+            LOGGER.warning(f"{result.repository}: {details}")
+    LOGGER.info(
+        f"Audited {len(results)} plugins, "
+        f"{sum(not r.passed for r in results)} with problems."
+    )
+    if args.fail_on_error and not all(result.passed for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
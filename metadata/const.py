@@ -1,30 +1,51 @@
-"""Const for metadata scripts."""
+"""Const for metadata scripts.
+
+Settings taken from the environment (`GITHUB_TOKEN`, `PUBLIC_BASE_URL`) are
+read when they are accessed, so `.env` can be loaded by the entry point after
+this module was imported.
+"""
 
 import logging
 import os
-import sys
-from pathlib import Path
-
-from dotenv import load_dotenv
 
-load_dotenv()
-
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 PLUGIN_LIST_FILE = "plugins.json"
 OUTPUT_DIR = "output/plugin"
+# Results of `main.py --shard i/N`, kept out of the published output
+SHARD_DIR = "output/shards"
+# Per-fetch fields that say nothing about a plugin's content
 COMPARE_IGNORE: list[str] = ["last_fetched", "etag_release", "etag_repository"]
 EXCLUDED_KEYS: list[str] = []
+# Number of newest releases published per plugin
+MAX_RELEASES = 5
+# Left out of content-hashed files, digests and fingerprints
+VOLATILE_KEYS: list[str] = COMPARE_IGNORE
+POINTER_FILE = "current.json"
+HASHES_FILE = "hashes.json"
+TRENDING_FILE = "trending.json"
+# Content digests of every plugin entry and output file, without volatile fields;
+# a run whose manifest equals the previous one has nothing to publish
+FINGERPRINTS_FILE = "fingerprints.json"
+PREVIOUS_FINGERPRINTS_FILE = "diff/fingerprints_before.json"
+# Previous run's data.json, downloaded by the workflow; results of plugins that
+# are not due for a refresh are taken from it
+PREVIOUS_DATA_FILE = "diff/data_before.json"
+# Files published under a fixed URL, which need a CDN purge when they change
+FIXED_OUTPUT_FILES: list[str] = [
+    "data.json",
+    "repositories.json",
+    POINTER_FILE,
+    TRENDING_FILE,
+]
+DEFAULT_PUBLIC_BASE_URL = "https://rhcp.hazardcreative.com/v1/plugin"
 
-# Loggin setup
-logging.addLevelName(logging.INFO, "")
-logging.addLevelName(logging.ERROR, "::error::")
-logging.addLevelName(logging.WARNING, "::warning::")
-logging.basicConfig(
-    level=logging.INFO,
-    format=" %(levelname)s %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
 LOGGER = logging.getLogger(__name__)
 
-# Create output directories
-Path(f"{OUTPUT_DIR}/diff").mkdir(parents=True, exist_ok=True)
+
+def __getattr__(name: str) -> str | None:
+    """Read environment settings on access."""
+    if name == "GITHUB_TOKEN":
+        return os.getenv("GITHUB_TOKEN")
+    if name == "PUBLIC_BASE_URL":
+        return os.getenv("PUBLIC_BASE_URL", DEFAULT_PUBLIC_BASE_URL)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
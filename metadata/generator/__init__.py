@@ -1,12 +1,57 @@
 """Generator utility modules for plugin metadata."""
 
 from .asset_handler import get_release_asset_info
-from .log_buffer import PluginLogBuffer
+from .hashed_output import (
+    changed_files,
+    content_digest,
+    encode_json,
+    entry_digests,
+    file_digests,
+    strip_volatile_keys,
+    write_hashed_files,
+)
+from .journal import CheckpointJournal
+from .log_buffer import LogEntry, PluginLogBuffer, PluginLogSink
+from .metrics_store import MetricsStore, Sample, sample_from_metadata
+from .records import AssetRecord, PluginRecord, ReleaseRecord
+from .releases import ReleaseAssetInfo, ReleaseInfo, parse_releases
+from .scheduler import RefreshSchedule, ScheduleEntry
 from .validators import validate_manifest_domain, validate_manifest_version
+from .zip_listing import (
+    ZipInspector,
+    ZipListing,
+    ZipListingCache,
+    ZipListingError,
+)
 
 __all__ = [
+    "AssetRecord",
+    "CheckpointJournal",
+    "LogEntry",
+    "MetricsStore",
     "PluginLogBuffer",
+    "PluginLogSink",
+    "PluginRecord",
+    "RefreshSchedule",
+    "ReleaseAssetInfo",
+    "ReleaseInfo",
+    "ReleaseRecord",
+    "Sample",
+    "ScheduleEntry",
+    "ZipInspector",
+    "ZipListing",
+    "ZipListingCache",
+    "ZipListingError",
+    "changed_files",
+    "content_digest",
+    "encode_json",
+    "entry_digests",
+    "file_digests",
     "get_release_asset_info",
+    "parse_releases",
+    "sample_from_metadata",
+    "strip_volatile_keys",
     "validate_manifest_domain",
     "validate_manifest_version",
+    "write_hashed_files",
 ]
@@ -0,0 +1,85 @@
+"""Content-hashed output files and the pointer manifest that references them."""
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+from serialization import dumps
+
+HASH_LENGTH = 16
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode data the same way every time, so equal data gives equal bytes."""
+    return dumps(data)
+
+
+def content_digest(payload: bytes) -> str:
+    """Return the SHA-256 hex digest of a payload."""
+    return hashlib.sha256(payload).hexdigest()
+
+
+def file_digests(output_dir: str, filenames: list[str]) -> dict[str, str]:
+    """Return the content digest of each existing file in `output_dir`."""
+    digests: dict[str, str] = {}
+    for filename in filenames:
+        path = Path(output_dir, filename)
+        if path.exists():
+            digests[filename] = content_digest(path.read_bytes())
+    return digests
+
+
+def changed_files(before: dict[str, str], after: dict[str, str]) -> list[str]:
+    """Return the files whose digest differs from (or is missing in) `before`."""
+    return sorted(name for name, digest in after.items() if before.get(name) != digest)
+
+
+def hashed_filename(filename: str, digest: str) -> str:
+    """Insert a (shortened) content digest into a filename.
+
+    Example: `data.json` -> `data.<digest>.json`.
+    """
+    path = Path(filename)
+    return f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}"
+
+
+def strip_volatile_keys(
+    data: dict[Any, dict[str, Any]], volatile_keys: list[str]
+) -> dict[Any, dict[str, Any]]:
+    """Remove per-run fields (e.g. `last_fetched`) from every plugin entry."""
+    return {
+        key: {k: v for k, v in value.items() if k not in volatile_keys}
+        for key, value in data.items()
+    }
+
+
+def entry_digests(
+    data: dict[Any, dict[str, Any]], volatile_keys: list[str]
+) -> dict[str, str]:
+    """Return the content digest of every plugin entry, without per-run fields."""
+    return {
+        str(key): content_digest(encode_json(value))
+        for key, value in strip_volatile_keys(data, volatile_keys).items()
+    }
+
+
+def write_hashed_files(output_dir: str, files: dict[str, Any]) -> dict[str, str]:
+    """Write each file under a content-hashed name.
+
+    Args:
+    ----
+        output_dir: Directory to write the files to.
+        files: Mapping of logical filename to the data to store.
+
+    Returns:
+    -------
+        dict[str, str]: Mapping of logical filename to hashed filename.
+
+    """
+    pointers: dict[str, str] = {}
+    for filename, data in sorted(files.items()):
+        payload = encode_json(data)
+        target = hashed_filename(filename, content_digest(payload))
+        Path(output_dir, target).write_bytes(payload)
+        pointers[filename] = target
+    return pointers
@@ -0,0 +1,162 @@
+"""Checkpoint journal of per-plugin generation results.
+
+Results are appended as JSON lines as soon as each plugin finishes, and
+flushed to disk with `fsync` in batches. A run that is cancelled or crashes
+leaves its finished plugins in the journal, and the next run reuses every
+entry that is younger than the freshness window instead of fetching it
+again. The journal is cleared once a run completes.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Self
+
+from serialization import JSONDecodeError, dumps_line, loads
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_FILE = ".cache/journal.jsonl"
+# Runs are scheduled every two hours; older results are fetched again
+DEFAULT_WINDOW = 2 * 60 * 60
+DEFAULT_BATCH_SIZE = 16
+
+
+class CheckpointJournal:
+    """Append-only JSON-lines journal, synced to disk in batches."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        window: float = DEFAULT_WINDOW,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize a journal backed by `path`.
+
+        Args:
+        ----
+            path: Journal file.
+            window: Age in seconds after which an entry is not reused.
+            batch_size: Number of entries written between two `fsync` calls.
+
+        """
+        self.path = Path(path)
+        self.window = window
+        self.batch_size = batch_size
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._file: BinaryIO | None = None
+        self._pending = 0
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create a journal from `JOURNAL_FILE` and `JOURNAL_WINDOW`."""
+        return cls(
+            os.getenv("JOURNAL_FILE", DEFAULT_JOURNAL_FILE),
+            float(os.getenv("JOURNAL_WINDOW", str(DEFAULT_WINDOW))),
+        )
+
+    def load(self, now: float | None = None) -> Self:
+        """Load the entries that are still fresh.
+
+        A line cut short by a crash is dropped from the file, so later
+        entries are appended after the last complete one.
+        """
+        self.entries = {}
+        if not self.path.exists():
+            return self
+        oldest = (now or time.time()) - self.window
+        valid = 0
+        with self.path.open("rb") as journal:
+            for line in journal:
+                try:
+                    entry = loads(line)
+                except JSONDecodeError:
+                    LOGGER.warning(f"Dropping truncated checkpoint in {self.path}")
+                    break
+                valid += len(line)
+                if entry["finished_at"] >= oldest:
+                    self.entries[entry["repo"]] = entry
+        if valid < self.path.stat().st_size:
+            with self.path.open("r+b") as journal:
+                journal.truncate(valid)
+        return self
+
+    def get(self, repo: str) -> dict[str, Any] | None:
+        """Return the fresh entry for a repository as listed in plugins.json.
+
+        JSON object keys are strings, so the result is keyed by integer
+        repository ids again, like results that were not journaled.
+        """
+        entry = self.entries.get(repo)
+        if entry is None:
+            return None
+        result = {int(key): value for key, value in entry["result"].items()}
+        return {**entry, "result": result}
+
+    def record(
+        self,
+        repo: str,
+        repository: str,
+        result: dict[str, Any],
+        now: float | None = None,
+    ) -> None:
+        """Append the result of one plugin.
+
+        Args:
+        ----
+            repo: Repository name as listed in plugins.json.
+            repository: Canonical repository name.
+            result: The plugin's result, keyed by repository id.
+            now: Completion time, defaults to the current time.
+
+        """
+        entry = {
+            "repo": repo,
+            "repository": repository,
+            "finished_at": now or time.time(),
+            "result": result,
+        }
+        self.entries[repo] = entry
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+        self._file.write(dumps_line(entry) + b"\n")
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffered entries and `fsync` the journal."""
+        if self._file is None or not self._pending:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self) -> None:
+        """Remove the journal after a completed run."""
+        self.close()
+        self.entries = {}
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> Self:
+        """Return the journal."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Sync and close the journal, keeping its entries on disk."""
+        self.close()
@@ -1,23 +1,159 @@
-"""Log buffering functionality for plugin metadata generation."""
+"""Log buffering functionality for plugin metadata generation.
+
+Messages are stored as a level, a %-style template and its arguments, and
+are only formatted when they are emitted. Each plugin keeps a bounded ring
+buffer of routine messages and a separate one for warnings and errors, so a
+chatty plugin cannot push its problems out or grow without limit.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from heapq import merge
+from itertools import count
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, NamedTuple, Self
 
 from const import LOGGER
+from serialization import dumps_line
+
+DEFAULT_CAPACITY = 64
+DEFAULT_KEEP_LEVEL = logging.WARNING
+# Fixed names, the GitHub Actions setup renames the levels for the console
+LEVEL_NAMES = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
+
+class LogEntry(NamedTuple):
+    """One buffered log message."""
+
+    seq: int
+    created: float
+    level: int
+    template: str
+    args: tuple[object, ...]
+
+    @property
+    def message(self) -> str:
+        """Format the message, the way `logging` does."""
+        return self.template % self.args if self.args else self.template
+
+
+class PluginLogSink:
+    """JSON-lines file that receives every flushed plugin log entry."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize a sink writing to `path`."""
+        self.path = Path(path)
+        self._file: BinaryIO | None = None
+
+    @classmethod
+    def from_env(cls) -> Self | None:
+        """Create a sink from `PLUGIN_LOG_FILE`, or None if it is not set."""
+        path = os.getenv("PLUGIN_LOG_FILE")
+        return cls(path) if path else None
+
+    def write(self, repo: str, entries: list[LogEntry]) -> None:
+        """Append the entries of one plugin, one JSON object per line."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+        for entry in entries:
+            record = {
+                "repo": repo,
+                "time": entry.created,
+                "level": LEVEL_NAMES.get(entry.level, str(entry.level)),
+                "message": entry.message,
+                "template": entry.template,
+            }
+            self._file.write(dumps_line(record) + b"\n")
+
+    def close(self) -> None:
+        """Close the sink file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> Self:
+        """Return the sink."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the sink file."""
+        self.close()
 
 
 class PluginLogBuffer:
     """Buffer logs per plugin before printing them grouped."""
 
-    def __init__(self, repo: str) -> None:
-        """Initialize the log buffer for a specific plugin repository."""
+    def __init__(
+        self,
+        repo: str,
+        capacity: int = DEFAULT_CAPACITY,
+        keep_level: int = DEFAULT_KEEP_LEVEL,
+    ) -> None:
+        """Initialize the log buffer for a specific plugin repository.
+
+        Args:
+        ----
+            repo: Repository the messages belong to.
+            capacity: Number of messages kept below and at `keep_level` each.
+            keep_level: Messages at this level or above are never evicted by
+                routine messages.
+
+        """
         self.repo = repo
-        self.buffer: list[tuple[int, str]] = []
+        self.keep_level = keep_level
+        self.dropped = 0
+        self._routine: deque[LogEntry] = deque(maxlen=capacity)
+        self._kept: deque[LogEntry] = deque(maxlen=capacity)
+        self._seq = count()
+
+    def log(self, level: int, template: str, *args: object) -> None:
+        """Buffer a log message with its level, without formatting it."""
+        ring = self._kept if level >= self.keep_level else self._routine
+        if len(ring) == ring.maxlen:
+            self.dropped += 1
+        ring.append(LogEntry(next(self._seq), time.time(), level, template, args))
+
+    @property
+    def entries(self) -> list[LogEntry]:
+        """Return the buffered entries in the order they were logged."""
+        return list(merge(self._routine, self._kept))
 
-    def log(self, level: int, message: str) -> None:
-        """Buffer a log message with its level."""
-        self.buffer.append((level, message))
+    @property
+    def buffer(self) -> list[tuple[int, str]]:
+        """Return the buffered messages as formatted `(level, message)` pairs."""
+        return [(entry.level, entry.message) for entry in self.entries]
 
-    def flush(self) -> None:
-        """Flush the buffered logs to the logger."""
-        LOGGER.info(f"::group::🔧 {self.repo}")
-        for level, message in self.buffer:
-            LOGGER.log(level, f"<{self.repo}> {message}")
+    def flush(self, sink: PluginLogSink | None = None) -> None:
+        """Flush the buffered logs to the logger and the sink, then clear them."""
+        entries = self.entries
+        LOGGER.info("::group::🔧 %s", self.repo)
+        if self.dropped:
+            LOGGER.info("<%s> … %d earlier messages dropped", self.repo, self.dropped)
+        for entry in entries:
+            if entry.args:
+                LOGGER.log(
+                    entry.level, f"<%s> {entry.template}", self.repo, *entry.args
+                )
+            else:
+                LOGGER.log(entry.level, "<%s> %s", self.repo, entry.template)
         LOGGER.info("::endgroup::")
+        if sink is not None:
+            sink.write(self.repo, entries)
+        self._routine.clear()
+        self._kept.clear()
+        self.dropped = 0
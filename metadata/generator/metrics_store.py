@@ -0,0 +1,218 @@
+"""Append-only columnar history of plugin stars, forks and downloads.
+
+Every generation run appends one row per plugin to fixed-width binary
+columns (`plugin`, `stars`, `forks`, `downloads`) and then commits the run by
+appending its timestamp and end row to `runs.bin`. Rows of a run are
+contiguous, so the samples of any past run are a slice found by bisecting the
+run timestamps. Columns are memory-mapped for reading and never parsed.
+
+Plugins are identified by an ordinal (their position in `plugins.json` of the
+store), which keeps the `plugin` column four bytes wide.
+"""
+
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+from serialization import dump, load
+
+DEFAULT_HISTORY_DIR = "output/history"
+INDEX_FILE = "plugins.json"
+RUNS_FILE = "runs.bin"
+# Column name and `array` typecode; all are fixed width
+COLUMNS = {"plugin": "I", "stars": "q", "forks": "q", "downloads": "q"}
+# Each run is committed as (timestamp, end row)
+RUN_TYPECODE = "q"
+
+DAY = 24 * 60 * 60
+TRENDING_WINDOW = 7 * DAY
+# A new star counts as much as this many downloads in the trending score
+STAR_WEIGHT = 10
+
+
+@dataclass(slots=True, frozen=True)
+class Sample:
+    """Counters of one plugin in one run."""
+
+    stars: int
+    forks: int
+    downloads: int
+
+
+class MetricsStore:
+    """Columnar metric history stored in a directory."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize a store backed by the directory `path`."""
+        self.path = Path(path)
+        self.plugins: list[str] = []
+        self.ordinals: dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create a store in `HISTORY_DIR`."""
+        return cls(os.getenv("HISTORY_DIR", DEFAULT_HISTORY_DIR))
+
+    def load(self) -> Self:
+        """Load the plugin ordinals; a missing store starts empty."""
+        index = self.path / INDEX_FILE
+        if index.exists():
+            self.plugins = [str(repo_id) for repo_id in load(index)]
+            self.ordinals = {repo_id: n for n, repo_id in enumerate(self.plugins)}
+        return self
+
+    def _ordinal(self, repo_id: str) -> int:
+        ordinal = self.ordinals.get(repo_id)
+        if ordinal is None:
+            ordinal = self.ordinals[repo_id] = len(self.plugins)
+            self.plugins.append(repo_id)
+        return ordinal
+
+    def _read(self, name: str, typecode: str) -> array:
+        """Read a small file (the run table) into an array."""
+        values = array(typecode)
+        path = self.path / name
+        if path.exists():
+            values.frombytes(path.read_bytes())
+        return values
+
+    def runs(self) -> tuple[array, array]:
+        """Return the committed run timestamps and their end rows."""
+        table = self._read(RUNS_FILE, RUN_TYPECODE)
+        return table[0::2], table[1::2]
+
+    def append_run(self, timestamp: int, samples: Mapping[int | str, Sample]) -> None:
+        """Append one run of samples and commit it.
+
+        Rows written by an interrupted run are beyond the last committed end
+        row and are truncated before the new rows are appended.
+
+        Args:
+        ----
+            timestamp: Unix time of the run.
+            samples: Counters per GitHub repository id.
+
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        _, ends = self.runs()
+        committed = ends[-1] if ends else 0
+
+        rows = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        for repo_id, sample in samples.items():
+            rows["plugin"].append(self._ordinal(str(repo_id)))
+            rows["stars"].append(sample.stars)
+            rows["forks"].append(sample.forks)
+            rows["downloads"].append(sample.downloads)
+
+        dump(self.path / INDEX_FILE, self.plugins)
+        for name, values in rows.items():
+            with (self.path / f"{name}.bin").open("ab") as column:
+                column.truncate(committed * values.itemsize)
+                values.tofile(column)
+        with (self.path / RUNS_FILE).open("ab") as runs:
+            array(RUN_TYPECODE, [timestamp, committed + len(samples)]).tofile(runs)
+
+    @contextmanager
+    def columns(self) -> Iterator[dict[str, memoryview]]:
+        """Map every column into memory for the duration of the block."""
+        with ExitStack() as stack:
+            views: dict[str, memoryview] = {}
+            for name, typecode in COLUMNS.items():
+                path = self.path / f"{name}.bin"
+                if not path.exists() or path.stat().st_size == 0:
+                    views[name] = memoryview(array(typecode))
+                    continue
+                file = stack.enter_context(path.open("rb"))
+                mapped = stack.enter_context(
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+                view = memoryview(mapped).cast(typecode)
+                stack.callback(view.release)
+                views[name] = view
+            yield views
+
+    def snapshot(self, at: int) -> dict[str, Sample]:
+        """Return the samples of the last run at or before `at`.
+
+        Returns
+        -------
+            dict[str, Sample]: Samples per repository id; empty if no run
+            happened before `at`.
+
+        """
+        times, ends = self.runs()
+        run = bisect_right(times, at) - 1
+        if run < 0:
+            return {}
+        start = ends[run - 1] if run else 0
+        with self.columns() as columns:
+            return {
+                self.plugins[columns["plugin"][row]]: Sample(
+                    columns["stars"][row],
+                    columns["forks"][row],
+                    columns["downloads"][row],
+                )
+                for row in range(start, ends[run])
+            }
+
+    def trending(
+        self, now: int, window: int = TRENDING_WINDOW
+    ) -> dict[str, dict[str, float]]:
+        """Score plugins by their growth over the last `window` seconds.
+
+        The score is the daily growth of downloads plus `STAR_WEIGHT` times the
+        daily growth of stars. Download counts only cover the published
+        releases, so a drop (an old release leaving the list) counts as zero.
+
+        Returns
+        -------
+            dict[str, dict[str, float]]: Score and growth per repository id,
+            highest score first. Plugins without a sample at the start of the
+            window are left out.
+
+        """
+        times, _ = self.runs()
+        if not times:
+            return {}
+        latest = self.snapshot(now)
+        start_time = times[max(0, bisect_right(times, now - window) - 1)]
+        earlier = self.snapshot(start_time)
+        days = max((times[bisect_right(times, now) - 1] - start_time) / DAY, 1.0)
+
+        scores: dict[str, dict[str, float]] = {}
+        for repo_id, sample in latest.items():
+            before = earlier.get(repo_id)
+            if before is None:
+                continue
+            downloads = max(sample.downloads - before.downloads, 0)
+            stars = max(sample.stars - before.stars, 0)
+            scores[repo_id] = {
+                "score": round((downloads + STAR_WEIGHT * stars) / days, 2),
+                "downloads": downloads,
+                "stars": stars,
+            }
+        return dict(
+            sorted(scores.items(), key=lambda item: item[1]["score"], reverse=True)
+        )
+
+
+def sample_from_metadata(metadata: Mapping) -> Sample:
+    """Build a sample from a plugin's `data.json` entry.
+
+    Downloads are summed over all assets of the published releases.
+    """
+    return Sample(
+        stars=metadata.get("stargazers_count") or 0,
+        forks=metadata.get("forks_count") or 0,
+        downloads=sum(
+            asset.get("download_count") or 0
+            for release in metadata.get("releases", [])
+            for asset in release.get("assets", [])
+        ),
+    )
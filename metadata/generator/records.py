@@ -0,0 +1,87 @@
+"""Typed records for plugin, release and asset metadata.
+
+Each record is built once per plugin and turned into a plain dict only when
+it is serialised. Field order is the canonical key order of `data.json`, and
+fields listed in `OPTIONAL` are left out when they are `None` or empty.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+
+def _serialise(value: Any) -> Any:
+    """Convert nested records (and lists of records) to plain values."""
+    if isinstance(value, list):
+        return [_serialise(item) for item in value]
+    if hasattr(value, "as_dict"):
+        return value.as_dict()
+    return value
+
+
+class _Record:
+    """Shared `as_dict` for the slotted metadata records."""
+
+    __slots__ = ()
+    OPTIONAL: ClassVar[frozenset[str]] = frozenset()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a dict, in canonical key order."""
+        result: dict[str, Any] = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if name in self.OPTIONAL and value in (None, []):
+                continue
+            result[name] = _serialise(value)
+        return result
+
+
+@dataclass(slots=True)
+class AssetRecord(_Record):
+    """A single release asset."""
+
+    OPTIONAL: ClassVar[frozenset[str]] = frozenset(
+        {"size", "download_count", "sha256", "file_count", "uncompressed_size"}
+    )
+
+    name: str
+    size: int | None = None
+    download_count: int | None = None
+    sha256: str | None = None
+    # Central directory summary, only set for the plugin zip of `used_ref`
+    file_count: int | None = None
+    uncompressed_size: int | None = None
+
+
+@dataclass(slots=True)
+class ReleaseRecord(_Record):
+    """A GitHub release and its assets."""
+
+    OPTIONAL: ClassVar[frozenset[str]] = frozenset({"assets"})
+
+    tag_name: str
+    published_at: str | None
+    prerelease: bool
+    assets: list[AssetRecord] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PluginRecord(_Record):
+    """All metadata published for one plugin."""
+
+    OPTIONAL: ClassVar[frozenset[str]] = frozenset({"last_prerelease"})
+
+    manifest: dict[str, Any]
+    etag_release: str | None
+    etag_repository: str | None
+    forks_count: int
+    last_fetched: str
+    last_prerelease: str | None
+    last_updated: str
+    last_version: str | None
+    open_issues: int
+    releases: list[ReleaseRecord]
+    repository: str
+    stargazers_count: int
+    topics: list[str]
+    used_ref: str
+    watchers_count: int
@@ -0,0 +1,76 @@
+"""Slim release records parsed straight from the GitHub releases payload."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class ReleaseAssetInfo:
+    """The fields of a release asset that the generator uses."""
+
+    name: str
+    size: int | None = None
+    download_count: int | None = None
+    digest: str | None = None
+    browser_download_url: str | None = None
+
+
+@dataclass(slots=True)
+class ReleaseInfo:
+    """The fields of a GitHub release that the generator uses."""
+
+    tag_name: str
+    prerelease: bool
+    created_at: str | None = None
+    published_at: str | None = None
+    assets: list[ReleaseAssetInfo] = field(default_factory=list)
+
+
+def parse_release(raw: dict[str, Any]) -> ReleaseInfo:
+    """Build a ReleaseInfo from a single raw release object."""
+    return ReleaseInfo(
+        tag_name=raw["tag_name"],
+        prerelease=bool(raw.get("prerelease")),
+        created_at=raw.get("created_at"),
+        published_at=raw.get("published_at"),
+        assets=[
+            ReleaseAssetInfo(
+                name=asset.get("name"),
+                size=asset.get("size"),
+                download_count=asset.get("download_count"),
+                digest=asset.get("digest"),
+                browser_download_url=asset.get("browser_download_url"),
+            )
+            for asset in raw.get("assets") or []
+        ],
+    )
+
+
+def parse_releases(payload: list[dict[str, Any]], keep: int) -> list[ReleaseInfo]:
+    """Parse the newest releases from a raw releases payload.
+
+    Only the `keep` newest releases are parsed, plus the newest stable release
+    and the newest prerelease when they are older than that. Everything else is
+    dropped before any objects are built.
+
+    Args:
+    ----
+        payload: Decoded JSON list from the releases endpoint.
+        keep: Number of newest releases to keep.
+
+    Returns:
+    -------
+        list[ReleaseInfo]: Kept releases, newest first.
+
+    """
+    ordered = sorted(payload, key=lambda r: r.get("created_at") or "", reverse=True)
+    selected = ordered[:keep]
+    for prerelease in (False, True):
+        if not any(bool(r.get("prerelease")) is prerelease for r in selected):
+            latest = next(
+                (r for r in ordered if bool(r.get("prerelease")) is prerelease), None
+            )
+            if latest is not None:
+                selected.append(latest)
+    selected.sort(key=lambda r: r.get("created_at") or "", reverse=True)
+    return [parse_release(raw) for raw in selected]
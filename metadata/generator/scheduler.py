@@ -0,0 +1,205 @@
+"""Refresh schedule that fetches plugins according to their activity.
+
+Every plugin gets a refresh interval from its observed activity: the age of
+its last push or release, and how often its published data (including the
+star, fork and download counters) changed when it was fetched. A run only
+fetches the plugins that are due, plus a fixed-size sample of dormant ones
+that have waited the longest, and reuses the previous result of the others.
+"""
+
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Self
+
+from const import VOLATILE_KEYS
+from serialization import JSONDecodeError, dump, load
+
+from .hashed_output import content_digest, encode_json
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SCHEDULE_FILE = ".cache/schedule.json"
+DEFAULT_SAMPLE_SIZE = 20
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+# (maximum age of the last activity, refresh interval), most active first
+TIERS: list[tuple[float, float]] = [
+    (7 * DAY, 2 * HOUR),
+    (30 * DAY, 12 * HOUR),
+    (180 * DAY, DAY),
+]
+DORMANT_INTERVAL = 7 * DAY
+# Runs start a little late or early, so an interval equal to the cron period
+# must still be due on the next run instead of the one after
+DUE_TOLERANCE = 10 * 60
+# Weight of the newest fetch in the smoothed change rate
+CHANGE_RATE_WEIGHT = 0.5
+# Plugins whose data changes on more than half of the fetches move one tier up
+HOT_CHANGE_RATE = 0.5
+
+
+@dataclass(slots=True)
+class ScheduleEntry:
+    """Refresh state of one plugin."""
+
+    id: str
+    fetched_at: float
+    interval: float
+    fingerprint: str
+    change_rate: float = 1.0
+
+
+def fingerprint(metadata: dict[str, Any]) -> str:
+    """Return a digest of the published data, without per-fetch fields."""
+    return content_digest(
+        encode_json({k: v for k, v in metadata.items() if k not in VOLATILE_KEYS})
+    )
+
+
+def last_activity(metadata: dict[str, Any]) -> float:
+    """Return the timestamp of the last push or release of a plugin."""
+    dates = [metadata.get("last_updated")] + [
+        release.get("published_at") for release in metadata.get("releases", [])
+    ]
+    timestamps = [datetime.fromisoformat(date).timestamp() for date in dates if date]
+    return max(timestamps, default=0.0)
+
+
+def refresh_interval(metadata: dict[str, Any], change_rate: float, now: float) -> float:
+    """Return how long the result of a plugin can be reused.
+
+    Args:
+    ----
+        metadata: The plugin's newest metadata.
+        change_rate: Smoothed share of fetches that changed the plugin's data.
+        now: Current time.
+
+    Returns:
+    -------
+        float: Refresh interval in seconds.
+
+    """
+    age = now - last_activity(metadata)
+    intervals = [interval for _, interval in TIERS] + [DORMANT_INTERVAL]
+    tier = next(
+        (index for index, (max_age, _) in enumerate(TIERS) if age < max_age),
+        len(TIERS),
+    )
+    if change_rate > HOT_CHANGE_RATE:
+        tier = max(tier - 1, 0)
+    return intervals[tier]
+
+
+class RefreshSchedule:
+    """On-disk refresh state of every plugin, keyed by its plugins.json name."""
+
+    def __init__(
+        self, path: str | Path, sample_size: int = DEFAULT_SAMPLE_SIZE
+    ) -> None:
+        """Initialize an empty schedule backed by `path`.
+
+        Args:
+        ----
+            path: Schedule file.
+            sample_size: Number of dormant plugins fetched early on every run.
+
+        """
+        self.path = Path(path)
+        self.sample_size = sample_size
+        self.entries: dict[str, ScheduleEntry] = {}
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create a schedule from `SCHEDULE_FILE` and `SCHEDULE_SAMPLE_SIZE`."""
+        return cls(
+            os.getenv("SCHEDULE_FILE", DEFAULT_SCHEDULE_FILE),
+            int(os.getenv("SCHEDULE_SAMPLE_SIZE", str(DEFAULT_SAMPLE_SIZE))),
+        )
+
+    def load(self) -> Self:
+        """Load the schedule from disk; a missing or invalid file starts empty."""
+        if not self.path.exists():
+            return self
+        try:
+            self.entries = {
+                repo: ScheduleEntry(**entry) for repo, entry in load(self.path).items()
+            }
+        except (OSError, JSONDecodeError, AttributeError, TypeError):
+            LOGGER.warning(f"Ignoring unreadable refresh schedule: {self.path}")
+            self.entries = {}
+        return self
+
+    def save(self) -> None:
+        """Write the schedule to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        dump(self.path, {repo: asdict(entry) for repo, entry in self.entries.items()})
+
+    def due(self, repos: list[str], now: float | None = None) -> set[str]:
+        """Return the repositories to fetch in this run.
+
+        Plugins without an entry and plugins whose interval has passed, give
+        or take `DUE_TOLERANCE`, are due. The dormant plugins that waited the
+        longest are added on top.
+        """
+        now = now or time.time()
+        due: set[str] = set()
+        dormant: list[tuple[float, str]] = []
+        for repo in repos:
+            entry = self.entries.get(repo.lower())
+            if (
+                entry is None
+                or now - entry.fetched_at >= entry.interval - DUE_TOLERANCE
+            ):
+                due.add(repo)
+            elif entry.interval >= DORMANT_INTERVAL:
+                dormant.append((entry.fetched_at, repo))
+        due.update(repo for _, repo in sorted(dormant)[: self.sample_size])
+        return due
+
+    def record(
+        self,
+        repo: str,
+        repo_id: int | str,
+        metadata: dict[str, Any],
+        now: float | None = None,
+    ) -> None:
+        """Update the schedule with a freshly fetched result.
+
+        Args:
+        ----
+            repo: Repository name as listed in plugins.json.
+            repo_id: GitHub id of the repository.
+            metadata: The plugin's newest metadata.
+            now: Fetch time, defaults to the current time. Runs pass their
+                start time, so every plugin of a run is due at the same time.
+
+        """
+        now = now or time.time()
+        digest = fingerprint(metadata)
+        previous = self.entries.get(repo.lower())
+        change_rate = 1.0
+        if previous is not None:
+            changed = 1.0 if previous.fingerprint != digest else 0.0
+            change_rate = (
+                CHANGE_RATE_WEIGHT * changed
+                + (1 - CHANGE_RATE_WEIGHT) * previous.change_rate
+            )
+        self.entries[repo.lower()] = ScheduleEntry(
+            id=str(repo_id),
+            fetched_at=now,
+            interval=refresh_interval(metadata, change_rate, now),
+            fingerprint=digest,
+            change_rate=change_rate,
+        )
+
+    def prune(self, repos: list[str]) -> None:
+        """Forget plugins that are no longer listed."""
+        listed = {repo.lower() for repo in repos}
+        self.entries = {
+            repo: entry for repo, entry in self.entries.items() if repo in listed
+        }
@@ -30,13 +30,16 @@ def validate_manifest_domain(
     if manifest_domain != domain:
         logger.log(
             logging.ERROR,
-            f"Domain mismatch: Folder '{domain}' vs Manifest '{manifest_domain}'",
+            "Domain mismatch: Folder '%s' vs Manifest '%s'",
+            domain,
+            manifest_domain,
         )
         return False
     # Manifest domain matches the folder name
     logger.log(
         logging.INFO,
-        f"✅ Manifest domain validated: '{manifest_domain}' matches domain folder",
+        "✅ Manifest domain validated: '%s' matches domain folder",
+        manifest_domain,
     )
     return True
 
@@ -69,15 +72,17 @@ def validate_manifest_version(
     if manifest_version == latest_version:
         logger.log(
             logging.INFO,
-            f"✅ Manifest version validated: '{manifest_version}' "
-            f"matches release '{latest_version}'",
+            "✅ Manifest version validated: '%s' matches release '%s'",
+            manifest_version,
+            latest_version,
         )
         return True
 
     # Mismatch - version is outdated
     logger.log(
         logging.WARNING,
-        f"Manifest version mismatch: '{manifest_version}' "
-        f"(manifest) vs '{latest_version}' (release)",
+        "Manifest version mismatch: '%s' (manifest) vs '%s' (release)",
+        manifest_version,
+        latest_version,
     )
     return False
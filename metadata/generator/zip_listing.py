@@ -0,0 +1,302 @@
+"""Inspect release zips by reading only their central directory.
+
+The end-of-central-directory record is located with a small `Range` request
+at the end of the asset, then the central directory itself is fetched with a
+second one. A release therefore costs a few KB of traffic instead of a full
+download. Listings are cached on disk by the asset's SHA-256 digest, which
+never changes for a published asset.
+"""
+
+import logging
+import os
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+import aiohttp
+from serialization import JSONDecodeError, dump, load
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = ".cache/zip_listings.json"
+
+EOCD_SIGNATURE = b"PK\x05\x06"
+ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+ZIP64_EOCD_SIGNATURE = b"PK\x06\x06"
+CENTRAL_HEADER_SIGNATURE = b"PK\x01\x02"
+EOCD_SIZE = 22
+ZIP64_LOCATOR_SIZE = 20
+ZIP64_EOCD_SIZE = 56
+CENTRAL_HEADER_SIZE = 46
+# First tail request; enough for the records of a zip without a long comment
+TAIL_SIZE = 4096
+# The record can be preceded by a comment of up to 64 KiB
+MAX_TAIL_SIZE = EOCD_SIZE + 0xFFFF + ZIP64_LOCATOR_SIZE + ZIP64_EOCD_SIZE
+ZIP64_MARKER = 0xFFFFFFFF
+ZIP64_EXTRA_ID = 0x0001
+
+MANIFEST_PATH = re.compile(r"^custom_plugins/[^/]+/manifest\.json$")
+
+
+class ZipListingError(Exception):
+    """Raised when a zip cannot be inspected."""
+
+
+@dataclass(slots=True)
+class ZipListing:
+    """Summary of a zip's central directory."""
+
+    file_count: int
+    uncompressed_size: int
+    manifests: list[str] = field(default_factory=list)
+
+    def has_manifest(self, domain: str) -> bool:
+        """Return True if the zip contains `custom_plugins/<domain>/manifest.json`."""
+        return f"custom_plugins/{domain}/manifest.json" in self.manifests
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the listing as a cache entry."""
+        return {
+            "file_count": self.file_count,
+            "uncompressed_size": self.uncompressed_size,
+            "manifests": self.manifests,
+        }
+
+
+def find_end_of_central_directory(tail: bytes, tail_offset: int) -> tuple[int, int]:
+    """Locate the central directory from the end of a zip.
+
+    Args:
+    ----
+        tail: The last bytes of the zip.
+        tail_offset: Offset of `tail` within the zip.
+
+    Returns:
+    -------
+        tuple[int, int]: Offset and size of the central directory.
+
+    Raises:
+    ------
+        ZipListingError: If no end-of-central-directory record is found.
+
+    """
+    index = tail.rfind(EOCD_SIGNATURE)
+    if index < 0 or len(tail) - index < EOCD_SIZE:
+        raise ZipListingError("End of central directory record not found.")
+    cd_size, cd_offset = struct.unpack_from("<II", tail, index + 12)
+    if ZIP64_MARKER not in (cd_size, cd_offset):
+        return cd_offset, cd_size
+
+    locator = index - ZIP64_LOCATOR_SIZE
+    if locator < 0 or tail[locator : locator + 4] != ZIP64_LOCATOR_SIGNATURE:
+        raise ZipListingError("Zip64 locator not found.")
+    (record_offset,) = struct.unpack_from("<Q", tail, locator + 8)
+    record = record_offset - tail_offset
+    if record < 0 or tail[record : record + 4] != ZIP64_EOCD_SIGNATURE:
+        raise ZipListingError("Zip64 end of central directory record not found.")
+    if record + ZIP64_EOCD_SIZE > len(tail):
+        raise ZipListingError("Zip64 end of central directory record is truncated.")
+    cd_size, cd_offset = struct.unpack_from("<QQ", tail, record + 40)
+    return cd_offset, cd_size
+
+
+def parse_central_directory(data: bytes) -> ZipListing:
+    """Summarise the entries of a central directory.
+
+    Directories are not counted as files. Sizes above 4 GiB are read from the
+    Zip64 extra field.
+
+    Raises
+    ------
+        ZipListingError: If an entry header is malformed or truncated.
+
+    """
+    listing = ZipListing(file_count=0, uncompressed_size=0)
+    offset = 0
+    while offset < len(data):
+        if data[offset : offset + 4] != CENTRAL_HEADER_SIGNATURE:
+            msg = f"Bad central directory entry at {offset}."
+            raise ZipListingError(msg)
+        if offset + CENTRAL_HEADER_SIZE > len(data):
+            msg = f"Truncated central directory entry at {offset}."
+            raise ZipListingError(msg)
+        (size,) = struct.unpack_from("<I", data, offset + 24)
+        name_length, extra_length, comment_length = struct.unpack_from(
+            "<HHH", data, offset + 28
+        )
+        name_start = offset + CENTRAL_HEADER_SIZE
+        extra_start = name_start + name_length
+        if extra_start + extra_length + comment_length > len(data):
+            msg = f"Truncated central directory entry at {offset}."
+            raise ZipListingError(msg)
+        name = data[name_start:extra_start].decode("utf-8", errors="replace")
+        if size == ZIP64_MARKER:
+            size = _zip64_size(data[extra_start : extra_start + extra_length])
+
+        if not name.endswith("/"):
+            listing.file_count += 1
+            listing.uncompressed_size += size
+            if MANIFEST_PATH.match(name):
+                listing.manifests.append(name)
+        offset = extra_start + extra_length + comment_length
+    return listing
+
+
+def _zip64_size(extra: bytes) -> int:
+    """Return the uncompressed size from a Zip64 extra field."""
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, length = struct.unpack_from("<HH", extra, offset)
+        if header_id == ZIP64_EXTRA_ID and length >= 8:
+            if offset + 12 > len(extra):
+                raise ZipListingError("Zip64 extra field is truncated.")
+            return struct.unpack_from("<Q", extra, offset + 4)[0]
+        offset += 4 + length
+    raise ZipListingError("Zip64 extra field not found.")
+
+
+async def fetch_range(
+    session: aiohttp.ClientSession, url: str, start: int, end: int
+) -> bytes:
+    """Fetch bytes `start` to `end` (inclusive) of a remote file.
+
+    Raises
+    ------
+        ZipListingError: If the server does not honour the range.
+
+    """
+    headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    async with session.get(url, headers=headers) as response:
+        if response.status != 206:
+            msg = f"Range request not supported (HTTP {response.status})."
+            raise ZipListingError(msg)
+        return await response.read()
+
+
+async def fetch_zip_listing(
+    session: aiohttp.ClientSession, url: str, size: int
+) -> ZipListing:
+    """Read the central directory of a remote zip with `Range` requests.
+
+    Args:
+    ----
+        session: HTTP session used for the requests.
+        url: Download URL of the zip.
+        size: Size of the zip in bytes.
+
+    Returns:
+    -------
+        ZipListing: Summary of the zip's entries.
+
+    """
+    tail_offset = max(0, size - TAIL_SIZE)
+    tail = await fetch_range(session, url, tail_offset, size - 1)
+    try:
+        cd_offset, cd_size = find_end_of_central_directory(tail, tail_offset)
+    except ZipListingError:
+        if tail_offset == 0:
+            raise
+        # A long archive comment pushed the record out of the first request
+        tail_offset = max(0, size - MAX_TAIL_SIZE)
+        tail = await fetch_range(session, url, tail_offset, size - 1)
+        cd_offset, cd_size = find_end_of_central_directory(tail, tail_offset)
+
+    if cd_offset + cd_size > size:
+        raise ZipListingError("Central directory lies outside the file.")
+    if cd_size == 0:
+        return ZipListing(file_count=0, uncompressed_size=0)
+    if cd_offset >= tail_offset:
+        start = cd_offset - tail_offset
+        directory = tail[start : start + cd_size]
+    else:
+        directory = await fetch_range(session, url, cd_offset, cd_offset + cd_size - 1)
+    return parse_central_directory(directory)
+
+
+class ZipListingCache:
+    """On-disk map of asset SHA-256 digests to zip listings."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize an empty cache backed by `path`."""
+        self.path = Path(path)
+        self.listings: dict[str, ZipListing] = {}
+        self.dirty = False
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create a cache from `ZIP_CACHE_FILE`."""
+        return cls(os.getenv("ZIP_CACHE_FILE", DEFAULT_CACHE_FILE))
+
+    def load(self) -> Self:
+        """Load the cache from disk; a missing or invalid file starts empty."""
+        if not self.path.exists():
+            return self
+        try:
+            self.listings = {
+                digest: ZipListing(**entry) for digest, entry in load(self.path).items()
+            }
+        except (OSError, JSONDecodeError, AttributeError, TypeError):
+            LOGGER.warning(f"Ignoring unreadable zip listing cache: {self.path}")
+            self.listings = {}
+        return self
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        dump(
+            self.path,
+            {digest: listing.as_dict() for digest, listing in self.listings.items()},
+        )
+        self.dirty = False
+
+    def get(self, digest: str) -> ZipListing | None:
+        """Return the cached listing of an asset."""
+        return self.listings.get(digest)
+
+    def put(self, digest: str, listing: ZipListing) -> None:
+        """Store the listing of an asset."""
+        self.listings[digest] = listing
+        self.dirty = True
+
+
+class ZipInspector:
+    """Fetch zip listings over a shared session, cached by asset digest."""
+
+    def __init__(self, session: aiohttp.ClientSession, cache: ZipListingCache) -> None:
+        """Initialize the inspector."""
+        self.session = session
+        self.cache = cache
+
+    @classmethod
+    def from_env(cls, session: aiohttp.ClientSession) -> Self | None:
+        """Create an inspector, or None when `ZIP_INSPECTION` is set to 0."""
+        if os.getenv("ZIP_INSPECTION", "1") == "0":
+            return None
+        return cls(session, ZipListingCache.from_env().load())
+
+    async def inspect(self, url: str, size: int, digest: str | None) -> ZipListing:
+        """Return the listing of a zip asset.
+
+        Args:
+        ----
+            url: Download URL of the asset.
+            size: Size of the asset in bytes.
+            digest: SHA-256 digest of the asset; listings without one are not
+                cached.
+
+        Returns:
+        -------
+            ZipListing: Summary of the zip's entries.
+
+        """
+        cached = self.cache.get(digest) if digest else None
+        if cached is not None:
+            return cached
+        listing = await fetch_zip_listing(self.session, url, size)
+        if digest:
+            self.cache.put(digest, listing)
+        return listing
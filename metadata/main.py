@@ -1,9 +1,94 @@
-"""Main entry point for the metadata generation process."""
+"""Main entry point for the metadata generation process.
 
-import asyncio
+Usage, with the shared helpers of `scripts/` on the path:
+    export PYTHONPATH=scripts
+    uv run python metadata/main.py                  # all plugins in one run
+    uv run python metadata/main.py --shard 0/4      # one of four shards
+    uv run python metadata/main.py merge            # combine the shards
+    uv run python metadata/main.py --repo owner/name  # refresh one plugin
 
-from const import GITHUB_TOKEN, OUTPUT_DIR, PLUGIN_LIST_FILE
+Except for a shard, the run writes `changed=true|false` to `GITHUB_OUTPUT`, so
+the workflow can skip publishing when nothing changed.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import const
+from bootstrap import bootstrap
 from summary_generator import SummaryGenerator
+from transport import run
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse an `i/N` shard argument."""
+    try:
+        shard, shards = (int(part) for part in value.split("/"))
+    except ValueError:
+        msg = f"expected i/N, got '{value}'"
+        raise argparse.ArgumentTypeError(msg) from None
+    if not 0 <= shard < shards:
+        msg = f"shard index must be between 0 and {shards - 1}"
+        raise argparse.ArgumentTypeError(msg)
+    return shard, shards
+
+
+def write_github_output(*, changed: bool) -> None:
+    """Tell the workflow whether the outputs changed since the previous run."""
+    github_output = os.environ.get("GITHUB_OUTPUT")
+    if github_output:
+        with Path(github_output).open("a", encoding="utf-8") as ghf:
+            print(f"changed={str(changed).lower()}", file=ghf)
+    if not changed:
+        const.LOGGER.info("💤 Nothing changed since the previous run")
+
+
+def main() -> None:
+    """Generate metadata for all plugins, one shard or one plugin, or merge."""
+    bootstrap()
+    parser = argparse.ArgumentParser(description="Generate plugin metadata.")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["generate", "merge"],
+        default="generate",
+        help="Generate metadata (default) or merge the shard results",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Only process shard i of N (e.g. 0/4); results go to --shard-dir",
+    )
+    parser.add_argument("--shard-dir", default=const.SHARD_DIR)
+    parser.add_argument(
+        "--repo",
+        help="Only refresh this plugin and patch it into the existing outputs",
+    )
+    args = parser.parse_args()
+    if args.repo and (args.shard or args.command == "merge"):
+        parser.error("--repo cannot be combined with --shard or merge")
+
+    generator = SummaryGenerator(const.PLUGIN_LIST_FILE, const.OUTPUT_DIR)
+    if args.command == "merge":
+        try:
+            generator.merge(args.shard_dir)
+        except ValueError as err:
+            parser.exit(1, f"{err}\n")
+    elif args.repo:
+        try:
+            refreshed = run(generator.refresh(const.GITHUB_TOKEN, args.repo))
+        except ValueError as err:
+            parser.exit(1, f"{err}\n")
+        if not refreshed:
+            parser.exit(1)
+    elif args.shard:
+        run(generator.generate_shard(const.GITHUB_TOKEN, *args.shard, args.shard_dir))
+        return
+    else:
+        run(generator.generate(const.GITHUB_TOKEN))
+    write_github_output(changed=generator.changed)
+
 
 if __name__ == "__main__":
-    asyncio.run(SummaryGenerator(PLUGIN_LIST_FILE, OUTPUT_DIR).generate(GITHUB_TOKEN))
+    main()
@@ -1,55 +1,88 @@
 """Generate metadata for each RotorHazard community plugin."""
 
 import base64
-import json
 import logging
 from datetime import UTC, datetime
-from typing import Any
 
+import aiohttp
 from aiogithubapi import (
     GitHubAPI,
     GitHubException,
     GitHubNotFoundException,
     GitHubRatelimitException,
 )
-from const import EXCLUDED_KEYS
+from const import EXCLUDED_KEYS, MAX_RELEASES
 from generator import (
+    AssetRecord,
     PluginLogBuffer,
+    PluginRecord,
+    ReleaseAssetInfo,
+    ReleaseInfo,
+    ReleaseRecord,
+    ZipInspector,
+    ZipListingError,
     get_release_asset_info,
+    parse_releases,
     validate_manifest_domain,
     validate_manifest_version,
 )
+from release_selection import ReleaseIndex
+from schema_validation import get_validator
+from serialization import JSONDecodeError, loads
+from transport import is_transient
 
 
 class PluginMetadataGenerator:
     """Generate metadata for each RotorHazard community plugin."""
 
-    def __init__(self, repo: str) -> None:
-        """Initialize the plugin metadata generator."""
+    def __init__(self, repo: str, zip_inspector: ZipInspector | None = None) -> None:
+        """Initialize the plugin metadata generator.
+
+        Args:
+        ----
+            repo: Full repository name (e.g., "owner/repo_name").
+            zip_inspector: Reads the central directory of the plugin zip of
+                `used_ref`; the zip is not inspected when omitted.
+
+        """
         self.repo = repo  # Full repository name (e.g., "owner/repo_name")
         self.original_repo = repo  # Store the original repository name
         self.domain = None  # Plugin domain folder
-        self.metadata = {}
+        self.metadata: PluginRecord | None = None
         self.manifest_data = {}
         self.repo_metadata = {}
         self.etag_repository = None
         self.etag_release = None
-        self.releases = []
+        self.release_index = ReleaseIndex([], keep=MAX_RELEASES)
+        self.zip_inspector = zip_inspector
         self.logger = PluginLogBuffer(repo)
+        # Set when the last failure was a network error, timeout, rate limit
+        # or server error rather than a problem with the plugin itself
+        self.transient_failure = False
 
-    def log(self, message: str, level: int = logging.INFO) -> None:
-        """Log a message with the specified level, buffering it for later."""
-        self.logger.log(level, message)
+    def log(self, message: str, *args: object, level: int = logging.INFO) -> None:
+        """Buffer a %-style message with the specified level for later."""
+        self.logger.log(level, message, *args)
+
+    @property
+    def releases(self) -> list[ReleaseInfo]:
+        """Return the kept releases, newest first."""
+        return self.release_index.releases
+
+    @releases.setter
+    def releases(self, releases: list[ReleaseInfo]) -> None:
+        """Index the releases (newest first) once for all later lookups."""
+        self.release_index = ReleaseIndex(releases, keep=MAX_RELEASES)
 
     @property
     def latest_stable(self) -> str | None:
         """Return the latest stable release."""
-        return next((r.tag_name for r in self.releases if not r.prerelease), None)
+        return self.release_index.stable_tag
 
     @property
     def latest_prerelease(self) -> str | None:
         """Return the latest pre-release."""
-        return next((r.tag_name for r in self.releases if r.prerelease), None)
+        return self.release_index.prerelease_tag
 
     @property
     def used_ref(self) -> str:
@@ -58,11 +91,7 @@ class PluginMetadataGenerator:
         Prefer the latest stable release; only fall back to a prerelease if no
         stable release exists.
         """
-        return (
-            self.latest_stable
-            or self.latest_prerelease
-            or self.repo_metadata.default_branch
-        )
+        return self.release_index.used_ref or self.repo_metadata.default_branch
 
     async def fetch_repository_info(self, github: GitHubAPI) -> bool:
         """Fetch and store repository metadata from GitHub.
@@ -82,15 +111,18 @@ class PluginMetadataGenerator:
             self.repo = repo_response.data.full_name
             self.repo_metadata = repo_response.data
         except GitHubRatelimitException:
+            self.transient_failure = True
             self.log(
-                "GitHub API rate limit exceeded. Please retry later.", logging.ERROR
+                "GitHub API rate limit exceeded. Please retry later.",
+                level=logging.ERROR,
             )
             return False
         except GitHubNotFoundException:
-            self.log("Repository not found on GitHub.", logging.ERROR)
+            self.log("Repository not found on GitHub.", level=logging.ERROR)
             return False
-        except GitHubException:
-            self.log("Failed to retrieve repository information.", logging.ERROR)
+        except GitHubException as err:
+            self.transient_failure = is_transient(err)
+            self.log("Failed to retrieve repository information.", level=logging.ERROR)
             return False
         self.etag_repository = repo_response.etag
         return True
@@ -109,26 +141,29 @@ class PluginMetadataGenerator:
         """
         self.log("🔎 Fetching GitHub releases...")
         try:
-            releases = await github.repos.releases.list(self.repo)
+            # Use the raw payload, only the newest releases are parsed and kept
+            releases = await github.generic(f"/repos/{self.repo}/releases")
             if releases.etag:
                 self.etag_release = releases.etag
             if not releases.data:
-                self.log("No releases found.", logging.WARNING)
+                self.log("No releases found.", level=logging.WARNING)
                 return False
 
-            # Ensure releases are sorted by creation date (newest first)
-            self.releases = sorted(
-                releases.data, key=lambda r: r.created_at, reverse=True
-            )
-        except GitHubException:
-            self.log("Error occurred while fetching releases.", logging.ERROR)
+            self.releases = parse_releases(releases.data, keep=MAX_RELEASES)
+        except GitHubException as err:
+            self.transient_failure = is_transient(err)
+            self.log("Error occurred while fetching releases.", level=logging.ERROR)
             return False
 
         # Log the latest stable and prerelease versions
-        message = f"ℹ️  Latest stable release: {self.latest_stable}"  # noqa: RUF001
         if self.latest_prerelease:
-            message += f", Latest pre-release: {self.latest_prerelease}"
-        self.log(message)
+            self.log(
+                "ℹ️  Latest stable release: %s, Latest pre-release: %s",  # noqa: RUF001
+                self.latest_stable,
+                self.latest_prerelease,
+            )
+        else:
+            self.log("ℹ️  Latest stable release: %s", self.latest_stable)  # noqa: RUF001
         return True
 
     async def fetch_manifest_file(self, github: GitHubAPI) -> bool:
@@ -141,23 +176,35 @@ class PluginMetadataGenerator:
         Returns:
         -------
             bool: True if the manifest file is fetched successfully, False otherwise.
+            Problems found by the manifest schema are logged as warnings.
 
         """
         manifest_path = f"custom_plugins/{self.domain}/manifest.json"
-        self.log(f"🔎 Fetching plugin domain folder (branch: {self.used_ref})")
+        self.log("🔎 Fetching plugin domain folder (branch: %s)", self.used_ref)
         try:
             response = await github.repos.contents.get(
                 self.repo, f"{manifest_path}?ref={self.used_ref}"
             )
-            content = base64.b64decode(response.data.content).decode("utf-8")
-            self.manifest_data = json.loads(content)
-            self.log(f"✅ Successfully fetched manifest.json (branch: {self.used_ref})")
-        except (GitHubNotFoundException, json.JSONDecodeError, GitHubException):
+            content = base64.b64decode(response.data.content)
+            self.manifest_data = loads(content)
+            self.log(
+                "✅ Successfully fetched manifest.json (branch: %s)",
+                self.used_ref,
+            )
+        except (GitHubNotFoundException, JSONDecodeError, GitHubException) as err:
+            self.transient_failure = is_transient(err)
             self.log(
-                f"Failed to fetch `{manifest_path}` from {self.used_ref}.",
-                logging.ERROR,
+                "Failed to fetch `%s` from %s.",
+                manifest_path,
+                self.used_ref,
+                level=logging.ERROR,
             )
             return False
+
+        # Only a warning until the schema has been checked against every plugin
+        errors = get_validator("manifest").validate_bytes(content, self.manifest_data)
+        for error in errors:
+            self.log("Invalid `%s`: %s", manifest_path, error, level=logging.WARNING)
         return True
 
     async def validate_plugin_repository(self, github: GitHubAPI) -> bool:
@@ -173,7 +220,10 @@ class PluginMetadataGenerator:
 
         """
         try:
-            self.log(f"🔎 Fetching plugin domain folder (branch: {self.used_ref})")
+            self.log(
+                "🔎 Fetching plugin domain folder (branch: %s)",
+                self.used_ref,
+            )
             response = await github.repos.contents.get(
                 self.repo, f"?ref={self.used_ref}"
             )
@@ -188,7 +238,7 @@ class PluginMetadataGenerator:
                 None,
             )
             if not custom_plugins_folder:
-                self.log("Missing `custom_plugins/` folder.", logging.ERROR)
+                self.log("Missing `custom_plugins/` folder.", level=logging.ERROR)
                 return False
 
             # Fetch the contens of the `custom_plugins/` folder
@@ -200,20 +250,25 @@ class PluginMetadataGenerator:
             # Ensure there is exactly one domain folder
             if len(subfolders) != 1:
                 self.log(
-                    "Expected one domain folder in "
-                    f"`custom_plugins/`, found: {len(subfolders)}.",
-                    logging.ERROR,
+                    "Expected one domain folder in `custom_plugins/`, found: %d.",
+                    len(subfolders),
+                    level=logging.ERROR,
                 )
                 return False
 
             self.domain = subfolders[0].name
         except GitHubNotFoundException:
-            self.log("Repository not found.", logging.WARNING)
+            self.log("Repository not found.", level=logging.WARNING)
             return False
-        except GitHubException:
-            self.log("Error fetching plugin domain.", logging.ERROR)
+        except GitHubException as err:
+            self.transient_failure = is_transient(err)
+            self.log("Error fetching plugin domain.", level=logging.ERROR)
             return False
-        self.log(f"ℹ️  Plugin domain folder: `{self.domain}` (branch: {self.used_ref})")  # noqa: RUF001
+        self.log(
+            "ℹ️  Plugin domain folder: `%s` (branch: %s)",  # noqa: RUF001
+            self.domain,
+            self.used_ref,
+        )
         return True
 
     async def fetch_metadata(self, github: GitHubAPI) -> dict | None:  # noqa: PLR0911
@@ -232,14 +287,16 @@ class PluginMetadataGenerator:
         try:
             repo_fetched = await self.fetch_repository_info(github)
             if not repo_fetched:
-                self.log("Skipping due to missing repository data.", logging.ERROR)
+                self.log(
+                    "Skipping due to missing repository data.", level=logging.ERROR
+                )
                 return None
 
             # Check if the repository is archived
             if self.repo_metadata.archived:
                 self.log(
                     "Repository is archived. Skipping metadata generation.",
-                    logging.WARNING,
+                    level=logging.WARNING,
                 )
                 return {self.repo: {"archived": True}}
 
@@ -247,8 +304,10 @@ class PluginMetadataGenerator:
             full_name = self.repo_metadata.full_name
             if full_name != self.original_repo:
                 self.log(
-                    f"Repository renamed from '{self.original_repo}' to '{full_name}'",
-                    logging.WARNING,
+                    "Repository renamed from '%s' to '%s'",
+                    self.original_repo,
+                    full_name,
+                    level=logging.WARNING,
                 )
 
             # Fetch plugin domain and validate repository structure
@@ -271,66 +330,51 @@ class PluginMetadataGenerator:
             ):
                 return None
 
-            self.metadata = {
-                "etag_release": self.etag_release,
-                "etag_repository": self.etag_repository,
-                "last_fetched": datetime.now(UTC).isoformat(),
-                "last_updated": self.repo_metadata.updated_at,
-                "last_version": self.latest_stable,
-                "open_issues": self.repo_metadata.open_issues_count,
-                "repository": self.repo,
-                "stargazers_count": self.repo_metadata.stargazers_count,
-                "watchers_count": self.repo_metadata.watchers_count,
-                "forks_count": self.repo_metadata.forks_count,
-                "topics": self.repo_metadata.topics,
-                "used_ref": self.used_ref,
-            }
-
-            # Add releases metadata
-            self.metadata = {
-                "releases": await self._build_releases_metadata(github),
-                **self.metadata,
-            }
-
-            # Add prerelease version if available
-            if self.latest_prerelease:
-                self.metadata["last_prerelease"] = self.latest_prerelease
-            self.metadata = dict(sorted(self.metadata.items()))
-
-            # Add manifest-specific metadata
-            self.metadata = {
-                "manifest": {
-                    **{
-                        key: value
-                        for key, value in self.manifest_data.items()
-                        if key not in EXCLUDED_KEYS
-                    },
+            self.metadata = PluginRecord(
+                manifest={
+                    key: value
+                    for key, value in self.manifest_data.items()
+                    if key not in EXCLUDED_KEYS
                 },
-                **self.metadata,
-            }
-        except GitHubException:
-            self.log("An error occurred during metadata generation.", logging.ERROR)
+                etag_release=self.etag_release,
+                etag_repository=self.etag_repository,
+                forks_count=self.repo_metadata.forks_count,
+                last_fetched=datetime.now(UTC).isoformat(),
+                last_prerelease=self.latest_prerelease,
+                last_updated=self.repo_metadata.updated_at,
+                last_version=self.latest_stable,
+                open_issues=self.repo_metadata.open_issues_count,
+                releases=await self._build_releases_metadata(github),
+                repository=self.repo,
+                stargazers_count=self.repo_metadata.stargazers_count,
+                topics=self.repo_metadata.topics,
+                used_ref=self.used_ref,
+                watchers_count=self.repo_metadata.watchers_count,
+            )
+        except GitHubException as err:
+            self.transient_failure = is_transient(err)
+            self.log(
+                "An error occurred during metadata generation.", level=logging.ERROR
+            )
             return None
 
         self.log("🎉 Metadata successfully generated.")
-        return {self.repo_metadata.id: self.metadata}
+        return {self.repo_metadata.id: self.metadata.as_dict()}
 
-    async def _build_releases_metadata(self, github: GitHubAPI) -> list[dict[str, Any]]:
+    async def _build_releases_metadata(self, github: GitHubAPI) -> list[ReleaseRecord]:
         """Build metadata for the latest releases, including asset digests."""
-        releases_metadata: list[dict[str, Any]] = []
+        releases_metadata: list[ReleaseRecord] = []
         zip_filename = self.manifest_data.get("zip_filename")
-        for release in self.releases[:5]:
-            release_entry: dict[str, Any] = {
-                "tag_name": release.tag_name,
-                "published_at": release.published_at,
-                "prerelease": release.prerelease,
-            }
-
-            assets: list[dict[str, Any]] = []
+        for release in self.release_index.newest:
+            release_entry = ReleaseRecord(
+                tag_name=release.tag_name,
+                published_at=release.published_at,
+                prerelease=release.prerelease,
+            )
             seen_assets: set[str] = set()
 
-            for asset in getattr(release, "assets", []):
-                asset_name = getattr(asset, "name", None)
+            for asset in release.assets:
+                asset_name = asset.name
                 if not asset_name or asset_name in seen_assets:
                     continue
 
@@ -339,10 +383,9 @@ class PluginMetadataGenerator:
                     github, release, asset_name, self.logger
                 )
                 if asset_info:
-                    assets.append(asset_info)
-
-            if assets:
-                release_entry["assets"] = assets
+                    if asset_name == zip_filename and release.tag_name == self.used_ref:
+                        await self._inspect_zip(asset, asset_info)
+                    release_entry.assets.append(asset_info)
 
             if (
                 zip_filename
@@ -350,12 +393,36 @@ class PluginMetadataGenerator:
                 and release.tag_name == self.used_ref
             ):
                 self.log(
-                    "Manifest `zip_filename` "
-                    f"'{zip_filename}' was not found in release "
-                    f"{release.tag_name}.",
-                    logging.WARNING,
+                    "Manifest `zip_filename` '%s' was not found in release %s.",
+                    zip_filename,
+                    release.tag_name,
+                    level=logging.WARNING,
                 )
 
             releases_metadata.append(release_entry)
 
         return releases_metadata
+
+    async def _inspect_zip(self, asset: ReleaseAssetInfo, record: AssetRecord) -> None:
+        """Record the footprint of the plugin zip and check it has the manifest."""
+        if not self.zip_inspector or not asset.browser_download_url or not asset.size:
+            return
+        try:
+            listing = await self.zip_inspector.inspect(
+                asset.browser_download_url, asset.size, record.sha256
+            )
+        except (ZipListingError, aiohttp.ClientError, TimeoutError) as err:
+            self.log(
+                "Unable to inspect '%s': %s", asset.name, err, level=logging.WARNING
+            )
+            return
+
+        record.file_count = listing.file_count
+        record.uncompressed_size = listing.uncompressed_size
+        if not listing.has_manifest(self.domain):
+            self.log(
+                "'%s' does not contain `custom_plugins/%s/manifest.json`.",
+                asset.name,
+                self.domain,
+                level=logging.WARNING,
+            )
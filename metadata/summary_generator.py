@@ -1,29 +1,81 @@
 """Generates a summary of the plugin metadata."""
 
 import asyncio
-import json
+import hashlib
+import logging
+from datetime import UTC, datetime
 from pathlib import Path
-from time import perf_counter
+from time import perf_counter, time
 
-from aiogithubapi import GitHubAPI
-from const import LOGGER
+import const
+from aiogithubapi import GitHubAPI, GitHubException
+from const import (
+    COMPARE_IGNORE,
+    FINGERPRINTS_FILE,
+    FIXED_OUTPUT_FILES,
+    HASHES_FILE,
+    LOGGER,
+    POINTER_FILE,
+    PREVIOUS_DATA_FILE,
+    PREVIOUS_FINGERPRINTS_FILE,
+    TRENDING_FILE,
+    VOLATILE_KEYS,
+)
+from generator import (
+    CheckpointJournal,
+    MetricsStore,
+    PluginLogSink,
+    RefreshSchedule,
+    ZipInspector,
+    changed_files,
+    content_digest,
+    encode_json,
+    entry_digests,
+    file_digests,
+    sample_from_metadata,
+    strip_volatile_keys,
+    write_hashed_files,
+)
 from plugin_metadata_generator import PluginMetadataGenerator
+from repo_identity import RepoIdentityCache
+from request_policy import RequestPolicy
+from serialization import dump, load
+from transport import github_client, shared_session
 
-COMPARE_IGNORE = ["last_fetched", "etag_release", "etag_repository"]
+
+def shard_of(repo: str, shards: int) -> int:
+    """Return the shard a repository belongs to.
+
+    The hash of the lower-cased name is stable across runs and machines, so
+    adding or removing a plugin never moves the others to another shard.
+    """
+    digest = hashlib.sha256(repo.lower().encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
 
 
 class SummaryData:
     """Summary data for metadata generation."""
 
-    def __init__(
-        self, total: int, valid: int, archived: int, renamed: int, skipped: int
+    def __init__(  # noqa: PLR0913
+        self,
+        total: int,
+        valid: int,
+        archived: int,
+        renamed: int,
+        skipped: int,
+        stale: int = 0,
     ) -> None:
-        """Initialize the summary data."""
+        """Initialize the summary data.
+
+        Stale plugins are published with their previous entry after a
+        transient failure; they are also counted as valid.
+        """
         self.total = total
         self.valid = valid
         self.archived = archived
         self.renamed = renamed
         self.skipped = skipped
+        self.stale = stale
 
 
 class SummaryGenerator:
@@ -34,6 +86,12 @@ class SummaryGenerator:
         self.plugin_file = Path(plugin_file)
         self.output_dir = output_dir
         self.repos_list = self.load_repos()
+        # Previous results of plugins that are not due, by plugins.json name
+        self.carried: dict[str, dict] = {}
+        self._previous: dict[str, dict] | None = None
+        self.plugin_deadline = RequestPolicy.from_env().plugin_deadline
+        # Whether the last saved outputs differ from the previous run's
+        self.changed = True
 
     def load_repos(self) -> list[str]:
         """Load repository list from the plugin file.
@@ -44,11 +102,9 @@ class SummaryGenerator:
 
         """
         if self.plugin_file.exists():
-            with Path.open(self.plugin_file, encoding="utf-8") as f:
-                return json.load(f)
-        else:
-            LOGGER.warning("Plugin list file not found. Using an empty list.")
-            return []
+            return load(self.plugin_file)
+        LOGGER.warning("Plugin list file not found. Using an empty list.")
+        return []
 
     def save_filtered_json(self, filepath: str, data: dict) -> None:
         """Save data to a JSON file with filtered keys.
@@ -63,8 +119,7 @@ class SummaryGenerator:
             key: {k: v for k, v in value.items() if k not in COMPARE_IGNORE}
             for key, value in data.items()
         }
-        with Path.open(filepath, "w", encoding="utf-8") as f:
-            json.dump(filtered_data, f, indent=2)
+        dump(filepath, filtered_data)
 
     def save_json(self, filepath: str, data: dict) -> None:
         """Save data to a JSON file.
@@ -75,8 +130,139 @@ class SummaryGenerator:
             data: Data to be saved.
 
         """
-        with Path.open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        dump(filepath, data)
+
+    def save_hashed_outputs(
+        self, plugin_data: dict, valid_repositories: list[str]
+    ) -> None:
+        """Save content-hashed copies of the outputs and the pointer manifest.
+
+        The hashed files never change once written, so they can be cached
+        forever. Volatile fields are dropped so an unchanged registry produces
+        the same filenames (and an unchanged pointer) on every run.
+
+        Args:
+        ----
+            plugin_data: Generated metadata for all plugins.
+            valid_repositories: List of valid repository names.
+
+        """
+        pointers = write_hashed_files(
+            self.output_dir,
+            {
+                "data.json": strip_volatile_keys(plugin_data, VOLATILE_KEYS),
+                "repositories.json": valid_repositories,
+            },
+        )
+        self.save_json(f"{self.output_dir}/{POINTER_FILE}", pointers)
+
+    def save_trending(self, plugin_data: dict) -> None:
+        """Append this run to the metric history and save the trending list.
+
+        Args:
+        ----
+            plugin_data: Generated metadata for all plugins.
+
+        """
+        now = int(datetime.now(UTC).timestamp())
+        store = MetricsStore.from_env().load()
+        store.append_run(
+            now,
+            {
+                repo_id: sample_from_metadata(metadata)
+                for repo_id, metadata in plugin_data.items()
+            },
+        )
+        # The store keys plugins by the repository id as a string
+        names = {
+            str(repo_id): metadata["repository"]
+            for repo_id, metadata in plugin_data.items()
+        }
+        trending = [
+            {"repository": names[repo_id], **growth}
+            for repo_id, growth in store.trending(now).items()
+            if repo_id in names
+        ]
+        self.save_json(f"{self.output_dir}/{TRENDING_FILE}", trending)
+
+    def data_digest(self, plugin_data: dict) -> str:
+        """Return the digest of `data.json` without its volatile fields."""
+        return content_digest(
+            encode_json(strip_volatile_keys(plugin_data, VOLATILE_KEYS))
+        )
+
+    def save_purge_list(self, plugin_data: dict) -> None:
+        """Save the public URLs whose content changed since the previous run.
+
+        Digests of the fixed-name files are compared with the digests of the
+        previous run (`diff/hashes_before.json`). `data.json` is digested
+        without its volatile fields, so a run that only refetched the same
+        data does not purge it. Without a previous run every file counts as
+        changed.
+
+        Args:
+        ----
+            plugin_data: Generated metadata for all plugins.
+
+        """
+        digests = file_digests(self.output_dir, FIXED_OUTPUT_FILES)
+        digests["data.json"] = self.data_digest(plugin_data)
+        before_file = Path(f"{self.output_dir}/diff/hashes_before.json")
+        previous: dict[str, str] = {}
+        if before_file.exists():
+            previous = load(before_file)
+
+        urls = [
+            f"{const.PUBLIC_BASE_URL}/{filename}"
+            for filename in changed_files(previous, digests)
+        ]
+        self.save_json(f"{self.output_dir}/{HASHES_FILE}", digests)
+        self.save_json(f"{self.output_dir}/diff/purge.json", urls)
+        LOGGER.info(f"🧹 {len(urls)} URL(s) changed since the previous run")
+
+    def save_fingerprints(
+        self, plugin_data: dict, valid_repositories: list[str]
+    ) -> bool:
+        """Save the fingerprint manifest and compare it with the previous run's.
+
+        The manifest holds a digest of every plugin entry, `data.json` and
+        `repositories.json`, without volatile fields such as `last_fetched`.
+        `trending.json` is left out: its window slides with every run, so it
+        would change the manifest almost every time. It is published along
+        with the next change instead. Without a previous manifest
+        (`diff/fingerprints_before.json`) everything counts as changed.
+
+        Args:
+        ----
+            plugin_data: Generated metadata for all plugins.
+            valid_repositories: List of valid repository names.
+
+        Returns:
+        -------
+            bool: Whether anything changed since the previous run.
+
+        """
+        manifest = {
+            "plugins": entry_digests(plugin_data, VOLATILE_KEYS),
+            "files": {
+                "data.json": self.data_digest(plugin_data),
+                "repositories.json": content_digest(encode_json(valid_repositories)),
+            },
+        }
+        self.save_json(f"{self.output_dir}/{FINGERPRINTS_FILE}", manifest)
+
+        before_file = Path(f"{self.output_dir}/{PREVIOUS_FINGERPRINTS_FILE}")
+        if not before_file.exists():
+            return True
+        previous = load(before_file)
+        plugins = changed_files(previous.get("plugins", {}), manifest["plugins"])
+        removed = previous.get("plugins", {}).keys() - manifest["plugins"].keys()
+        files = changed_files(previous.get("files", {}), manifest["files"])
+        LOGGER.info(
+            f"🧬 {len(plugins) + len(removed)} plugin(s) and {len(files)} file(s) "
+            "changed since the previous run"
+        )
+        return manifest != previous
 
     async def summarize_results(
         self,
@@ -93,36 +279,133 @@ class SummaryGenerator:
 
         """
         end_time = perf_counter()
-        elapsed_time = end_time - start_time
+        self.save_summary(summary_data, end_time - start_time)
+
+    def save_summary(self, summary_data: SummaryData, elapsed_time: float) -> None:
+        """Save `summary.json`.
+
+        Args:
+        ----
+            summary_data: An instance of SummaryData containing summary data.
+            elapsed_time: Wall time of the generation in seconds.
+
+        """
         summary = {
             "total_plugins": summary_data.total,
             "valid_plugins": summary_data.valid,
             "archived_plugins": summary_data.archived,
             "renamed_plugins": summary_data.renamed,
             "skipped_plugins": summary_data.skipped,
+            "stale_plugins": summary_data.stale,
             "execution_time_seconds": round(elapsed_time, 2),
         }
         summary_path = f"{self.output_dir}/summary.json"
         self.save_json(summary_path, summary)
 
-    async def generate(self, github_token: str) -> None:
-        """Generate metadata for all repositories."""
+    async def fetch_with_checkpoint(
+        self,
+        generator: PluginMetadataGenerator,
+        github: GitHubAPI,
+        journal: CheckpointJournal,
+    ) -> dict | None:
+        """Fetch a plugin's metadata, reusing a fresh result from the journal.
+
+        Args:
+        ----
+            generator: The plugin's metadata generator.
+            github: GitHubAPI instance.
+            journal: Checkpoint journal of the current and interrupted runs.
+
+        Returns:
+        -------
+            dict | None: The plugin's result, or None if it was skipped.
+
+        """
+        carried = self.carried.get(generator.original_repo)
+        if carried is not None:
+            generator.repo = next(iter(carried.values()))["repository"]
+            generator.log("⏭️ Not due for a refresh, reusing the previous result.")
+            return carried
+
+        entry = journal.get(generator.original_repo)
+        if entry is not None:
+            generator.repo = entry["repository"]
+            generator.log("♻️ Reusing result from an interrupted run.")
+            return entry["result"]
+
+        deadline = asyncio.timeout(self.plugin_deadline)
+        timed_out = False
+        try:
+            async with deadline:
+                result = await generator.fetch_metadata(github)
+        except TimeoutError:
+            timed_out = True
+        except GitHubException:
+            if not deadline.expired():
+                raise
+        # aiogithubapi turns the cancellation into a GitHubConnectionException,
+        # which is usually handled inside fetch_metadata like any other error
+        if timed_out or deadline.expired():
+            # A stalled plugin must not hold up the whole run
+            generator.transient_failure = True
+            generator.log(
+                "Gave up after %s seconds.", self.plugin_deadline, level=logging.ERROR
+            )
+            return None
+        if result:
+            journal.record(generator.original_repo, generator.repo, result)
+        return result
+
+    async def collect(
+        self, github_token: str, journal: CheckpointJournal
+    ) -> tuple[dict[str, dict], list[str], dict[str, str], SummaryData]:
+        """Fetch the metadata of every listed repository.
+
+        Args:
+        ----
+            github_token: GitHub token for API access.
+            journal: Checkpoint journal of the current and interrupted runs.
+
+        Returns:
+        -------
+            tuple: Metadata per repository id, valid repository names, the
+            plugins.json name of every valid repository id, and the counts.
+
+        """
         plugin_data: dict[str, dict] = {}
         valid_repositories: list[str] = []
+        listed_as: dict[str, str] = {}
         skipped_plugins = 0
         archived_plugins = 0
         renamed_plugins = 0
+        stale_plugins = 0
 
-        start_time = perf_counter()
+        identities = RepoIdentityCache.from_env().load()
+        if journal.entries:
+            LOGGER.info(f"♻️ Resuming with {len(journal.entries)} checkpointed plugins")
+
+        log_sink = PluginLogSink.from_env()
+        async with (
+            shared_session() as session,
+            github_client(github_token) as github,
+        ):
+            zip_inspector = ZipInspector.from_env(session)
+            generators = [
+                PluginMetadataGenerator(repo, zip_inspector) for repo in self.repos_list
+            ]
+            with journal:
+                tasks = [
+                    self.fetch_with_checkpoint(g, github, journal) for g in generators
+                ]
+                results = await asyncio.gather(*tasks)
 
-        async with GitHubAPI(token=github_token) as github:
-            generators = [PluginMetadataGenerator(repo) for repo in self.repos_list]
-            tasks = [g.fetch_metadata(github) for g in generators]
-            results = await asyncio.gather(*tasks)
+            for generator, fetched in zip(generators, results, strict=False):
+                result = fetched
+                if not result and generator.transient_failure:
+                    result = self.stale_entry(generator, identities)
 
-            for generator, result in zip(generators, results, strict=False):
                 # Flush plugin logs (grouped)
-                generator.logger.flush()
+                generator.logger.flush(log_sink)
 
                 # Check if the repository has been renamed
                 # This works even if the plugin is skipped
@@ -138,20 +421,382 @@ class SummaryGenerator:
                     archived_plugins += 1
                     continue
 
+                if "stale_since" in metadata:
+                    stale_plugins += 1
                 plugin_data[repo_id] = metadata
                 valid_repositories.append(metadata.get("repository"))
+                listed_as[str(repo_id)] = generator.original_repo
+                identities.record(repo_id, generator.repo, generator.original_repo)
 
-        # Save generated metadata to local JSON files
-        self.save_filtered_json(f"{self.output_dir}/diff/after.json", plugin_data)
-        self.save_json(f"{self.output_dir}/data.json", plugin_data)
-        self.save_json(f"{self.output_dir}/repositories.json", valid_repositories)
+        if log_sink:
+            log_sink.close()
+        identities.save()
+        if zip_inspector:
+            zip_inspector.cache.save()
 
-        # Generate and save summary data
         summary_data = SummaryData(
             total=len(self.repos_list),
             valid=len(valid_repositories),
             archived=archived_plugins,
             renamed=renamed_plugins,
             skipped=skipped_plugins,
+            stale=stale_plugins,
+        )
+        return plugin_data, valid_repositories, listed_as, summary_data
+
+    def previous_data(self) -> dict[str, dict]:
+        """Return the previous run's `data.json`, or an empty dict without one."""
+        if self._previous is None:
+            previous_file = Path(f"{self.output_dir}/{PREVIOUS_DATA_FILE}")
+            self._previous = load(previous_file) if previous_file.exists() else {}
+        return self._previous
+
+    def stale_entry(
+        self, generator: PluginMetadataGenerator, identities: RepoIdentityCache
+    ) -> dict | None:
+        """Return the previous entry of a plugin whose fetch failed transiently.
+
+        The entry is marked with `stale_since`, the time of the first failed
+        refresh, so clients can tell it apart from fresh data.
+
+        Args:
+        ----
+            generator: The plugin's metadata generator.
+            identities: Repository identity cache, to follow renames.
+
+        Returns:
+        -------
+            dict | None: The plugin's previous result, keyed by repository id,
+            or None if the previous run did not publish it.
+
+        """
+        previous = self.previous_data()
+        listed = generator.original_repo.lower()
+        known = identities.names.get(listed)
+        candidates = [known[0]] if known else []
+        candidates += [
+            key
+            for key, entry in previous.items()
+            if entry.get("repository", "").lower() == listed
+        ]
+        key = next((key for key in candidates if key in previous), None)
+        if key is None:
+            return None
+        metadata = {**previous[key]}
+        metadata.setdefault("stale_since", datetime.now(UTC).isoformat())
+        generator.repo = metadata["repository"]
+        generator.log(
+            "♻️ Publishing the previous entry after a transient failure.",
+            level=logging.WARNING,
+        )
+        return {int(key): metadata}
+
+    def save_outputs(
+        self,
+        plugin_data: dict,
+        valid_repositories: list[str],
+        *,
+        update_trending: bool = True,
+    ) -> None:
+        """Save the generated metadata and everything derived from it.
+
+        Afterwards `changed` tells whether the outputs differ from the
+        previous run's.
+
+        Args:
+        ----
+            plugin_data: Generated metadata for all plugins.
+            valid_repositories: List of valid repository names.
+            update_trending: Append the run to the metric history and save
+                the trending list; a single-plugin refresh leaves both as is.
+
+        """
+        Path(f"{self.output_dir}/diff").mkdir(parents=True, exist_ok=True)
+        self.save_filtered_json(f"{self.output_dir}/diff/after.json", plugin_data)
+        self.save_json(f"{self.output_dir}/data.json", plugin_data)
+        self.save_json(f"{self.output_dir}/repositories.json", valid_repositories)
+        self.save_hashed_outputs(plugin_data, valid_repositories)
+        if update_trending:
+            self.save_trending(plugin_data)
+        self.save_purge_list(plugin_data)
+        self.changed = self.save_fingerprints(plugin_data, valid_repositories)
+
+    async def generate(self, github_token: str) -> None:
+        """Generate metadata for all repositories.
+
+        Finished plugins are checkpointed, so a cancelled run can be resumed
+        by the next one without fetching them again.
+        """
+        start_time = perf_counter()
+        started_at = time()
+        journal = CheckpointJournal.from_env().load()
+        schedule = RefreshSchedule.from_env().load()
+        self.plan_refresh(schedule, started_at)
+        plugin_data, valid_repositories, listed_as, summary_data = await self.collect(
+            github_token, journal
         )
+        self.save_outputs(plugin_data, valid_repositories)
+        self.update_schedule(schedule, plugin_data, listed_as, started_at)
         await self.summarize_results(summary_data, start_time)
+        journal.clear()
+
+    def plan_refresh(self, schedule: RefreshSchedule, now: float) -> None:
+        """Reuse the previous result of every plugin that is not due.
+
+        Without the previous run's data (`diff/data_before.json`) every
+        plugin is fetched.
+
+        Args:
+        ----
+            schedule: Refresh schedule of the previous runs.
+            now: Start time of this run.
+
+        """
+        previous = self.previous_data()
+        if not previous:
+            return
+        due = schedule.due(self.repos_list, now)
+        self.carried = {}
+        for repo in self.repos_list:
+            entry = schedule.entries.get(repo.lower())
+            if repo not in due and entry.id in previous:
+                self.carried[repo] = {int(entry.id): previous[entry.id]}
+        LOGGER.info(
+            f"🗓️ {len(self.repos_list) - len(self.carried)} of "
+            f"{len(self.repos_list)} plugins are due for a refresh"
+        )
+
+    def update_schedule(
+        self,
+        schedule: RefreshSchedule,
+        plugin_data: dict,
+        listed_as: dict[str, str],
+        now: float,
+    ) -> None:
+        """Record the plugins fetched in this run and save the schedule.
+
+        Fetches are stamped with the run's start time rather than the time
+        the run ended, so the next run sees exactly one cron period passed.
+
+        Args:
+        ----
+            schedule: Refresh schedule to update.
+            plugin_data: Generated metadata for all plugins.
+            listed_as: The plugins.json name of every repository id.
+            now: Start time of this run.
+
+        """
+        for repo_id, metadata in plugin_data.items():
+            repo = listed_as[str(repo_id)]
+            # Stale entries stay due, so they are fetched again next run
+            if repo not in self.carried and "stale_since" not in metadata:
+                schedule.record(repo, repo_id, metadata, now)
+        schedule.prune(self.repos_list)
+        schedule.save()
+
+    async def refresh(self, github_token: str, repo: str) -> bool:
+        """Fetch a single plugin and patch it into the existing outputs.
+
+        The published `data.json` in the output directory is the starting
+        point. The plugin's entry is replaced in place (or appended if it is
+        new, or removed if it was archived), and the derived files and
+        `summary.json` are written again. The metric history is left alone.
+
+        Args:
+        ----
+            github_token: GitHub token for API access.
+            repo: Repository as listed in plugins.json, in any letter case.
+
+        Returns:
+        -------
+            bool: False if the plugin could not be fetched; the outputs are
+            then left untouched.
+
+        Raises:
+        ------
+            ValueError: If the repository is not listed in plugins.json.
+
+        """
+        start_time = perf_counter()
+        listed = {name.lower(): name for name in self.repos_list}
+        if repo.lower() not in listed:
+            msg = f"'{repo}' is not listed in {self.plugin_file}"
+            raise ValueError(msg)
+
+        identities = RepoIdentityCache.from_env().load()
+        async with (
+            shared_session() as session,
+            github_client(github_token) as github,
+        ):
+            zip_inspector = ZipInspector.from_env(session)
+            generator = PluginMetadataGenerator(listed[repo.lower()], zip_inspector)
+            result = await generator.fetch_metadata(github)
+        log_sink = PluginLogSink.from_env()
+        generator.logger.flush(log_sink)
+        if log_sink:
+            log_sink.close()
+        if zip_inspector:
+            zip_inspector.cache.save()
+        if not result:
+            LOGGER.error(f"Unable to refresh {generator.original_repo}")
+            return False
+
+        repo_id, metadata = next(iter(result.items()))
+        identities.record(repo_id, generator.repo, generator.original_repo)
+        identities.save()
+        schedule = RefreshSchedule.from_env().load()
+        schedule.record(generator.original_repo, repo_id, metadata)
+        schedule.save()
+        self.patch_outputs(
+            str(repo_id),
+            metadata,
+            {generator.original_repo.lower(), generator.repo.lower()},
+        )
+        self.save_summary(self.recount(), perf_counter() - start_time)
+        LOGGER.info(f"🔁 Refreshed {generator.repo}")
+        return True
+
+    def patch_outputs(self, repo_id: str, metadata: dict, names: set[str]) -> None:
+        """Patch one plugin's entry into `data.json` and save the outputs.
+
+        Args:
+        ----
+            repo_id: Repository id of the plugin.
+            metadata: The plugin's new metadata.
+            names: Lower-cased names the plugin may be published under.
+
+        """
+        data_file = Path(f"{self.output_dir}/data.json")
+        plugin_data: dict[str, dict] = load(data_file) if data_file.exists() else {}
+        # Drop entries of the same repository under another id (re-created)
+        for key in [
+            key
+            for key, entry in plugin_data.items()
+            if key != repo_id and entry["repository"].lower() in names
+        ]:
+            del plugin_data[key]
+        if metadata.get("archived"):
+            plugin_data.pop(repo_id, None)
+        else:
+            plugin_data[repo_id] = metadata
+
+        self.save_outputs(
+            plugin_data,
+            [entry["repository"] for entry in plugin_data.values()],
+            update_trending=False,
+        )
+
+    def recount(self) -> SummaryData:
+        """Recompute the summary counts after a single-plugin refresh.
+
+        Valid and stale plugins are counted in `data.json`. Archived and
+        renamed plugins are only known from a full run, so their counts are
+        carried over from the previous `summary.json`.
+        """
+        plugin_data = load(f"{self.output_dir}/data.json")
+        valid = len(plugin_data)
+        summary_file = Path(f"{self.output_dir}/summary.json")
+        previous = load(summary_file) if summary_file.exists() else {}
+        total = len(self.repos_list)
+        archived = previous.get("archived_plugins", 0)
+        return SummaryData(
+            total=total,
+            valid=valid,
+            archived=archived,
+            renamed=previous.get("renamed_plugins", 0),
+            skipped=max(total - valid - archived, 0),
+            stale=sum("stale_since" in entry for entry in plugin_data.values()),
+        )
+
+    async def generate_shard(
+        self, github_token: str, shard: int, shards: int, shard_dir: str
+    ) -> None:
+        """Generate metadata for one shard and save it for `merge`.
+
+        Args:
+        ----
+            github_token: GitHub token for API access.
+            shard: Index of this shard, from 0 to `shards - 1`.
+            shards: Total number of shards.
+            shard_dir: Directory the shard result is written to.
+
+        """
+        start_time = perf_counter()
+        self.repos_list = [
+            repo for repo in self.repos_list if shard_of(repo, shards) == shard
+        ]
+        # Shards may run side by side, so each keeps its own journal
+        journal = CheckpointJournal.from_env()
+        journal.path = journal.path.with_name(
+            f"{journal.path.stem}-{shard}-of-{shards}{journal.path.suffix}"
+        )
+        journal.load()
+        plugin_data, _, listed_as, summary_data = await self.collect(
+            github_token, journal
+        )
+
+        self.save_shard(
+            shard_dir,
+            {
+                "shard": shard,
+                "shards": shards,
+                "plugins": {
+                    listed_as[str(repo_id)]: {"id": repo_id, "metadata": metadata}
+                    for repo_id, metadata in plugin_data.items()
+                },
+                "summary": vars(summary_data),
+                "execution_time_seconds": round(perf_counter() - start_time, 2),
+            },
+        )
+        journal.clear()
+
+    def save_shard(self, shard_dir: str, result: dict) -> None:
+        """Save the result of one shard as `<shard>-of-<shards>.json`."""
+        Path(shard_dir).mkdir(parents=True, exist_ok=True)
+        self.save_json(
+            f"{shard_dir}/{result['shard']}-of-{result['shards']}.json", result
+        )
+
+    def merge(self, shard_dir: str) -> None:
+        """Combine the shard results into the regular outputs.
+
+        Plugins are ordered as in plugins.json, so the merged outputs are the
+        same as those of a single run, whatever the number of shards.
+
+        Args:
+        ----
+            shard_dir: Directory with the results of `generate_shard`.
+
+        Raises:
+        ------
+            ValueError: If the shard results are incomplete or inconsistent.
+
+        """
+        results = [load(path) for path in sorted(Path(shard_dir).glob("*-of-*.json"))]
+        counts = {result["shards"] for result in results}
+        found = sorted(result["shard"] for result in results)
+        if len(counts) != 1 or found != list(range(counts.pop())):
+            msg = f"Incomplete or mixed shard results in {shard_dir}: {found}"
+            raise ValueError(msg)
+
+        plugins: dict[str, dict] = {}
+        for result in results:
+            plugins.update(result["plugins"])
+        plugin_data: dict[str, dict] = {}
+        valid_repositories: list[str] = []
+        for repo in self.repos_list:
+            if repo in plugins:
+                entry = plugins[repo]
+                plugin_data[entry["id"]] = entry["metadata"]
+                valid_repositories.append(entry["metadata"]["repository"])
+        self.save_outputs(plugin_data, valid_repositories)
+
+        summary = {
+            key: sum(result["summary"][key] for result in results)
+            for key in ("total", "valid", "archived", "renamed", "skipped", "stale")
+        }
+        self.save_summary(
+            SummaryData(**summary),
+            # Shards run in parallel, so the slowest one sets the wall time
+            max(result["execution_time_seconds"] for result in results),
+        )
@@ -0,0 +1,45 @@
+"""Shared start-up for the command line entry points.
+
+Modules in this project have no import-time side effects: importing one
+neither reads `.env`, configures logging nor touches the disk. Each entry
+point calls `bootstrap()` first thing in its `main()` instead.
+"""
+
+import logging
+import sys
+from functools import cache
+
+
+@cache
+def load_env() -> None:
+    """Load variables from a `.env` file into the environment, once."""
+    # python-dotenv is only needed by entry points, not by library imports
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv()
+
+
+@cache
+def setup_logging() -> None:
+    """Log to stdout, with level names that GitHub Actions turns into annotations."""
+    logging.addLevelName(logging.INFO, "")
+    logging.addLevelName(logging.ERROR, "::error::")
+    logging.addLevelName(logging.WARNING, "::warning::")
+    logging.basicConfig(
+        level=logging.INFO,
+        format=" %(levelname)s %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+
+def bootstrap(*, env: bool = True) -> None:
+    """Prepare the process for a command line entry point.
+
+    Args:
+    ----
+        env: Load `.env` as well; scripts that read no secrets skip it.
+
+    """
+    if env:
+        load_env()
+    setup_logging()
@@ -0,0 +1,200 @@
+"""Run all plugin PR checks in a single process.
+
+The registry files are parsed once and every GitHub request goes through one
+pooled session. Checks that do not depend on the preflight result start right
+away; the add/remove checks start as soon as the preflight has finished.
+"""
+
+import argparse
+import asyncio
+import inspect
+import logging
+import os
+import sys
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import check_categories
+import check_preflight
+import check_releases
+import check_removed
+from bootstrap import bootstrap
+from repo_identity import DEFAULT_CONCURRENCY, RepoResolver
+from serialization import JSONDecodeError, load
+from transport import run, shared_session
+
+LOGGER = logging.getLogger(__name__)
+
+Check = Callable[[], Awaitable[int | None] | int | None]
+
+
+@dataclass(slots=True)
+class Registry:
+    """Registry files, parsed once and shared by every check."""
+
+    old_plugins: set[str]
+    plugins: set[str]
+    categorized: set[str]
+    removed: set[str]
+
+
+def load_registry(args: argparse.Namespace) -> Registry | None:
+    """Load plugins.json (old and new), categories.json and the removed list."""
+    old_plugins = check_preflight.load_repo_list(Path(args.old_plugins_file))
+    plugins = check_preflight.load_repo_list(Path(args.plugins_file))
+
+    categorized = check_categories.load_categories_repositories(args.categories_file)
+    if categorized is None:
+        return None
+
+    try:
+        removed = check_removed.removed_repositories(load(args.removed_file))
+    except FileNotFoundError:
+        LOGGER.exception(f"Could not find '{args.removed_file}'. Ensure it exists.")
+        return None
+    except (JSONDecodeError, KeyError, TypeError):
+        LOGGER.exception(f"Invalid format in '{args.removed_file}'")
+        return None
+
+    return Registry(old_plugins, plugins, categorized, removed)
+
+
+async def guarded(results: dict[str, bool], name: str, check: Check) -> bool:
+    """Run a single check and record whether it passed.
+
+    Checks report failure by returning an error count or by calling
+    `sys.exit`, as they do when run as standalone scripts. An unexpected
+    error fails only the check that raised it.
+    """
+    try:
+        outcome = check()
+        if inspect.isawaitable(outcome):
+            outcome = await outcome
+    except SystemExit as exc:
+        passed = exc.code in (0, None)
+    except Exception:
+        LOGGER.exception(f"Check '{name}' failed with an unexpected error")
+        passed = False
+    else:
+        passed = not outcome
+    results[name] = passed
+    return passed
+
+
+async def run_checks(
+    registry: Registry, token: str | None, concurrency: int = DEFAULT_CONCURRENCY
+) -> dict[str, bool]:
+    """Run every check and return the outcome per check name.
+
+    Args:
+    ----
+        registry (Registry): Parsed registry files.
+        token (str | None): GitHub token for API access.
+        concurrency (int): Maximum concurrent canonical-name lookups.
+
+    Returns:
+    -------
+        dict[str, bool]: Whether each check that ran has passed.
+
+    """
+    results: dict[str, bool] = {}
+    change: tuple[str, str, str] | None = None
+
+    async def preflight() -> None:
+        nonlocal change
+        async with RepoResolver(token) as resolver:
+            change = await check_preflight.detect_change(
+                registry.old_plugins, registry.plugins, resolver
+            )
+
+    async with shared_session(), asyncio.TaskGroup() as group:
+        group.create_task(
+            guarded(
+                results,
+                "categories sync",
+                lambda: check_categories.validate_categories_plugins_sync(
+                    registry.categorized, registry.plugins
+                ),
+            )
+        )
+        if token:
+            group.create_task(
+                guarded(
+                    results,
+                    "canonical names",
+                    lambda: check_categories.validate_canonical_repository_names(
+                        registry.plugins, registry.categorized, token, concurrency
+                    ),
+                )
+            )
+        else:
+            LOGGER.warning("⚠️ GITHUB_TOKEN not set, skipping canonical name validation")
+
+        if not await guarded(results, "preflight", preflight) or change is None:
+            return results
+
+        repo, action, ref = change
+        check_preflight.write_github_output(repo, action, ref)
+        group.create_task(
+            guarded(
+                results,
+                "category assignment",
+                lambda: check_categories.validate_repository_in_categories(
+                    repo, action, registry.categorized
+                ),
+            )
+        )
+        if action == "add":
+            group.create_task(
+                guarded(
+                    results,
+                    "releases",
+                    lambda: check_releases.check_releases(repo, token),
+                )
+            )
+            group.create_task(
+                guarded(
+                    results,
+                    "removed",
+                    lambda: check_removed.validate_not_removed(repo, registry.removed),
+                )
+            )
+
+    return results
+
+
+def main() -> None:
+    """Entry point for the script."""
+    bootstrap()
+    parser = argparse.ArgumentParser(description="Run all plugin PR checks.")
+    parser.add_argument("--plugins-file", default="plugins.json")
+    parser.add_argument("--old-plugins-file", default="plugins_old.json")
+    parser.add_argument("--categories-file", default="categories.json")
+    parser.add_argument(
+        "--removed-file",
+        required=True,
+        help="Published list of removed plugins, not the PR's own removed.json",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent GitHub lookups (default: {DEFAULT_CONCURRENCY})",
+    )
+    args = parser.parse_args()
+
+    registry = load_registry(args)
+    if registry is None:
+        sys.exit(1)
+
+    results = run(run_checks(registry, os.getenv("GITHUB_TOKEN"), args.concurrency))
+
+    LOGGER.info("=== Check results ===")
+    for name, passed in results.items():
+        LOGGER.info(f"{'✅' if passed else '❌'} {name}")
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,26 @@
 """Check if a repository is in categories.json."""
 
 import argparse
-import asyncio
-import json
 import logging
 import os
 import sys
-from pathlib import Path
-
-from aiogithubapi import GitHubAPI, GitHubException
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# Logging setup (GitHub Actions compatible)
-logging.addLevelName(logging.INFO, "")
-logging.addLevelName(logging.ERROR, "::error::")
-logging.addLevelName(logging.WARNING, "::warning::")
-logging.basicConfig(
-    level=logging.INFO,
-    format=" %(levelname)s %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+
+from aiogithubapi import GitHubException
+from bootstrap import bootstrap
+from repo_identity import DEFAULT_CONCURRENCY, RepoResolver
+from serialization import JSONDecodeError, load
+from transport import run
+
 LOGGER = logging.getLogger(__name__)
 
 
 def load_json_file(file_path: str) -> list[str] | dict[str, list[str]] | None:
     """Load a JSON file and return the parsed data."""
     try:
-        with Path(file_path).open(encoding="utf-8") as file:
-            return json.load(file)
+        return load(file_path)
     except FileNotFoundError:
         LOGGER.exception(f"Could not find '{file_path}'. Ensure it exists.")
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         LOGGER.exception(f"Invalid JSON format in '{file_path}'")
     except Exception:
         LOGGER.exception(f"Unexpected error reading '{file_path}'")
@@ -77,7 +65,25 @@ def check_repository_in_categories(repo: str, action: str, categories_file: str)
     categorized_repos = load_categories_repositories(categories_file)
     if categorized_repos is None:
         return 1
+    return validate_repository_in_categories(repo, action, categorized_repos)
+
+
+def validate_repository_in_categories(
+    repo: str, action: str, categorized_repos: set[str]
+) -> int:
+    """Check an add/remove action against the loaded categories.
+
+    Args:
+    ----
+        repo (str): Repository name in the format 'owner/repo'.
+        action (str): Action performed, either 'add' or 'remove'.
+        categorized_repos (set[str]): All repositories in categories.json.
 
+    Returns:
+    -------
+        int: 0 if the check passes, 1 if it fails.
+
+    """
     repo_count = int(repo in categorized_repos)
 
     if action == "add":
@@ -120,7 +126,24 @@ def check_categories_plugins_sync(categories_file: str, plugins_file: str) -> in
     categorized_repos = load_categories_repositories(categories_file)
     if categorized_repos is None:
         return 1
+    return validate_categories_plugins_sync(categorized_repos, plugins_list)
+
+
+def validate_categories_plugins_sync(
+    categorized_repos: set[str], plugins_list: set[str]
+) -> int:
+    """Check that the loaded categories and plugins list cover each other.
+
+    Args:
+    ----
+        categorized_repos (set[str]): All repositories in categories.json.
+        plugins_list (set[str]): All repositories in plugins.json.
+
+    Returns:
+    -------
+        int: Number of errors found.
 
+    """
     uncategorized = sorted(
         [repo for repo in plugins_list if repo not in categorized_repos]
     )
@@ -150,7 +173,7 @@ def check_categories_plugins_sync(categories_file: str, plugins_file: str) -> in
 
 
 async def check_canonical_repository_names(
-    categories_file: str, plugins_file: str
+    categories_file: str, plugins_file: str, concurrency: int = DEFAULT_CONCURRENCY
 ) -> int:
     """Validate repo names against GitHub's canonical repository names."""
     token = os.getenv("GITHUB_TOKEN")
@@ -165,36 +188,64 @@ async def check_canonical_repository_names(
     categorized_repos = load_categories_repositories(categories_file)
     if categorized_repos is None:
         return 1
+    return await validate_canonical_repository_names(
+        plugins_list, categorized_repos, token, concurrency
+    )
+
+
+async def validate_canonical_repository_names(
+    plugins_list: set[str],
+    categorized_repos: set[str],
+    token: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> int:
+    """Compare the loaded repository names with GitHub's canonical names.
 
+    Lookups run concurrently, but results are reported in sorted order.
+
+    Args:
+    ----
+        plugins_list (set[str]): All repositories in plugins.json.
+        categorized_repos (set[str]): All repositories in categories.json.
+        token (str): GitHub token for API access.
+        concurrency (int): Maximum number of lookups in flight.
+
+    Returns:
+    -------
+        int: Number of errors found.
+
+    """
     errors = 0
     all_repositories = sorted(plugins_list | categorized_repos)
 
-    async with GitHubAPI(token) as github:
-        for repo in all_repositories:
-            try:
-                response = await github.repos.get(repo)
-            except GitHubException:
-                LOGGER.exception(f"Failed to fetch repository info for '{repo}'.")
-                errors += 1
-                continue
-
-            canonical_repo = response.data.full_name
-            if canonical_repo != repo:
-                locations = []
-                if repo in plugins_list:
-                    locations.append("plugins.json")
-                if repo in categorized_repos:
-                    locations.append("categories.json")
-                joined_locations = " and ".join(locations)
-                LOGGER.error(
-                    f"❌ Repository name mismatch detected!\n"
-                    f"   In {joined_locations}: '{repo}'\n"
-                    f"   Canonical name:      '{canonical_repo}'\n"
-                    "   This usually means the repository was renamed or recased "
-                    "on GitHub.\n"
-                    f"   Please update plugins.json and categories.json to use '{canonical_repo}'"  # noqa: E501
-                )
-                errors += 1
+    async with RepoResolver(token) as resolver:
+        results = await resolver.canonical_names(all_repositories, concurrency)
+
+    for repo, canonical_repo in zip(all_repositories, results, strict=True):
+        if isinstance(canonical_repo, GitHubException):
+            LOGGER.error(
+                f"Failed to fetch repository info for '{repo}'.",
+                exc_info=canonical_repo,
+            )
+            errors += 1
+            continue
+
+        if canonical_repo != repo:
+            locations = []
+            if repo in plugins_list:
+                locations.append("plugins.json")
+            if repo in categorized_repos:
+                locations.append("categories.json")
+            joined_locations = " and ".join(locations)
+            LOGGER.error(
+                f"❌ Repository name mismatch detected!\n"
+                f"   In {joined_locations}: '{repo}'\n"
+                f"   Canonical name:      '{canonical_repo}'\n"
+                "   This usually means the repository was renamed or recased "
+                "on GitHub.\n"
+                f"   Please update plugins.json and categories.json to use '{canonical_repo}'"  # noqa: E501
+            )
+            errors += 1
 
     if errors == 0:
         LOGGER.info("✅ All repository names match GitHub canonical names.")
@@ -202,6 +253,7 @@ async def check_canonical_repository_names(
 
 
 if __name__ == "__main__":
+    bootstrap()
     parser = argparse.ArgumentParser(
         description="Validate repository category assignment in categories.json."
     )
@@ -221,6 +273,13 @@ if __name__ == "__main__":
         help="Action performed: add or remove (optional)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent GitHub lookups (default: {DEFAULT_CONCURRENCY})",
+    )
+
     args = parser.parse_args()
     error_count = 0
 
@@ -237,7 +296,9 @@ if __name__ == "__main__":
     error_count += check_categories_plugins_sync(
         args.categories_file, args.plugins_file
     )
-    error_count += asyncio.run(
-        check_canonical_repository_names(args.categories_file, args.plugins_file)
+    error_count += run(
+        check_canonical_repository_names(
+            args.categories_file, args.plugins_file, args.concurrency
+        )
     )
     sys.exit(1 if error_count else 0)
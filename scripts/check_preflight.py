@@ -1,27 +1,17 @@
 """Determine repository changes between plugins.json files."""
 
-import asyncio
-import json
 import logging
 import os
 import sys
 from pathlib import Path
 
-from aiogithubapi import GitHubAPI, GitHubException
-from dotenv import load_dotenv
+from aiogithubapi import GitHubException
+from bootstrap import bootstrap
 from release_selection import select_used_ref
+from repo_identity import RepoResolver
+from serialization import load
+from transport import github_client, run
 
-load_dotenv()
-
-# Logging setup (GitHub Actions compatible)
-logging.addLevelName(logging.INFO, "")
-logging.addLevelName(logging.ERROR, "::error::")
-logging.addLevelName(logging.WARNING, "::warning::")
-logging.basicConfig(
-    level=logging.INFO,
-    format=" %(levelname)s %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
 LOGGER = logging.getLogger(__name__)
 
 
@@ -38,8 +28,7 @@ def load_repo_list(path: Path) -> set[str]:
 
     """
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load(path)
         if not isinstance(data, list):
             LOGGER.error(f"{path} is not a JSON list.")
             sys.exit(1)
@@ -49,7 +38,7 @@ def load_repo_list(path: Path) -> set[str]:
         sys.exit(1)
 
 
-async def get_canonical_repo_name(repository: str, token: str) -> str:
+async def get_canonical_repo_name(repository: str, resolver: RepoResolver) -> str:
     """Get the canonical repository name from GitHub API.
 
     GitHub URLs are case-insensitive, but we need the exact casing
@@ -58,27 +47,25 @@ async def get_canonical_repo_name(repository: str, token: str) -> str:
     Args:
     ----
         repository (str): Repository name in format 'owner/repo'.
-        token (str): GitHub token for API access.
+        resolver (RepoResolver): Resolver shared by the whole run.
 
     Returns:
     -------
         str: The canonical repository name with correct casing.
 
     """
-    async with GitHubAPI(token) as github:
-        try:
-            response = await github.repos.get(repository)
-            canonical_name = response.data.full_name
-            if canonical_name.lower() != repository.lower():
-                LOGGER.warning(
-                    f"Repository name mismatch! Requested: '{repository}', "
-                    f"Canonical: '{canonical_name}'"
-                )
-        except GitHubException:
-            LOGGER.exception(f"Failed to fetch repository info for '{repository}'.")
-            sys.exit(1)
-        else:
-            return canonical_name
+    try:
+        canonical_name = await resolver.canonical_name(repository)
+        if canonical_name.lower() != repository.lower():
+            LOGGER.warning(
+                f"Repository name mismatch! Requested: '{repository}', "
+                f"Canonical: '{canonical_name}'"
+            )
+    except GitHubException:
+        LOGGER.exception(f"Failed to fetch repository info for '{repository}'.")
+        sys.exit(1)
+    else:
+        return canonical_name
 
 
 def write_github_output(repository: str, action: str, ref: str = "") -> None:
@@ -93,7 +80,7 @@ def write_github_output(repository: str, action: str, ref: str = "") -> None:
 
 async def get_used_ref(repository: str, token: str) -> str:
     """Resolve the release ref that downstream checks should use."""
-    async with GitHubAPI(token) as github:
+    async with github_client(token) as github:
         try:
             response = await github.repos.releases.list(repository)
         except GitHubException:
@@ -110,20 +97,20 @@ async def get_used_ref(repository: str, token: str) -> str:
     return ref
 
 
-async def validate_repo_name(repo: str) -> None:
+async def validate_repo_name(repo: str, resolver: RepoResolver) -> None:
     """Validate repository name against GitHub canonical name.
 
     Args:
     ----
         repo (str): Repository name to validate.
+        resolver (RepoResolver): Resolver shared by the whole run.
 
     """
-    token = os.getenv("GITHUB_TOKEN")
-    if not token:
+    if not resolver.token:
         LOGGER.warning("⚠️ GITHUB_TOKEN not set, skipping canonical name validation")
         return
 
-    canonical_repo = await get_canonical_repo_name(repo, token)
+    canonical_repo = await get_canonical_repo_name(repo, resolver)
     if canonical_repo != repo:
         LOGGER.error(
             f"❌ Repository name casing mismatch!\n"
@@ -135,23 +122,26 @@ async def validate_repo_name(repo: str) -> None:
     LOGGER.info(f"✅ Repository name casing is correct: {canonical_repo}")
 
 
-async def validate_repo_rename(old_repo: str, new_repo: str) -> bool:
+async def validate_repo_rename(
+    old_repo: str, new_repo: str, resolver: RepoResolver
+) -> bool:
     """Validate whether a removed+added pair is a legitimate repository rename."""
-    token = os.getenv("GITHUB_TOKEN")
-    if not token:
+    if not resolver.token:
         LOGGER.warning("⚠️ GITHUB_TOKEN not set, skipping rename validation")
         return False
 
-    canonical_old_repo = await get_canonical_repo_name(old_repo, token)
+    canonical_old_repo = await get_canonical_repo_name(old_repo, resolver)
     if canonical_old_repo != new_repo:
         return False
 
     LOGGER.info(f"✅ Repository renamed:\n   Old: '{old_repo}'\n   New: '{new_repo}'")
-    await validate_repo_name(new_repo)
+    await validate_repo_name(new_repo, resolver)
     return True
 
 
-async def handle_repo_rename(old_repo: str, new_repo: str) -> bool:
+async def handle_repo_rename(
+    old_repo: str, new_repo: str, resolver: RepoResolver
+) -> bool:
     """Handle case-only updates and GitHub-confirmed repository renames."""
     if new_repo.lower() == old_repo.lower():
         LOGGER.info(
@@ -159,20 +149,29 @@ async def handle_repo_rename(old_repo: str, new_repo: str) -> bool:
             f"   Old: '{old_repo}'\n"
             f"   New: '{new_repo}'"
         )
-        await validate_repo_name(new_repo)
+        await validate_repo_name(new_repo, resolver)
         return True
 
-    return await validate_repo_rename(old_repo, new_repo)
+    return await validate_repo_rename(old_repo, new_repo, resolver)
 
 
-async def async_main() -> None:
-    """Check for changes in plugins.json files."""
-    old_path = Path("plugins_old.json")
-    new_path = Path("plugins.json")
+async def detect_change(
+    old_repos: set[str], new_repos: set[str], resolver: RepoResolver
+) -> tuple[str, str, str] | None:
+    """Determine the single repository added or removed between two lists.
+
+    Args:
+    ----
+        old_repos (set[str]): Repositories in the base branch plugins.json.
+        new_repos (set[str]): Repositories in the PR plugins.json.
+        resolver (RepoResolver): Resolver shared by the whole run.
 
-    old_repos = load_repo_list(old_path)
-    new_repos = load_repo_list(new_path)
+    Returns:
+    -------
+        tuple[str, str, str] | None: Repository, action and release ref, or
+        None for renames and unchanged lists.
 
+    """
     added = list(new_repos - old_repos)
     removed = list(old_repos - new_repos)
 
@@ -181,38 +180,51 @@ async def async_main() -> None:
         added_repo = added[0]
         removed_repo = removed[0]
 
-        if await handle_repo_rename(removed_repo, added_repo):
+        if await handle_repo_rename(removed_repo, added_repo, resolver):
             # Don't set any output - this is a rename, not an add/remove
-            return
+            return None
 
     if len(added) == 1 and len(removed) == 0:
         repo = added[0]
         LOGGER.info(f"✅ One repository added: {repo}")
-        await validate_repo_name(repo)
-        token = os.getenv("GITHUB_TOKEN")
-        if not token:
+        await validate_repo_name(repo, resolver)
+        if not resolver.token:
             LOGGER.error("No GitHub token provided.")
             sys.exit(1)
-        ref = await get_used_ref(repo, token)
-        write_github_output(repo, "add", ref)
-    elif len(added) == 0 and len(removed) == 1:
+        ref = await get_used_ref(repo, resolver.token)
+        return repo, "add", ref
+    if len(added) == 0 and len(removed) == 1:
         repo = removed[0]
         LOGGER.info(f"✅ One repository removed: {repo}")
-        write_github_output(repo, "remove")
-    elif len(added) == 0 and len(removed) == 0:
+        return repo, "remove", ""
+    if len(added) == 0 and len(removed) == 0:
         LOGGER.info("No changes to plugins.json detected.")
-    else:
-        LOGGER.warning("⚠️ PR must add or remove exactly one repository.")
-        LOGGER.info(f"Added repositories: {added}")
-        LOGGER.info(f"Removed repositories: {removed}")
-        LOGGER.info(f"Added count: {len(added)}")
-        LOGGER.info(f"Removed count: {len(removed)}")
-        sys.exit(1)
+        return None
+
+    LOGGER.warning("⚠️ PR must add or remove exactly one repository.")
+    LOGGER.info(f"Added repositories: {added}")
+    LOGGER.info(f"Removed repositories: {removed}")
+    LOGGER.info(f"Added count: {len(added)}")
+    LOGGER.info(f"Removed count: {len(removed)}")
+    sys.exit(1)
+
+
+async def async_main() -> None:
+    """Check for changes in plugins.json files."""
+    old_repos = load_repo_list(Path("plugins_old.json"))
+    new_repos = load_repo_list(Path("plugins.json"))
+
+    # One resolver, with one identity cache and one GitHub client, per run
+    async with RepoResolver(os.getenv("GITHUB_TOKEN")) as resolver:
+        change = await detect_change(old_repos, new_repos, resolver)
+    if change is not None:
+        write_github_output(*change)
 
 
 def main() -> None:
     """Entry point for the script."""
-    asyncio.run(async_main())
+    bootstrap()
+    run(async_main())
 
 
 if __name__ == "__main__":
@@ -1,34 +1,18 @@
 """Check if a plugin repository has published releases."""
 
 import argparse
-import asyncio
 import logging
 import os
 import re
 import sys
 
-from aiogithubapi import GitHubAPI, GitHubException
-from dotenv import load_dotenv
-from release_selection import select_used_ref
-
-load_dotenv()
+from aiogithubapi import GitHubException
+from bootstrap import bootstrap
+from release_selection import ReleaseIndex
+from transport import github_client, run
 
 REPO_REGEX = re.compile(r"^[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+$")
-SEMVER_REGEX = re.compile(
-    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"  # major.minor.patch
-    r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"  # optional pre-release
-    r"(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"  # optional build metadata
-)
-
-# Loggin setup
-logging.addLevelName(logging.INFO, "")
-logging.addLevelName(logging.ERROR, "::error::")
-logging.addLevelName(logging.WARNING, "::warning::")
-logging.basicConfig(
-    level=logging.INFO,
-    format=" %(levelname)s %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -47,21 +31,6 @@ def valid_repository(value: str) -> str:
     return value
 
 
-def is_valid_semver(tag: str) -> bool:
-    """Check if a tag follows SemVer format.
-
-    Args:
-    ----
-        tag (str): Release tag (without the 'v' prefix).
-
-    Returns:
-    -------
-        bool: True if the tag is valid according to SemVer, otherwise False.
-
-    """
-    return bool(SEMVER_REGEX.match(tag))
-
-
 async def check_releases(repository: str, token: str) -> None:
     """Check if a GitHub repository has at least one release.
 
@@ -71,7 +40,7 @@ async def check_releases(repository: str, token: str) -> None:
         token (str): GitHub token.
 
     """
-    async with GitHubAPI(token) as github:
+    async with github_client(token) as github:
         try:
             response = await github.repos.releases.list(repository)
         except GitHubException:
@@ -85,11 +54,12 @@ async def check_releases(repository: str, token: str) -> None:
             LOGGER.error(f"No releases found for repository: {repository}")
             sys.exit(1)
 
-        tag = select_used_ref(releases)
+        index = ReleaseIndex.from_unsorted(releases)
+        tag = index.used_ref
         LOGGER.info(f"🔍 Selected release tag: {tag}")
 
         # Check if the selected release tag follows SemVer
-        if not is_valid_semver(tag.removeprefix("v")):
+        if index.versions[tag] is None:
             LOGGER.error(f"The selected release tag '{tag}' does not follow SemVer.")
             sys.exit(1)
         else:
@@ -97,6 +67,7 @@ async def check_releases(repository: str, token: str) -> None:
 
 
 if __name__ == "__main__":
+    bootstrap()
     parser = argparse.ArgumentParser(
         description="Check if a GitHub repository has at least one release."
     )
@@ -116,4 +87,4 @@ if __name__ == "__main__":
         )
         sys.exit(1)
 
-    asyncio.run(check_releases(args.repository, token))
+    run(check_releases(args.repository, token))
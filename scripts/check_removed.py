@@ -1,24 +1,45 @@
 """Check if a plugin has been listed as removed."""
 
 import argparse
-import json
 import logging
 import os
 import sys
-from pathlib import Path
-
-# Loggin setup
-logging.addLevelName(logging.INFO, "")
-logging.addLevelName(logging.ERROR, "::error::")
-logging.addLevelName(logging.WARNING, "::warning::")
-logging.basicConfig(
-    level=logging.INFO,
-    format=" %(levelname)s %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+
+from bootstrap import bootstrap
+from serialization import JSONDecodeError, load
+
 LOGGER = logging.getLogger(__name__)
 
 
+def removed_repositories(data: list[str | dict[str, str]]) -> set[str]:
+    """Return the repository names of a removed list.
+
+    Accepts both removed.json entries and the plain list of names that is
+    published next to it. Names are kept as listed.
+    """
+    return {entry if isinstance(entry, str) else entry["repository"] for entry in data}
+
+
+def validate_not_removed(repo: str, removed_plugins: set[str]) -> int:
+    """Check a repository against the loaded removed list.
+
+    Args:
+    ----
+        repo (str): Repository name.
+        removed_plugins (set[str]): Names of removed repositories.
+
+    Returns:
+    -------
+        int: 0 if the repository is not removed, 1 if it is.
+
+    """
+    if repo.lower() in removed_plugins:
+        LOGGER.warning(f"⚠️ '{repo}' is removed from the RH Community Plugins DB.")
+        return 1
+    LOGGER.info(f"✅ '{repo}' is not removed from the RH Community Plugins DB.")
+    return 0
+
+
 def check_removed_repository(repo: str, data_file: str) -> None:
     """Check if a plugin has been listed as removed.
 
@@ -29,26 +50,23 @@ def check_removed_repository(repo: str, data_file: str) -> None:
 
     """
     try:
-        with Path.open(data_file) as file:
-            removed_plugins = json.load(file)
-
-        if repo in removed_plugins:
-            LOGGER.warning(f"⚠️ '{repo}' is removed from the RH Community Plugins DB.")
-            sys.exit(1)
+        removed_plugins = removed_repositories(load(data_file))
     except FileNotFoundError:
         LOGGER.exception(f"::error::Could not find {data_file}. Ensure it exists.")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         LOGGER.exception(f"::error::Invalid JSON format in {data_file}")
         sys.exit(1)
     except Exception:
         LOGGER.exception("Unexpected error occurred")
         sys.exit(1)
-    else:
-        LOGGER.info(f"✅ '{repo}' is not removed from the RH Community Plugins DB.")
+
+    if validate_not_removed(repo, removed_plugins):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
+    bootstrap()
     parser = argparse.ArgumentParser(
         description="Validate repository against removed list."
     )
@@ -0,0 +1,142 @@
+"""Purge a list of changed URLs from the Cloudflare cache."""
+
+import argparse
+import itertools
+import logging
+import os
+import sys
+from pathlib import Path
+
+import aiohttp
+from bootstrap import bootstrap
+from serialization import JSONDecodeError, load
+from transport import TransportConfig, create_session, run
+
+CLOUDFLARE_API_URL = "https://api.cloudflare.com/client/v4"
+# Cloudflare accepts at most 30 URLs per purge request on most plans
+MAX_URLS_PER_REQUEST = 30
+REQUEST_TIMEOUT = 30
+
+LOGGER = logging.getLogger(__name__)
+
+
+def load_urls(file_path: Path) -> list[str]:
+    """Load the list of URLs to purge.
+
+    Args:
+    ----
+        file_path (Path): Path to a JSON list of URLs.
+
+    Returns:
+    -------
+        list[str]: Unique URLs, in their original order.
+
+    """
+    urls = load(file_path)
+    if not isinstance(urls, list):
+        msg = f"{file_path} is not a JSON list."
+        raise TypeError(msg)
+    return list(dict.fromkeys(urls))
+
+
+async def purge_batch(
+    session: aiohttp.ClientSession,
+    api_url: str,
+    zone_id: str,
+    token: str,
+    urls: list[str],
+) -> bool:
+    """Send a single purge request for a batch of URLs.
+
+    Returns
+    -------
+        bool: True if Cloudflare accepted the purge, False otherwise.
+
+    """
+    try:
+        async with session.post(
+            f"{api_url}/zones/{zone_id}/purge_cache",
+            json={"files": urls},
+            headers={"Authorization": f"Bearer {token}"},
+        ) as response:
+            result = await response.json(content_type=None)
+    except (aiohttp.ClientError, TimeoutError, JSONDecodeError):
+        LOGGER.exception(f"Failed to purge {len(urls)} URL(s).")
+        return False
+
+    if not result.get("success"):
+        LOGGER.error(f"Cloudflare rejected the purge: {result.get('errors')}")
+        return False
+    return True
+
+
+async def purge_urls(
+    urls: list[str],
+    zone_id: str,
+    token: str,
+    api_url: str = CLOUDFLARE_API_URL,
+    batch_size: int = MAX_URLS_PER_REQUEST,
+) -> int:
+    """Purge URLs in batches that respect the per-request limit.
+
+    Args:
+    ----
+        urls (list[str]): URLs to purge.
+        zone_id (str): Cloudflare zone ID.
+        token (str): Cloudflare API token with cache purge permission.
+        api_url (str): Base URL of the Cloudflare API.
+        batch_size (int): Maximum number of URLs per request.
+
+    Returns:
+    -------
+        int: Number of failed batches.
+
+    """
+    failed = 0
+    config = TransportConfig(request_timeout=REQUEST_TIMEOUT)
+    async with create_session(config) as session:
+        for batch in itertools.batched(urls, batch_size, strict=False):
+            if await purge_batch(session, api_url, zone_id, token, list(batch)):
+                LOGGER.info(f"✅ Purged {len(batch)} URL(s)")
+            else:
+                failed += 1
+    return failed
+
+
+def main() -> None:
+    """Purge the changed URLs listed in a JSON file."""
+    bootstrap()
+    parser = argparse.ArgumentParser(description="Purge changed URLs from the CDN.")
+    parser.add_argument(
+        "--urls-file", required=True, help="Path to a JSON list of URLs to purge."
+    )
+    parser.add_argument(
+        "--api-url",
+        default=CLOUDFLARE_API_URL,
+        help=f"Cloudflare API base URL (default: {CLOUDFLARE_API_URL})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=MAX_URLS_PER_REQUEST,
+        help=f"Maximum URLs per request (default: {MAX_URLS_PER_REQUEST})",
+    )
+    args = parser.parse_args()
+
+    zone_id = os.getenv("CF_ZONE_ID")
+    token = os.getenv("CF_API_TOKEN")
+    if not zone_id or not token:
+        LOGGER.error("CF_ZONE_ID and CF_API_TOKEN must be set.")
+        sys.exit(1)
+
+    urls = load_urls(Path(args.urls_file))
+    if not urls:
+        LOGGER.info("✅ Nothing changed, no purge needed.")
+        return
+
+    if run(purge_urls(urls, zone_id, token, args.api_url, args.batch_size)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
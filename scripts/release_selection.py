@@ -1,15 +1,78 @@
 """Shared release selection helpers."""
 
-from typing import Any
+import re
+from collections.abc import Iterable, Sequence
+from typing import Any, Self
+
+SEMVER_REGEX = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"  # major.minor.patch
+    r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"  # optional pre-release
+    r"(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"  # optional build metadata
+)
+
+
+def parse_semver(tag: str) -> tuple[int, int, int] | None:
+    """Return (major, minor, patch) of a `v`-prefixed or bare SemVer tag."""
+    match = SEMVER_REGEX.match(tag.removeprefix("v"))
+    if match is None:
+        return None
+    major, minor, patch = match.groups()[:3]
+    return int(major), int(minor), int(patch)
+
+
+class ReleaseIndex:
+    """Releases indexed once, newest first.
+
+    Holds the latest stable and prerelease tags, the ref to use, the parsed
+    SemVer version of every tag and the newest-N slice, so every later lookup
+    is O(1).
+    """
+
+    __slots__ = (
+        "newest",
+        "prerelease_tag",
+        "releases",
+        "stable_tag",
+        "used_ref",
+        "versions",
+    )
+
+    def __init__(self, releases: Sequence[Any], keep: int | None = None) -> None:
+        """Index releases that are already ordered newest first.
+
+        Args:
+        ----
+            releases: Release objects with `tag_name` and `prerelease`.
+            keep: Size of the `newest` slice, all releases when omitted.
+
+        """
+        self.releases = list(releases)
+        self.newest = self.releases[:keep] if keep is not None else self.releases
+        self.stable_tag: str | None = None
+        self.prerelease_tag: str | None = None
+        self.versions: dict[str, tuple[int, int, int] | None] = {}
+
+        for release in self.releases:
+            tag = release.tag_name
+            if release.prerelease:
+                if self.prerelease_tag is None:
+                    self.prerelease_tag = tag
+            elif self.stable_tag is None:
+                self.stable_tag = tag
+            self.versions[tag] = parse_semver(tag)
+
+        # Prefer the latest stable release, fall back to the latest prerelease
+        self.used_ref: str | None = self.stable_tag or self.prerelease_tag
+
+    @classmethod
+    def from_unsorted(cls, releases: Iterable[Any], keep: int | None = None) -> Self:
+        """Index releases in any order, sorting them by `created_at` first."""
+        return cls(
+            sorted(releases, key=lambda release: release.created_at, reverse=True),
+            keep,
+        )
 
 
 def select_used_ref(releases: list[Any]) -> str:
     """Select the latest stable release, or the latest prerelease as fallback."""
-    sorted_releases = sorted(
-        releases, key=lambda release: release.created_at, reverse=True
-    )
-    latest_stable = next(
-        (release for release in sorted_releases if not release.prerelease), None
-    )
-    selected_release = latest_stable or sorted_releases[0]
-    return selected_release.tag_name
+    return ReleaseIndex.from_unsorted(releases).used_ref
@@ -0,0 +1,242 @@
+"""Persistent cache of repository id to canonical name lookups.
+
+Names are matched case-insensitively and map to the GitHub repository id,
+which survives renames; the id maps to the current canonical `full_name`.
+The metadata generator records every repository it fetches, so PR checks
+usually resolve names from the cache instead of calling the API.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Iterable
+from contextlib import AsyncExitStack
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from aiogithubapi import GitHubAPI, GitHubException, GitHubRatelimitException
+from serialization import JSONDecodeError, dump, load
+from transport import github_client
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = ".cache/repo_identity.json"
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_CONCURRENCY = 16
+
+# Pause all lookups when this few requests are left in the rate-limit window
+RATE_LIMIT_FLOOR = 5
+# Fallback pause when GitHub reports a rate limit without a reset time
+RATE_LIMIT_BACKOFF = 60.0
+RATE_LIMIT_RETRIES = 3
+
+
+class RepoIdentityCache:
+    """On-disk map of repository names to ids and canonical names."""
+
+    def __init__(self, path: str | Path, ttl: float = DEFAULT_TTL) -> None:
+        """Initialize an empty cache backed by `path`."""
+        self.path = Path(path)
+        self.ttl = ttl
+        self.repositories: dict[str, str] = {}
+        self.names: dict[str, tuple[str, float]] = {}
+        self.dirty = False
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create a cache from `REPO_CACHE_FILE` and `REPO_CACHE_TTL`."""
+        return cls(
+            os.getenv("REPO_CACHE_FILE", DEFAULT_CACHE_FILE),
+            float(os.getenv("REPO_CACHE_TTL", str(DEFAULT_TTL))),
+        )
+
+    def load(self) -> Self:
+        """Load the cache from disk; a missing or invalid file starts empty."""
+        if not self.path.exists():
+            return self
+        try:
+            data = load(self.path)
+            self.repositories = dict(data["repositories"])
+            self.names = {
+                name: (repo_id, checked_at)
+                for name, (repo_id, checked_at) in data["names"].items()
+            }
+        except (OSError, JSONDecodeError, KeyError, TypeError, ValueError):
+            LOGGER.warning(f"Ignoring unreadable repository cache: {self.path}")
+            self.repositories, self.names = {}, {}
+        return self
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        dump(
+            self.path,
+            {
+                "repositories": self.repositories,
+                "names": {name: list(entry) for name, entry in self.names.items()},
+            },
+        )
+        self.dirty = False
+
+    def lookup(self, repo: str, now: float | None = None) -> str | None:
+        """Return the canonical name for `repo`, or None if unknown or expired."""
+        entry = self.names.get(repo.lower())
+        if entry is None:
+            return None
+        repo_id, checked_at = entry
+        if (now or time.time()) - checked_at > self.ttl:
+            return None
+        return self.repositories.get(repo_id)
+
+    def record(
+        self,
+        repo_id: int | str,
+        full_name: str,
+        *aliases: str,
+        now: float | None = None,
+    ) -> None:
+        """Store the canonical name of a repository and the names it was seen as.
+
+        Args:
+        ----
+            repo_id: GitHub repository id.
+            full_name: Canonical repository name.
+            aliases: Other names that resolved to this repository.
+            now: Timestamp of the lookup, defaults to the current time.
+
+        """
+        checked_at = now or time.time()
+        self.repositories[str(repo_id)] = full_name
+        for name in (full_name, *aliases):
+            self.names[name.lower()] = (str(repo_id), checked_at)
+        self.dirty = True
+
+
+class RepoResolver:
+    """Resolve canonical repository names from the cache, then from GitHub.
+
+    The GitHub client is opened on the first cache miss and shared by all
+    later lookups. The cache is saved when the resolver is closed.
+    """
+
+    def __init__(
+        self,
+        token: str | None,
+        cache: RepoIdentityCache | None = None,
+        github: GitHubAPI | None = None,
+    ) -> None:
+        """Initialize the resolver."""
+        self.token = token
+        self.cache = cache or RepoIdentityCache.from_env()
+        self.github = github
+        self.hits = 0
+        self.misses = 0
+        self._stack = AsyncExitStack()
+        self._client_lock = asyncio.Lock()
+        self._resume_at = 0.0
+
+    async def __aenter__(self) -> Self:
+        """Load the cache."""
+        self.cache.load()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Save the cache and close the client if the resolver opened it."""
+        self.cache.save()
+        await self._stack.aclose()
+        LOGGER.debug(
+            f"Repository cache: {self.hits} hit(s), {self.misses} API lookup(s)"
+        )
+
+    async def canonical_name(self, repo: str) -> str:
+        """Return the canonical `full_name` of `repo`.
+
+        Raises
+        ------
+            GitHubException: If the repository has to be fetched and that fails.
+
+        """
+        cached = self.cache.lookup(repo)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        github = await self._client()
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await self._wait_for_rate_limit()
+            try:
+                response = await github.repos.get(repo)
+            except GitHubRatelimitException:
+                if attempt == RATE_LIMIT_RETRIES:
+                    raise
+                LOGGER.warning(f"Rate limited while fetching '{repo}', backing off.")
+                self._resume_at = max(self._resume_at, time.time() + RATE_LIMIT_BACKOFF)
+                continue
+            self._track_rate_limit(response)
+            break
+
+        self.cache.record(response.data.id, response.data.full_name, repo)
+        return response.data.full_name
+
+    async def canonical_names(
+        self, repos: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[str | GitHubException]:
+        """Resolve many repositories concurrently.
+
+        Args:
+        ----
+            repos: Repository names to resolve.
+            concurrency: Maximum number of lookups in flight.
+
+        Returns:
+        -------
+            list[str | GitHubException]: Canonical name or the lookup error for
+            each repository, in input order.
+
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def resolve(repo: str) -> str | GitHubException:
+            async with semaphore:
+                try:
+                    return await self.canonical_name(repo)
+                except GitHubException as err:
+                    return err
+
+        return await asyncio.gather(*(resolve(repo) for repo in repos))
+
+    async def _client(self) -> GitHubAPI:
+        """Return the GitHub client, opening it on first use."""
+        async with self._client_lock:
+            if self.github is None:
+                self.github = await self._stack.enter_async_context(
+                    github_client(self.token)
+                )
+        return self.github
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Sleep until the rate-limit window resets, if lookups are paused."""
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _track_rate_limit(self, response: object) -> None:
+        """Pause further lookups when the remaining request budget runs low."""
+        headers = getattr(response, "headers", None)
+        remaining = getattr(headers, "x_ratelimit_remaining", None)
+        reset = getattr(headers, "x_ratelimit_reset", None)
+        if not isinstance(remaining, str) or not isinstance(reset, str):
+            return
+        if int(remaining) <= RATE_LIMIT_FLOOR:
+            LOGGER.warning(f"GitHub rate limit nearly used up, pausing until {reset}.")
+            self._resume_at = max(self._resume_at, float(reset))
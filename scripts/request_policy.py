@@ -0,0 +1,261 @@
+"""Retry, deadline and hedging policy for GitHub API requests.
+
+Every request of a `github_client()` goes through a `PolicySession`:
+
+- each call has an overall deadline that covers all of its attempts, on top
+  of the per-attempt timeout of the session;
+- idempotent GETs are retried on connection errors, timeouts and 5xx
+  responses, with exponential backoff and full jitter;
+- optionally, a GET that is slower than the recent p95 latency gets a second
+  (hedged) request, and whichever answers first wins;
+- retries and hedged requests are only sent while the rate-limit budget
+  reported by GitHub stays above a floor, so they never starve first
+  attempts;
+- concurrent identical GETs (same URL, query and headers) share a single
+  request; every caller parses the shared response on its own.
+
+Settings can be overridden with environment variables (see
+`RequestPolicy.from_env`).
+"""
+
+import asyncio
+import logging
+import os
+import random
+import re
+from collections import deque
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Self
+
+import aiohttp
+
+LOGGER = logging.getLogger(__name__)
+
+RATE_LIMIT_HEADER = "X-RateLimit-Remaining"
+# Latencies kept to estimate the p95 that triggers a hedged request
+LATENCY_WINDOW = 200
+SERVER_ERROR = 500
+# GitHub matches owner and repository names case-insensitively
+REPO_PATH = re.compile(r"/repos/[^/?#]+/[^/?#]+")
+
+
+def request_key(url: str, kwargs: Mapping[str, Any]) -> Hashable:
+    """Return what identifies a GET: its URL, query parameters and headers."""
+    params = kwargs.get("params") or {}
+    headers = kwargs.get("headers") or {}
+    return (
+        REPO_PATH.sub(lambda match: match.group().lower(), str(url)),
+        tuple(sorted((str(key), str(value)) for key, value in params.items())),
+        tuple(sorted((key.lower(), str(value)) for key, value in headers.items())),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RequestPolicy:
+    """Deadlines, retries and hedging for GitHub requests."""
+
+    call_deadline: float = 60.0
+    retries: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 8.0
+    hedge: bool = False
+    hedge_min_samples: int = 20
+    # Retries and hedges stop when this few requests are left in the window
+    budget_floor: int = 100
+    plugin_deadline: float = 180.0
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build a policy from `HTTP_*` environment variables."""
+        defaults = cls()
+        return cls(
+            call_deadline=float(
+                os.getenv("HTTP_CALL_DEADLINE", str(defaults.call_deadline))
+            ),
+            retries=int(os.getenv("HTTP_RETRIES", str(defaults.retries))),
+            hedge=os.getenv("HTTP_HEDGE", "0") == "1",
+            budget_floor=int(
+                os.getenv("HTTP_RETRY_BUDGET_FLOOR", str(defaults.budget_floor))
+            ),
+            plugin_deadline=float(
+                os.getenv("HTTP_PLUGIN_DEADLINE", str(defaults.plugin_deadline))
+            ),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Return the pause before retry `attempt` (0-based), with full jitter."""
+        return random.uniform(  # noqa: S311
+            0, min(self.backoff_cap, self.backoff_base * 2**attempt)
+        )
+
+
+class RateLimitBudget:
+    """Requests left in the rate-limit window, as last reported by GitHub."""
+
+    def __init__(self, floor: int) -> None:
+        """Initialize a budget that keeps `floor` requests for first attempts."""
+        self.floor = floor
+        self.remaining: int | None = None
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Take the remaining requests from a response's headers."""
+        value = headers.get(RATE_LIMIT_HEADER)
+        if value is not None and value.isdigit():
+            self.remaining = int(value)
+
+    def spend(self) -> bool:
+        """Reserve one extra request; False if that would dip below the floor."""
+        if self.remaining is None:
+            return True
+        if self.remaining <= self.floor:
+            return False
+        self.remaining -= 1
+        return True
+
+
+class LatencyTracker:
+    """Recent request latencies, to estimate when a request is slow."""
+
+    def __init__(self, min_samples: int) -> None:
+        """Initialize an empty tracker."""
+        self.min_samples = min_samples
+        self.samples: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def add(self, seconds: float) -> None:
+        """Record the latency of a finished request."""
+        self.samples.append(seconds)
+
+    def p95(self) -> float | None:
+        """Return the 95th percentile, or None with too few samples."""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+
+class PolicySession:
+    """Apply a `RequestPolicy` to the requests of an `aiohttp` session.
+
+    Only `request` is changed; every other attribute is the session's own, so
+    the wrapper can be handed to `GitHubAPI` in place of the session.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        policy: RequestPolicy | None = None,
+    ) -> None:
+        """Initialize the wrapper."""
+        self.session = session
+        self.policy = policy or RequestPolicy.from_env()
+        self.budget = RateLimitBudget(self.policy.budget_floor)
+        self.latency = LatencyTracker(self.policy.hedge_min_samples)
+        self.retried = 0
+        self.hedged = 0
+        self.deduplicated = 0
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped session."""
+        return getattr(self.session, name)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request within the call deadline, retrying GETs.
+
+        The body is read before returning, so the deadline covers it and the
+        response can be parsed later without touching the network. That also
+        lets callers of identical concurrent GETs share one response.
+        """
+        if method.upper() != "GET":
+            async with asyncio.timeout(self.policy.call_deadline):
+                return await self._send(method, url, kwargs)
+
+        key = request_key(url, kwargs)
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._deadline_get(url, kwargs))
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda done: self._land(key, done))
+        else:
+            self.deduplicated += 1
+        # A cancelled caller must not cancel the request of the others
+        return await asyncio.shield(flight)
+
+    def _land(self, key: Hashable, flight: asyncio.Future) -> None:
+        """Forget a finished request so later calls send a new one."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not flight.cancelled():
+            # Mark the error as retrieved when every caller has gone
+            flight.exception()
+
+    async def _deadline_get(self, url: str, kwargs: dict[str, Any]) -> Any:
+        """Send a GET within the call deadline."""
+        async with asyncio.timeout(self.policy.call_deadline):
+            return await self._get(url, kwargs)
+
+    async def _get(self, url: str, kwargs: dict[str, Any]) -> Any:
+        """Send a GET, retrying connection errors, timeouts and 5xx responses."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._attempt(url, kwargs)
+            except (aiohttp.ClientError, TimeoutError) as err:
+                if not self._may_retry(attempt):
+                    raise
+                LOGGER.debug(f"Retrying GET {url} after {err!r}")
+            else:
+                if response.status < SERVER_ERROR or not self._may_retry(attempt):
+                    return response
+                LOGGER.debug(f"Retrying GET {url} after HTTP {response.status}")
+            await asyncio.sleep(self.policy.backoff(attempt))
+            attempt += 1
+
+    def _may_retry(self, attempt: int) -> bool:
+        """Return whether another attempt is allowed, and count it if so."""
+        if attempt >= self.policy.retries or not self.budget.spend():
+            return False
+        self.retried += 1
+        return True
+
+    async def _attempt(self, url: str, kwargs: dict[str, Any]) -> Any:
+        """Send one attempt, hedged when it is slower than the recent p95."""
+        delay = self.latency.p95() if self.policy.hedge else None
+        if delay is None:
+            return await self._send("GET", url, kwargs)
+
+        tasks = [asyncio.ensure_future(self._send("GET", url, kwargs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self.budget.spend():
+                return await tasks[0]
+            self.hedged += 1
+            tasks.append(asyncio.ensure_future(self._send("GET", url, kwargs)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            # Both requests failed, report the first one's error
+            return tasks[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send(self, method: str, url: str, kwargs: dict[str, Any]) -> Any:
+        """Send a single request and read its body."""
+        start = perf_counter()
+        response = await self.session.request(method, url, **kwargs)
+        try:
+            await response.read()
+        except BaseException:
+            response.release()
+            raise
+        self.latency.add(perf_counter() - start)
+        self.budget.update(response.headers)
+        return response
@@ -0,0 +1,152 @@
+r"""Validate registry files and plugin manifests against the JSON schemas.
+
+Each schema in `tools/jsonschema` is loaded once into a `jsonschema` draft-07
+validator. Results are cached by the SHA-256 of the document bytes, so
+unchanged files and manifests are only validated once per process.
+
+Patterns in the schemas spell out character classes such as `[A-Za-z0-9_]`
+instead of `\w`, so Python and ECMA regular expressions agree on them.
+
+Usage: python scripts/schema_validation.py [file:schema ...]
+"""
+
+import argparse
+import hashlib
+import logging
+import sys
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from bootstrap import bootstrap
+from jsonschema import Draft7Validator
+from serialization import JSONDecodeError, load, loads
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA_DIR = Path(__file__).resolve().parents[1] / "tools" / "jsonschema"
+# Registry files and the schema each one is validated against
+REGISTRY_SCHEMAS = {
+    "plugins.json": "repositories",
+    "removed.json": "removed",
+    "categories.json": "categories",
+}
+
+
+class SchemaValidator:
+    """A schema validator with results cached by document content hash."""
+
+    def __init__(self, name: str, schema: dict[str, Any]) -> None:
+        """Check and load the schema.
+
+        Args:
+        ----
+            name: Schema name, used in log messages.
+            schema: The JSON schema.
+
+        Raises:
+        ------
+            jsonschema.SchemaError: If the schema itself is invalid.
+
+        """
+        Draft7Validator.check_schema(schema)
+        self.name = name
+        self._validator = Draft7Validator(schema)
+        self._results: dict[str, tuple[str, ...]] = {}
+
+    def validate(self, data: Any) -> list[str]:
+        """Validate already decoded data without caching.
+
+        Errors are ordered by the path of the offending value and prefixed
+        with it, e.g. `$[1].repository: 1 is not of type 'string'`.
+        """
+        errors = sorted(
+            self._validator.iter_errors(data),
+            key=lambda error: (error.json_path, error.message),
+        )
+        return [f"{error.json_path}: {error.message}" for error in errors]
+
+    def validate_bytes(self, content: bytes, data: Any = None) -> tuple[str, ...]:
+        """Validate a JSON document, reusing the result for identical content.
+
+        Args:
+        ----
+            content: The raw document.
+            data: The decoded document, if the caller already has it.
+
+        Returns:
+        -------
+            tuple[str, ...]: Error messages, empty if the document is valid.
+
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        if digest not in self._results:
+            self._results[digest] = tuple(
+                self.validate(loads(content) if data is None else data)
+            )
+        return self._results[digest]
+
+
+@cache
+def get_validator(name: str) -> SchemaValidator:
+    """Return the validator for `tools/jsonschema/<name>.schema.json`."""
+    return SchemaValidator(name, load(SCHEMA_DIR / f"{name}.schema.json"))
+
+
+def validate_files(files: Iterable[tuple[str | Path, str]]) -> int:
+    """Validate a batch of files, logging every problem found.
+
+    Args:
+    ----
+        files: Pairs of file path and schema name.
+
+    Returns:
+    -------
+        int: The number of files with errors.
+
+    """
+    failed = 0
+    for file_path, schema_name in files:
+        try:
+            errors = get_validator(schema_name).validate_bytes(
+                Path(file_path).read_bytes()
+            )
+        except (OSError, JSONDecodeError) as err:
+            errors = (f"Unable to read {file_path}: {err}",)
+        if errors:
+            failed += 1
+            for error in errors:
+                LOGGER.error(f"{file_path} ({schema_name}): {error}")
+        else:
+            LOGGER.info(f"✅ {file_path} matches the {schema_name} schema.")
+    return failed
+
+
+def parse_pair(value: str) -> tuple[str, str]:
+    """Parse a `file:schema` command line argument."""
+    file_path, _, schema_name = value.rpartition(":")
+    if not file_path:
+        msg = f"expected file:schema, got '{value}'"
+        raise argparse.ArgumentTypeError(msg)
+    return file_path, schema_name
+
+
+def main() -> None:
+    """Entry point for the schema validation script."""
+    bootstrap(env=False)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "files",
+        nargs="*",
+        type=parse_pair,
+        help="Files to validate as file:schema (default: all registry files)",
+    )
+    args = parser.parse_args()
+
+    if validate_files(args.files or REGISTRY_SCHEMAS.items()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
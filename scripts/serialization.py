@@ -0,0 +1,76 @@
+"""Shared JSON serialization with a fast backend.
+
+`orjson` is used when it is installed, the standard library otherwise. Both
+backends write UTF-8 with two-space indentation and non-ASCII characters
+as-is, and the output of one decodes to the same data with the other. The
+bytes are the same for the registry's own data (strings, 64-bit integers,
+booleans and plain floats, checked against `data.json` by the tests), but
+not in general:
+
+- floats with an exponent: orjson writes `1e-7`, the standard library `1e-07`;
+- NaN and infinities: orjson writes `null`, the standard library `NaN`;
+- integers wider than 64 bits, which orjson cannot encode: `dumps` falls back
+  to the standard library for them.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps_stdlib(data: Any) -> bytes:
+    """Encode data with the standard library (the reference format)."""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(data: Any) -> bytes:
+    """Encode data to canonical, indented JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits; unsupported types fail again below
+            pass
+    return dumps_stdlib(data)
+
+
+def dumps_line(data: Any) -> bytes:
+    """Encode data to compact JSON bytes on a single line, for JSON lines files."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or a string."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(path: str | Path) -> Any:
+    """Read and decode a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def dump(path: str | Path, data: Any, *, trailing_newline: bool = False) -> None:
+    """Encode data and write it to a JSON file."""
+    payload = dumps(data)
+    if trailing_newline:
+        payload += b"\n"
+    Path(path).write_bytes(payload)
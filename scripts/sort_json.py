@@ -4,21 +4,61 @@ import argparse
 import difflib
 import json
 import logging
+import os
 import sys
+from collections.abc import Iterable
+from logging.handlers import QueueHandler
 from pathlib import Path
+from queue import SimpleQueue
+from typing import Any
+
+from bootstrap import bootstrap
+from serialization import JSONDecodeError, dump, dumps, load
 
-# Loggin setup
-logging.addLevelName(logging.INFO, "")
-logging.addLevelName(logging.ERROR, "::error::")
-logging.addLevelName(logging.WARNING, "::warning::")
-logging.basicConfig(
-    level=logging.INFO,
-    format=" %(levelname)s %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
 LOGGER = logging.getLogger(__name__)
 
 
+# Items of context shown around the first out-of-order item in a diff
+DIFF_CONTEXT = 3
+# Without --jobs, a process pool only pays off for many or large files;
+# starting one costs more than sorting the two registry files
+PARALLEL_MIN_FILES = 8
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def sort_key(value: Any) -> str:
+    """Return the sort key of a list item or dict key."""
+    return value.casefold() if isinstance(value, str) else json.dumps(value)
+
+
+def first_unsorted_index(items: Iterable[Any]) -> int | None:
+    """Return the index of the first item that sorts before its predecessor.
+
+    Works in a single pass without copying; each key is computed once.
+    """
+    previous = None
+    for index, item in enumerate(items):
+        key = sort_key(item)
+        if previous is not None and key < previous:
+            return index
+        previous = key
+    return None
+
+
+def unsorted_region_diff(file_path: Path, data: list, index: int) -> str:
+    """Build a diff for the region around the first out-of-order item only."""
+    start = max(0, index - 1 - DIFF_CONTEXT)
+    region = data[start : index + 1 + DIFF_CONTEXT]
+    diff = difflib.unified_diff(
+        dumps(region).decode("utf-8").splitlines(),
+        dumps(sorted(region, key=sort_key)).decode("utf-8").splitlines(),
+        fromfile=f"{file_path} (original, items {start + 1}-{start + len(region)})",
+        tofile=f"{file_path} (sorted)",
+        lineterm="",
+    )
+    return "\n".join(diff)
+
+
 def sort_json(
     file_path: Path,
     check_only: bool = False,  # noqa: FBT001, FBT002
@@ -30,6 +70,7 @@ def sort_json(
     ----
         file_path (Path): Path to the JSON file.
         check_only (bool): Check if the file is sorted only.
+        show_diff (bool): Log a diff of the first unsorted region.
 
     Returns:
     -------
@@ -37,47 +78,30 @@ def sort_json(
 
     """
     try:
-        with Path.open(file_path) as file:
-            data = json.load(file)
+        data = load(file_path)
 
         # Check if on list or dict
-        if isinstance(data, list):
-            sorted_data = sorted(
-                data,
-                key=lambda x: x.casefold() if isinstance(x, str) else json.dumps(x),
-            )
-        elif isinstance(data, dict):
-            sorted_data = {k: data[k] for k in sorted(data, key=str.casefold)}
-        else:
+        if not isinstance(data, list | dict):
             LOGGER.warning(
                 f"⚠️ Invalid format in {file_path}: Only lists and dicts are supported."
             )
             return False
 
-        # Write the sorted data back to the file
-        if data != sorted_data:
+        # Only lists are sorted; dicts are accepted in any key order
+        index = first_unsorted_index(data) if isinstance(data, list) else None
+        if index is not None:
             if check_only:
                 LOGGER.error(f"❌ {file_path} is not sorted.")
                 if show_diff:
-                    original = json.dumps(data, indent=2).splitlines()
-                    new = json.dumps(sorted_data, indent=2).splitlines()
-                    diff = difflib.unified_diff(
-                        original,
-                        new,
-                        fromfile=f"{file_path} (original)",
-                        tofile=f"{file_path} (sorted)",
-                        lineterm="",
-                    )
-                    diff_output = "\n".join(diff)
+                    diff_output = unsorted_region_diff(file_path, data, index)
                     if diff_output.strip():
                         LOGGER.info(f"🔍 Diff for {file_path}\n{diff_output}\n")
                 return False
-            with Path.open(file_path, "w") as file:
-                json.dump(sorted_data, file, indent=2)
-                file.write("\n")  # Add newline at the end of the file
+            # Write the sorted data back to the file
+            dump(file_path, sorted(data, key=sort_key), trailing_newline=True)
             LOGGER.info(f"🧹 {file_path} has been sorted.")
             return True
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         LOGGER.exception(f"❌ Invalid JSON in {file_path}")
         return False
     except Exception:
@@ -88,8 +112,96 @@ def sort_json(
         return True
 
 
+def sort_json_worker(
+    file_path: Path,
+    check_only: bool,  # noqa: FBT001
+    show_diff: bool,  # noqa: FBT001
+) -> tuple[bool, list[logging.LogRecord]]:
+    """Run `sort_json` in a worker process and return its log records.
+
+    The records are replayed by the parent so output stays in file order.
+    """
+    records: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    handler = QueueHandler(records)
+    LOGGER.addHandler(handler)
+    LOGGER.propagate = False
+    try:
+        result = sort_json(file_path, check_only=check_only, show_diff=show_diff)
+    finally:
+        LOGGER.removeHandler(handler)
+        LOGGER.propagate = True
+    collected = []
+    while not records.empty():
+        collected.append(records.get())
+    return result, collected
+
+
+def worker_count(files: list[Path], jobs: int | None) -> int:
+    """Return the number of worker processes to use for `files`.
+
+    An explicit `jobs` is used as given. Otherwise files are processed in
+    this process, unless there are many of them or they are large.
+    """
+    if jobs is not None:
+        return jobs
+    if len(files) >= PARALLEL_MIN_FILES or (
+        sum(path.stat().st_size for path in files) >= PARALLEL_MIN_BYTES
+    ):
+        return os.cpu_count() or 1
+    return 1
+
+
+def process_files(
+    files: list[Path],
+    check_only: bool = False,  # noqa: FBT001, FBT002
+    show_diff: bool = False,  # noqa: FBT001, FBT002
+    jobs: int | None = None,
+) -> bool:
+    """Process files, in a process pool when more than one worker is used.
+
+    Args:
+    ----
+        files (list[Path]): JSON files to process.
+        check_only (bool): Check if the files are sorted only.
+        show_diff (bool): Log a diff of the first unsorted region.
+        jobs (int | None): Number of worker processes, chosen from the number
+            and size of the files when omitted.
+
+    Returns:
+    -------
+        bool: True if every file is sorted (or has been sorted).
+
+    """
+    jobs = worker_count(files, jobs)
+    if jobs <= 1 or len(files) <= 1:
+        # Process every file, even after the first failure
+        results = [
+            sort_json(path, check_only=check_only, show_diff=show_diff)
+            for path in files
+        ]
+        return all(results)
+
+    # Only pay for the process pool machinery when it is actually used
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as pool:
+        outcomes = pool.map(
+            sort_json_worker,
+            files,
+            [check_only] * len(files),
+            [show_diff] * len(files),
+        )
+        all_sorted = True
+        for result, records in outcomes:
+            for record in records:
+                LOGGER.handle(record)
+            all_sorted = all_sorted and result
+    return all_sorted
+
+
 def main() -> None:
     """Fetch arguments and process JSON files."""
+    bootstrap(env=False)
     parser = argparse.ArgumentParser(description="Sort JSON files.")
     parser.add_argument("files", nargs="+", help="JSON files to process")
     parser.add_argument(
@@ -100,20 +212,28 @@ def main() -> None:
         action="store_true",
         help="Show diff when files are not sorted (only with --check)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help=(
+            "Number of worker processes (default: one, or the CPU count for "
+            f"{PARALLEL_MIN_FILES}+ files or {PARALLEL_MIN_BYTES // 2**20}+ MiB)"
+        ),
+    )
     args = parser.parse_args()
 
     all_sorted = True
-
+    existing = []
     for file in args.files:
         file_path = Path(file)
         if not file_path.exists():
             LOGGER.error(f"❌ File not found: {file}")
             all_sorted = False
             continue
+        existing.append(file_path)
 
-        result = sort_json(file_path, check_only=args.check, show_diff=args.diff)
-        if not result:
-            all_sorted = False
+    if not process_files(existing, args.check, args.diff, args.jobs):
+        all_sorted = False
 
     if not all_sorted:
         sys.exit(1)
@@ -0,0 +1,185 @@
+"""Shared HTTP transport for the generator and the check scripts.
+
+All GitHub traffic goes through one pooled `aiohttp` session with keep-alive,
+a DNS cache and per-request timeouts, and through the deadline, retry and
+hedging policy of `request_policy`. Settings can be overridden with
+environment variables (see `TransportConfig.from_env`).
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+from aiogithubapi import (
+    GitHubAPI,
+    GitHubConnectionException,
+    GitHubException,
+    GitHubRatelimitException,
+)
+from request_policy import PolicySession
+
+LOGGER = logging.getLogger(__name__)
+
+CLIENT_NAME = "rh-community-plugins"
+
+# aiogithubapi raises a plain GitHubException with the body's message on 5xx
+SERVER_ERROR_MESSAGES = (
+    "server error",
+    "bad gateway",
+    "service unavailable",
+    "gateway timeout",
+)
+
+_SHARED_SESSION: ContextVar[aiohttp.ClientSession | None] = ContextVar(
+    "shared_session", default=None
+)
+# GitHub clients in a shared session also share retry budget and latencies
+_SHARED_POLICY: ContextVar[PolicySession | None] = ContextVar(
+    "shared_policy", default=None
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TransportConfig:
+    """Connection pool and request settings."""
+
+    pool_size: int = 64
+    pool_size_per_host: int = 32
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    connect_timeout: float = 10.0
+    request_timeout: int = 20
+    compression: bool = True
+    use_uvloop: bool = False
+    base_url: str | None = None
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        """Build a config from `HTTP_*` and `USE_UVLOOP` environment variables."""
+        defaults = cls()
+        return cls(
+            pool_size=int(os.getenv("HTTP_POOL_SIZE", str(defaults.pool_size))),
+            pool_size_per_host=int(
+                os.getenv("HTTP_POOL_SIZE_PER_HOST", str(defaults.pool_size_per_host))
+            ),
+            request_timeout=int(
+                os.getenv("HTTP_TIMEOUT", str(defaults.request_timeout))
+            ),
+            compression=os.getenv("HTTP_COMPRESSION", "1") != "0",
+            use_uvloop=os.getenv("USE_UVLOOP", "0") == "1",
+        )
+
+
+def is_transient(error: BaseException) -> bool:
+    """Return whether a failed GitHub call is worth retrying later.
+
+    Connection errors, timeouts, rate limits and server errors are transient;
+    a missing repository or an invalid payload is not.
+    """
+    if isinstance(
+        error,
+        GitHubConnectionException
+        | GitHubRatelimitException
+        | aiohttp.ClientError
+        | TimeoutError,
+    ):
+        return True
+    if isinstance(error.__cause__, aiohttp.ClientError | TimeoutError):
+        return True
+    return type(error) is GitHubException and any(
+        message in str(error).lower() for message in SERVER_ERROR_MESSAGES
+    )
+
+
+def create_session(
+    config: TransportConfig,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+) -> aiohttp.ClientSession:
+    """Create a pooled client session for the given config."""
+    connector = aiohttp.TCPConnector(
+        limit=config.pool_size,
+        limit_per_host=config.pool_size_per_host,
+        keepalive_timeout=config.keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=config.dns_cache_ttl,
+    )
+    headers = {} if config.compression else {"Accept-Encoding": "identity"}
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(
+            total=config.request_timeout, sock_connect=config.connect_timeout
+        ),
+        trace_configs=trace_configs,
+    )
+
+
+@asynccontextmanager
+async def shared_session(
+    config: TransportConfig | None = None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Share one pooled session with every `github_client()` opened inside."""
+    async with create_session(config or TransportConfig.from_env()) as session:
+        reset_token = _SHARED_SESSION.set(session)
+        reset_policy = _SHARED_POLICY.set(PolicySession(session))
+        try:
+            yield session
+        finally:
+            _SHARED_POLICY.reset(reset_policy)
+            _SHARED_SESSION.reset(reset_token)
+
+
+@asynccontextmanager
+async def github_client(
+    token: str | None,
+    config: TransportConfig | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> AsyncIterator[GitHubAPI]:
+    """Yield a GitHubAPI client that uses the shared transport.
+
+    Args:
+    ----
+        token: GitHub token.
+        config: Transport settings, read from the environment when omitted.
+        session: Existing session to reuse; it is not closed on exit. Defaults
+            to the session of an enclosing `shared_session()`.
+
+    """
+    config = config or TransportConfig.from_env()
+    policy_session = PolicySession(session) if session else _SHARED_POLICY.get()
+    kwargs: dict[str, Any] = {
+        "client_name": CLIENT_NAME,
+        "timeout": config.request_timeout,
+    }
+    if config.base_url:
+        kwargs["base_url"] = config.base_url
+
+    if policy_session is not None:
+        async with GitHubAPI(token=token, session=policy_session, **kwargs) as github:
+            yield github
+        return
+
+    async with (
+        create_session(config) as own_session,
+        GitHubAPI(token=token, session=PolicySession(own_session), **kwargs) as github,
+    ):
+        yield github
+
+
+def run(main: Coroutine[Any, Any, Any], config: TransportConfig | None = None) -> Any:
+    """Run a coroutine, on uvloop when it is enabled and installed."""
+    config = config or TransportConfig.from_env()
+    if config.use_uvloop:
+        try:
+            import uvloop  # noqa: PLC0415
+        except ImportError:
+            LOGGER.warning("USE_UVLOOP is set but uvloop is not installed.")
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
@@ -59,10 +59,7 @@ class MockReleaseAsset:
     download_count: int | None = None
 
 
-def create_mock_repos(
-    mock_repos_releases: MagicMock,
-    mock_repos_contents: MagicMock,
-) -> MagicMock:
+def create_mock_repos(mock_repos_contents: MagicMock) -> MagicMock:
     """Create a mock GitHubAPI.repos object."""
     mock = MagicMock()
     # Simulate the GitHubAPI.repos.get method
@@ -80,50 +77,69 @@ def create_mock_repos(
         ),
         etag="mock_repo_etag",
     )
-    mock.releases = MagicMock()
-    mock.releases.list = mock_repos_releases
     mock.contents = MagicMock()
     mock.contents.get = mock_repos_contents
     return mock
 
 
+@pytest.fixture(autouse=True)
+def repo_cache_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the repository identity cache out of the working directory."""
+    path = tmp_path / "cache" / "repo_identity.json"
+    monkeypatch.setenv("REPO_CACHE_FILE", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def journal_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the checkpoint journal out of the working directory."""
+    path = tmp_path / "cache" / "journal.jsonl"
+    monkeypatch.setenv("JOURNAL_FILE", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def history_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the metric history out of the working directory."""
+    path = tmp_path / "history"
+    monkeypatch.setenv("HISTORY_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def schedule_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the refresh schedule out of the working directory."""
+    path = tmp_path / "cache" / "schedule.json"
+    monkeypatch.setenv("SCHEDULE_FILE", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def zip_cache_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the zip listing cache out of the working directory.
+
+    Zip inspection is disabled, as the fixture assets are not downloadable;
+    tests that cover it pass their own inspector.
+    """
+    path = tmp_path / "cache" / "zip_listings.json"
+    monkeypatch.setenv("ZIP_CACHE_FILE", str(path))
+    monkeypatch.setenv("ZIP_INSPECTION", "0")
+    return path
+
+
 @pytest.fixture
-def mock_repos_releases() -> MagicMock:
-    """Fixture to mock the GitHubAPI.repos.releases.list method."""
-
-    async def list_releases(repo_name: str) -> MockGitHubResponse:
-        """Return a list of releases."""
-        release_data = load_fixture("releases_data.json")
-        releases_list = []
-        for item in release_data:
-            created_at = datetime.strptime(
-                item["created_at"], "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=UTC)
-            published_at = datetime.strptime(
-                item["published_at"], "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=UTC)
-            assets = [
-                MockReleaseAsset(
-                    name=asset["name"],
-                    browser_download_url=asset["browser_download_url"],
-                    digest=asset.get("digest"),
-                    size=asset.get("size"),
-                    download_count=asset.get("download_count"),
-                )
-                for asset in item.get("assets", [])
-            ]
-            releases_list.append(
-                MockRelease(
-                    tag_name=item["tag_name"],
-                    prerelease=item["prerelease"],
-                    created_at=created_at,
-                    published_at=published_at,
-                    assets=assets,
-                )
+def mock_generic() -> MagicMock:
+    """Fixture to mock the GitHubAPI.generic method (raw API payloads)."""
+
+    async def generic(endpoint: str, **_kwargs: Any) -> MockGitHubResponse:
+        """Return the raw payload for an endpoint."""
+        if endpoint.endswith("/releases"):
+            return MockGitHubResponse(
+                data=load_fixture("releases_data.json"), etag="mock_releases_etag"
             )
-        return MockGitHubResponse(data=releases_list, etag="mock_releases_etag")
+        return MockGitHubResponse(data=None, etag=None)
 
-    return AsyncMock(side_effect=list_releases)
+    return AsyncMock(side_effect=generic)
 
 
 @pytest.fixture
@@ -168,27 +184,25 @@ def plugins_file(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def mock_repos(
-    mock_repos_releases: MagicMock,
-    mock_repos_contents: MagicMock,
-) -> MagicMock:
+def mock_repos(mock_repos_contents: MagicMock) -> MagicMock:
     """Fixture to mock the GitHubAPI.repos object."""
-    return create_mock_repos(mock_repos_releases, mock_repos_contents)
+    return create_mock_repos(mock_repos_contents)
 
 
 @pytest.fixture
 def mock_github(
     monkeypatch: pytest.MonkeyPatch,
-    mock_repos_releases: MagicMock,
+    mock_generic: MagicMock,
     mock_repos_contents: MagicMock,
 ) -> MagicMock:
     """Mock GitHubAPI for testing."""
-    mock_repos_obj = create_mock_repos(mock_repos_releases, mock_repos_contents)
+    mock_repos_obj = create_mock_repos(mock_repos_contents)
 
     class MockGitHubAPIForTest:
         def __init__(self, token: str | None = None) -> None:
             self.token = token
             self.repos = mock_repos_obj
+            self.generic = mock_generic
             self._session = None  # Mock internal session (not used in tests)
 
         async def __aenter__(self) -> MagicMock:
@@ -0,0 +1,99 @@
+"""Tests for the registry audit command."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import audit
+import pytest
+from repo_identity import RepoIdentityCache
+
+from .conftest import MockGitHubResponse, MockRepo
+
+
+async def test_audit_plugin_passes_valid_plugin(mock_github: AsyncMock) -> None:
+    """A valid plugin passes every check."""
+    result, _ = await audit.audit_plugin(mock_github, "owner/repo", set())
+
+    assert result.passed
+    assert result.used_ref == "v1.0.1"
+    assert all(result.checks.values())
+
+
+async def test_audit_plugin_reports_problems(mock_github: AsyncMock) -> None:
+    """Renamed and removed plugins fail without stopping the other checks."""
+    result, _ = await audit.audit_plugin(mock_github, "Owner/Old", {"owner/old"})
+
+    assert not result.passed
+    assert result.canonical == "owner/repo"
+    assert result.checks["name"] is False
+    assert result.checks["not_removed"] is False
+    assert result.checks["manifest"] is True
+
+
+async def test_audit_plugin_stops_after_missing_repository(
+    mock_github: AsyncMock,
+) -> None:
+    """Checks that depend on the repository are left unset."""
+    mock_github.repos.get.return_value = MockGitHubResponse(
+        data=MockRepo(full_name="owner/repo", archived=True, id=1)
+    )
+
+    result, _ = await audit.audit_plugin(mock_github, "owner/repo", set())
+
+    assert result.checks["repository"] is False
+    assert result.checks["release"] is None
+    assert "Repository is archived." in result.messages
+
+
+async def test_audit_registry_writes_report(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_github: AsyncMock,
+    repo_cache_file: Path,
+) -> None:
+    """The report keeps the plugins.json order and warms the identity cache."""
+
+    class SharedClient:
+        def __init__(self, _token: str | None) -> None:
+            pass
+
+        async def __aenter__(self) -> AsyncMock:
+            return mock_github
+
+        async def __aexit__(self, *_args: object) -> None:
+            pass
+
+    monkeypatch.setattr(audit, "github_client", SharedClient)
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+
+    # removed.json keeps names as listed, in any letter case
+    results = await audit.audit_registry(
+        ["owner/repo", "Owner/Old"], {"OWNER/old"}, "token", concurrency=1
+    )
+    audit.write_outputs(results, str(tmp_path))
+
+    report = json.loads((tmp_path / "audit.json").read_text(encoding="utf-8"))
+    assert [p["repository"] for p in report["plugins"]] == ["owner/repo", "Owner/Old"]
+    assert report["failed_plugins"] == ["Owner/Old"]
+    assert [p["checks"]["not_removed"] for p in report["plugins"]] == [True, False]
+
+    markdown = (tmp_path / "audit.md").read_text(encoding="utf-8")
+    assert "| `owner/repo` | v1.0.1 | ✅ | ✅ |" in markdown
+    assert "1 of 2 plugins passed all checks." in markdown
+
+    assert RepoIdentityCache(repo_cache_file).load().lookup("owner/old") == (
+        "owner/repo"
+    )
+
+
+def test_audit_result_as_dict_is_serialisable() -> None:
+    """Unset checks are reported as null."""
+    result = audit.AuditResult("owner/repo")
+    result.checks["repository"] = False
+
+    data = json.loads(json.dumps(result.as_dict()))
+
+    assert data["passed"] is False
+    assert data["checks"]["release"] is None
+    assert list(data["checks"]) == list(audit.CHECKS)
@@ -0,0 +1,53 @@
+"""Tests for the shared entry point bootstrap."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from bootstrap import bootstrap, load_env, setup_logging
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_const_has_no_side_effects(tmp_path: Path) -> None:
+    """Importing const neither creates directories nor configures logging."""
+    code = (
+        "import logging, const\n"
+        "assert not logging.getLogger().handlers\n"
+        "assert not __import__('pathlib').Path('output').exists()\n"
+    )
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        check=True,
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(ROOT / "metadata")},
+    )
+
+
+def test_settings_are_read_on_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Environment settings loaded after import are still picked up."""
+    import const  # noqa: PLC0415
+
+    monkeypatch.setenv("PUBLIC_BASE_URL", "https://example.com/plugin")
+    monkeypatch.setenv("GITHUB_TOKEN", "late-token")
+
+    assert const.PUBLIC_BASE_URL == "https://example.com/plugin"
+    assert const.GITHUB_TOKEN == "late-token"  # noqa: S105
+    with pytest.raises(AttributeError):
+        _ = const.MISSING
+
+
+def test_bootstrap_is_idempotent(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Calling bootstrap from nested entry points configures things once."""
+    calls: list[str] = []
+    monkeypatch.setattr("logging.basicConfig", lambda **_: calls.append("logging"))
+    monkeypatch.setattr("dotenv.load_dotenv", lambda: calls.append("env"))
+    load_env.cache_clear()
+    setup_logging.cache_clear()
+
+    bootstrap()
+    bootstrap()
+    bootstrap(env=False)
+
+    assert calls == ["env", "logging"]
@@ -0,0 +1,145 @@
+"""Tests for scripts/check_all.py."""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import check_preflight
+import check_releases
+import pytest
+
+TEST_GITHUB_TOKEN = "test-token"  # noqa: S105
+
+
+def load_script_module() -> ModuleType:
+    """Load the check_all script as a module for testing."""
+    script_path = Path(__file__).resolve().parents[1] / "scripts" / "check_all.py"
+    spec = importlib.util.spec_from_file_location("check_all_module", script_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+async def test_added_repository_runs_dependent_checks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An added repository runs the add-only checks and writes the outputs."""
+    module = load_script_module()
+    repository = "owner/new"
+    github_output = tmp_path / "github_output"
+    released = []
+
+    async def fake_validate_repo_name(repo: str, _resolver: object) -> None:
+        assert repo == repository
+
+    async def fake_get_used_ref(repo: str, token: str) -> str:
+        assert token == TEST_GITHUB_TOKEN
+        return "v1.0.0"
+
+    async def fake_check_releases(repo: str, token: str) -> None:
+        released.append(repo)
+
+    async def fake_canonical_names(*_args: object) -> int:
+        return 0
+
+    monkeypatch.setenv("GITHUB_TOKEN", TEST_GITHUB_TOKEN)
+    monkeypatch.setenv("GITHUB_OUTPUT", str(github_output))
+    monkeypatch.setattr(check_preflight, "validate_repo_name", fake_validate_repo_name)
+    monkeypatch.setattr(check_preflight, "get_used_ref", fake_get_used_ref)
+    monkeypatch.setattr(check_releases, "check_releases", fake_check_releases)
+    monkeypatch.setattr(
+        module.check_categories,
+        "validate_canonical_repository_names",
+        fake_canonical_names,
+    )
+
+    registry = module.Registry(
+        old_plugins={"owner/old"},
+        plugins={"owner/old", repository},
+        categorized={"owner/old"},
+        removed={repository},
+    )
+    results = await module.run_checks(registry, TEST_GITHUB_TOKEN)
+
+    assert results == {
+        "categories sync": False,
+        "canonical names": True,
+        "preflight": True,
+        "category assignment": False,
+        "releases": True,
+        "removed": False,
+    }
+    assert released == [repository]
+    assert github_output.read_text(encoding="utf-8").splitlines() == [
+        f"repository={repository}",
+        "action=add",
+        "ref=v1.0.0",
+    ]
+
+
+async def test_failed_preflight_skips_dependent_checks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A preflight failure still reports the independent checks."""
+    module = load_script_module()
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+
+    registry = module.Registry(
+        old_plugins=set(),
+        plugins={"owner/a", "owner/b"},
+        categorized={"owner/a", "owner/b"},
+        removed=set(),
+    )
+    results = await module.run_checks(registry, None)
+
+    assert results == {"categories sync": True, "preflight": False}
+
+
+def test_load_registry_reads_removed_entries(tmp_path: Path) -> None:
+    """The published removed list is read with names as listed."""
+    module = load_script_module()
+    (tmp_path / "plugins_old.json").write_text("[]", encoding="utf-8")
+    (tmp_path / "plugins.json").write_text('["owner/a"]', encoding="utf-8")
+    (tmp_path / "categories.json").write_text(
+        '{"Utilities": ["owner/a"]}', encoding="utf-8"
+    )
+    (tmp_path / "removed_published.json").write_text('["Owner/Gone"]', encoding="utf-8")
+    args = module.argparse.Namespace(
+        old_plugins_file=tmp_path / "plugins_old.json",
+        plugins_file=tmp_path / "plugins.json",
+        categories_file=tmp_path / "categories.json",
+        removed_file=tmp_path / "removed_published.json",
+    )
+
+    registry = module.load_registry(args)
+
+    assert registry.plugins == {"owner/a"}
+    assert registry.categorized == {"owner/a"}
+    assert registry.removed == {"Owner/Gone"}
+
+
+async def test_unexpected_error_fails_only_its_check(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A check that raises is reported as failed and the others still run."""
+    module = load_script_module()
+
+    def broken_sync(*_args: object) -> int:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+    monkeypatch.setattr(
+        module.check_categories, "validate_categories_plugins_sync", broken_sync
+    )
+    registry = module.Registry(
+        old_plugins=set(),
+        plugins={"owner/a", "owner/b"},
+        categorized={"owner/a", "owner/b"},
+        removed=set(),
+    )
+
+    results = await module.run_checks(registry, None)
+
+    assert results == {"categories sync": False, "preflight": False}
@@ -9,6 +9,7 @@ from typing import Self
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import repo_identity
 
 
 def load_script_module() -> ModuleType:
@@ -46,7 +47,7 @@ async def test_check_canonical_repository_names_reports_renamed_repo(
 
     mock_repos = MagicMock()
     mock_repos.get = AsyncMock(
-        return_value=MagicMock(data=MagicMock(full_name=canonical_repository))
+        return_value=MagicMock(data=MagicMock(id=42, full_name=canonical_repository))
     )
 
     class MockGitHubAPI:
@@ -61,7 +62,7 @@ async def test_check_canonical_repository_names_reports_renamed_repo(
             return None
 
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-    monkeypatch.setattr(module, "GitHubAPI", MockGitHubAPI)
+    monkeypatch.setattr(repo_identity, "github_client", MockGitHubAPI)
 
     with caplog.at_level(logging.ERROR):
         errors = await module.check_canonical_repository_names(
@@ -5,6 +5,7 @@ import json
 import logging
 from pathlib import Path
 from types import ModuleType
+from typing import Any, Self
 
 import pytest
 
@@ -34,7 +35,7 @@ async def test_async_main_outputs_release_ref_for_added_repository(
     (tmp_path / "plugins_old.json").write_text("[]", encoding="utf-8")
     (tmp_path / "plugins.json").write_text(json.dumps([repository]), encoding="utf-8")
 
-    async def fake_validate_repo_name(repo: str) -> None:
+    async def fake_validate_repo_name(repo: str, _resolver: object) -> None:
         assert repo == repository
 
     async def fake_get_used_ref(repo: str, token: str) -> str:
@@ -74,8 +75,8 @@ async def test_async_main_accepts_repository_rename(
     (tmp_path / "plugins_old.json").write_text(json.dumps([old_repo]), encoding="utf-8")
     (tmp_path / "plugins.json").write_text(json.dumps([new_repo]), encoding="utf-8")
 
-    async def fake_get_canonical_repo_name(repository: str, token: str) -> str:
-        assert token == TEST_GITHUB_TOKEN
+    async def fake_get_canonical_repo_name(repository: str, resolver: Any) -> str:
+        assert resolver.token == TEST_GITHUB_TOKEN
         if repository == old_repo:
             return new_repo
         return repository
@@ -105,8 +106,8 @@ async def test_async_main_rejects_non_rename_add_remove_pair(
     (tmp_path / "plugins_old.json").write_text(json.dumps([old_repo]), encoding="utf-8")
     (tmp_path / "plugins.json").write_text(json.dumps([new_repo]), encoding="utf-8")
 
-    async def fake_get_canonical_repo_name(repository: str, token: str) -> str:
-        assert token == TEST_GITHUB_TOKEN
+    async def fake_get_canonical_repo_name(repository: str, resolver: Any) -> str:
+        assert resolver.token == TEST_GITHUB_TOKEN
         return repository
 
     monkeypatch.chdir(tmp_path)
@@ -117,3 +118,43 @@ async def test_async_main_rejects_non_rename_add_remove_pair(
         await module.async_main()
 
     assert exc_info.value.code == 1
+
+
+@pytest.mark.asyncio
+async def test_rename_validation_shares_one_resolver(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every lookup of a run goes through the same resolver."""
+    module = load_script_module()
+    old_repo = "owner/repo-old"
+    new_repo = "owner/repo_new"
+    resolvers = []
+
+    (tmp_path / "plugins_old.json").write_text(json.dumps([old_repo]), encoding="utf-8")
+    (tmp_path / "plugins.json").write_text(json.dumps([new_repo]), encoding="utf-8")
+
+    class FakeResolver:
+        def __init__(self, token: str | None) -> None:
+            self.token = token
+            self.lookups: list[str] = []
+            resolvers.append(self)
+
+        async def __aenter__(self) -> Self:
+            return self
+
+        async def __aexit__(self, *_args: object) -> None:
+            pass
+
+        async def canonical_name(self, repo: str) -> str:
+            self.lookups.append(repo)
+            return new_repo
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GITHUB_TOKEN", TEST_GITHUB_TOKEN)
+    monkeypatch.setattr(module, "RepoResolver", FakeResolver)
+
+    await module.async_main()
+
+    assert len(resolvers) == 1
+    assert resolvers[0].lookups == [old_repo, new_repo]
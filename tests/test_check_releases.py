@@ -1,9 +1,15 @@
 """Tests for scripts/check_releases.py."""
 
 import importlib.util
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from types import ModuleType, SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from release_selection import select_used_ref
 
 
 def load_script_module() -> ModuleType:
@@ -27,9 +33,7 @@ def release(tag: str, *, prerelease: bool, day: int) -> SimpleNamespace:
 
 def test_select_used_ref_prefers_stable_release() -> None:
     """The latest stable release wins over a newer prerelease."""
-    module = load_script_module()
-
-    selected_ref = module.select_used_ref(
+    selected_ref = select_used_ref(
         [
             release("v2.0.0-beta.1", prerelease=True, day=3),
             release("v1.1.0", prerelease=False, day=2),
@@ -42,9 +46,7 @@ def test_select_used_ref_prefers_stable_release() -> None:
 
 def test_select_used_ref_falls_back_to_latest_prerelease() -> None:
     """The newest prerelease is used when no stable release exists."""
-    module = load_script_module()
-
-    selected_ref = module.select_used_ref(
+    selected_ref = select_used_ref(
         [
             release("v1.0.0-beta.1", prerelease=True, day=1),
             release("v1.0.0-beta.2", prerelease=True, day=2),
@@ -52,3 +54,27 @@ def test_select_used_ref_falls_back_to_latest_prerelease() -> None:
     )
 
     assert selected_ref == "v1.0.0-beta.2"
+
+
+async def test_check_releases_rejects_non_semver_tag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The selected release must follow SemVer."""
+    module = load_script_module()
+    releases = [release("v1.0.0", prerelease=False, day=1)]
+
+    @asynccontextmanager
+    async def fake_client(_token: str) -> AsyncIterator[SimpleNamespace]:
+        response = SimpleNamespace(data=releases)
+        list_releases = AsyncMock(return_value=response)
+        yield SimpleNamespace(
+            repos=SimpleNamespace(releases=SimpleNamespace(list=list_releases))
+        )
+
+    monkeypatch.setattr(module, "github_client", fake_client)
+
+    await module.check_releases("owner/repo", "token")
+
+    releases.append(release("latest", prerelease=False, day=2))
+    with pytest.raises(SystemExit):
+        await module.check_releases("owner/repo", "token")
@@ -215,12 +215,12 @@ async def test_fetch_github_releases_no_releases(
 ) -> None:
     """Test when repository has no releases."""
 
-    async def list_no_releases(repo_name: str) -> MockGitHubResponse:
+    async def list_no_releases(endpoint: str) -> MockGitHubResponse:
         return MockGitHubResponse(data=[], etag="mock_etag")
 
     monkeypatch.setattr(
-        mock_github.repos.releases,
-        "list",
+        mock_github,
+        "generic",
         AsyncMock(side_effect=list_no_releases),
     )
 
@@ -236,12 +236,12 @@ async def test_fetch_github_releases_exception(
 ) -> None:
     """Test when fetching releases raises an exception."""
 
-    async def list_raise(repo_name: str) -> None:
+    async def list_raise(endpoint: str) -> None:
         raise GitHubException("Error fetching releases")
 
     monkeypatch.setattr(
-        mock_github.repos.releases,
-        "list",
+        mock_github,
+        "generic",
         AsyncMock(side_effect=list_raise),
     )
 
@@ -0,0 +1,119 @@
+"""Tests for the fingerprint manifest that detects no-op runs."""
+
+import json
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from metadata.generator import MetricsStore, Sample, entry_digests
+from metadata.generator.metrics_store import DAY
+from metadata.summary_generator import SummaryGenerator
+
+PLUGINS = {
+    1: {"repository": "owner/alpha", "version": "1.0.0", "last_fetched": "t1"},
+    2: {"repository": "owner/beta", "version": "2.0.0", "last_fetched": "t1"},
+}
+
+
+@pytest.fixture
+def summary(tmp_path: Path) -> SummaryGenerator:
+    """Create a generator writing to an empty output directory."""
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(["owner/alpha", "owner/beta"]))
+    return SummaryGenerator(str(plugin_file), str(tmp_path / "output"))
+
+
+def publish(
+    summary: SummaryGenerator, plugin_data: dict, *, update_trending: bool = False
+) -> bool:
+    """Save the outputs, then keep the manifest as the next run's previous one."""
+    summary.save_outputs(
+        plugin_data,
+        [entry["repository"] for entry in plugin_data.values()],
+        update_trending=update_trending,
+    )
+    output_dir = Path(summary.output_dir)
+    shutil.copy(
+        output_dir / "fingerprints.json", output_dir / "diff/fingerprints_before.json"
+    )
+    return summary.changed
+
+
+def test_entry_digests_ignore_volatile_keys() -> None:
+    """Only per-run fields may differ between entries with the same digest."""
+    refetched = {1: {**PLUGINS[1], "last_fetched": "t2"}}
+    updated = {1: {**PLUGINS[1], "version": "1.1.0"}}
+    digests = entry_digests(PLUGINS, ["last_fetched"])
+
+    assert set(digests) == {"1", "2"}
+    assert entry_digests(refetched, ["last_fetched"])["1"] == digests["1"]
+    assert entry_digests(updated, ["last_fetched"])["1"] != digests["1"]
+
+
+def test_unchanged_run_is_a_no_op(summary: SummaryGenerator) -> None:
+    """A run that only refetched the same data has nothing to publish."""
+    assert publish(summary, PLUGINS)
+
+    refetched = {key: {**entry, "last_fetched": "t2"} for key, entry in PLUGINS.items()}
+    assert not publish(summary, refetched)
+
+    manifest = json.loads(Path(summary.output_dir, "fingerprints.json").read_text())
+    assert set(manifest["plugins"]) == {"1", "2"}
+    assert set(manifest["files"]) == {"data.json", "repositories.json"}
+
+
+def test_etag_changes_keep_the_hashed_files(summary: SummaryGenerator) -> None:
+    """New ETags alone change neither the hashed file names nor the manifest."""
+    publish(summary, PLUGINS)
+    pointer = Path(summary.output_dir, "current.json").read_bytes()
+
+    refetched = {
+        key: {**entry, "etag_release": f'W/"{key}"', "etag_repository": f'"{key}"'}
+        for key, entry in PLUGINS.items()
+    }
+    assert not publish(summary, refetched)
+    assert Path(summary.output_dir, "current.json").read_bytes() == pointer
+
+
+def test_sliding_trending_window_is_a_no_op(
+    summary: SummaryGenerator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Trending scores that move with the clock alone have nothing to publish."""
+    start = 1_800_000_000
+    MetricsStore.from_env().load().append_run(
+        start - 8 * DAY, {1: Sample(0, 0, 0), 2: Sample(0, 0, 0)}
+    )
+    runs = iter([start, start + 2 * 60 * 60])
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz: object = None) -> datetime:  # noqa: ARG003
+            return datetime.fromtimestamp(next(runs), UTC)
+
+    monkeypatch.setattr("metadata.summary_generator.datetime", Clock)
+    plugin_data = {
+        key: {**entry, "stargazers_count": 5} for key, entry in PLUGINS.items()
+    }
+    trending_file = Path(summary.output_dir, "trending.json")
+
+    assert publish(summary, plugin_data, update_trending=True)
+    first = trending_file.read_bytes()
+    assert not publish(summary, plugin_data, update_trending=True)
+    assert trending_file.read_bytes() != first
+
+
+@pytest.mark.parametrize(
+    "plugin_data",
+    [
+        {**PLUGINS, 1: {**PLUGINS[1], "version": "1.1.0"}},
+        {1: PLUGINS[1]},
+        {2: PLUGINS[2], 1: PLUGINS[1]},
+    ],
+    ids=["updated", "removed", "reordered"],
+)
+def test_changed_run_is_published(summary: SummaryGenerator, plugin_data: dict) -> None:
+    """Updated, removed and reordered plugins change the published files."""
+    publish(summary, PLUGINS)
+
+    assert publish(summary, plugin_data)
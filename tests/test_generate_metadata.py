@@ -18,11 +18,11 @@ from metadata import (
     validate_manifest_domain,
     validate_manifest_version,
 )
+from metadata.generator.records import AssetRecord
 from metadata.summary_generator import SummaryGenerator
+from repo_identity import RepoIdentityCache
 from syrupy.assertion import SnapshotAssertion
 
-from tests.conftest import MockRelease, MockReleaseAsset
-
 from . import load_fixture
 from .conftest import MockGitHubResponse, MockRepo
 
@@ -188,6 +188,53 @@ async def test_metadata_generator(
     assert summary.get("execution_time_seconds") == round(1.23, 2)
     snapshot.assert_match(summary)
 
+    pointers = json.loads((output_dir / "current.json").read_text())
+    assert set(pointers) == {"data.json", "repositories.json"}
+    for hashed_name in pointers.values():
+        assert (output_dir / hashed_name).exists()
+
+    # Without a previous run every fixed-name file needs a purge
+    purge_urls = json.loads((output_dir / "diff" / "purge.json").read_text())
+    assert [url.rsplit("/", 1)[-1] for url in purge_urls] == [
+        "current.json",
+        "data.json",
+        "repositories.json",
+        "trending.json",
+    ]
+    assert json.loads((output_dir / "trending.json").read_text()) == []
+
+
+async def test_refetch_without_changes_purges_nothing(
+    tmp_path: Path, plugins_file: Path, mock_github: AsyncMock
+) -> None:
+    """A run that only refetched the same data leaves the CDN cache alone.
+
+    New ETags and fetch times are per-fetch noise, not content.
+    """
+    plugin_data = await PluginMetadataGenerator("owner/repo").fetch_metadata(
+        mock_github
+    )
+    assert plugin_data
+    output_dir = tmp_path / "output"
+    summary = SummaryGenerator(str(plugins_file), str(output_dir))
+    summary.save_outputs(plugin_data, ["owner/repo"], update_trending=False)
+    (output_dir / "diff" / "hashes_before.json").write_text(
+        (output_dir / "hashes.json").read_text()
+    )
+
+    refetched = {
+        key: {
+            **entry,
+            "last_fetched": "2000-01-01T00:00:00+00:00",
+            "etag_release": 'W/"new-release-etag"',
+            "etag_repository": 'W/"new-repository-etag"',
+        }
+        for key, entry in plugin_data.items()
+    }
+    summary.save_outputs(refetched, ["owner/repo"], update_trending=False)
+
+    assert json.loads((output_dir / "diff" / "purge.json").read_text()) == []
+
 
 async def test_asset_info_with_size_and_download_count(
     mock_github: AsyncMock,
@@ -252,28 +299,27 @@ async def test_asset_without_digest_fallback(
 ) -> None:
     """Test fallback behavior when digest is not available (older releases)."""
 
-    async def list_releases_without_digest(repo_name: str) -> MockGitHubResponse:
+    async def list_releases_without_digest(endpoint: str) -> MockGitHubResponse:
         """Return releases without digest field."""
-        release = MockRelease(
-            tag_name="v0.9.0",
-            prerelease=False,
-            created_at=datetime(2013, 1, 1, tzinfo=UTC),
-            published_at=datetime(2013, 1, 1, tzinfo=UTC),
-            assets=[
-                MockReleaseAsset(
-                    name="plugin.zip",
-                    browser_download_url="https://example.com/old/plugin.zip",
-                    digest=None,  # No digest available
-                    size=10000,
-                    download_count=100,
-                )
+        release = {
+            "tag_name": "v0.9.0",
+            "prerelease": False,
+            "created_at": "2013-01-01T00:00:00Z",
+            "published_at": "2013-01-01T00:00:00Z",
+            "assets": [
+                {
+                    "name": "plugin.zip",
+                    "browser_download_url": "https://example.com/old/plugin.zip",
+                    "size": 10000,
+                    "download_count": 100,
+                }
             ],
-        )
+        }
         return MockGitHubResponse(data=[release], etag="mock_etag")
 
     monkeypatch.setattr(
-        mock_github.repos.releases,
-        "list",
+        mock_github,
+        "generic",
         AsyncMock(side_effect=list_releases_without_digest),
     )
 
@@ -358,8 +404,8 @@ async def test_fetch_github_releases_no_releases(
 ) -> None:
     """Return False when no releases are found."""
     monkeypatch.setattr(
-        mock_github.repos.releases,
-        "list",
+        mock_github,
+        "generic",
         AsyncMock(return_value=MockGitHubResponse(data=[], etag=None)),
     )
     plugin = PluginMetadataGenerator("owner/repo")
@@ -449,7 +495,7 @@ async def test_fetch_metadata_with_renamed_repo(
 
 
 async def test_summary_generator_counts(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, repo_cache_file: Path
 ) -> None:
     """Ensure summary counts renamed/archived/skipped/valid plugins."""
     plugin_file = tmp_path / "plugins.json"
@@ -458,14 +504,15 @@ async def test_summary_generator_counts(
     (output_dir / "diff").mkdir(parents=True, exist_ok=True)
 
     class FakeLogger:
-        def flush(self) -> None:
+        def flush(self, _sink: object = None) -> None:
             pass
 
     class FakeGenerator:
-        def __init__(self, repo: str) -> None:
+        def __init__(self, repo: str, _zip_inspector: object = None) -> None:
             self.original_repo = repo
             self.repo = repo
             self.logger = FakeLogger()
+            self.transient_failure = False
 
         async def fetch_metadata(self, _github: AsyncMock) -> dict | None:
             if self.original_repo == "skip":
@@ -505,6 +552,11 @@ async def test_summary_generator_counts(
     assert summary_data["valid_plugins"] == 1
     assert summary_data["renamed_plugins"] == 2
 
+    # Valid plugins keep the repository identity cache warm for the PR checks
+    identities = RepoIdentityCache(repo_cache_file).load()
+    assert identities.lookup("OK") == "ok-renamed"
+    assert identities.lookup("archived") is None
+
 
 async def test_fetch_metadata_early_exit_on_releases(
     monkeypatch: pytest.MonkeyPatch,
@@ -680,7 +732,7 @@ async def test_build_releases_metadata_ignores_unrelated_zip_assets(
     )
 
     releases = await plugin._build_releases_metadata(AsyncMock())
-    assert releases[0]["tag_name"] == "v1"
+    assert releases[0].tag_name == "v1"
     assert not plugin.logger.buffer
 
 
@@ -709,7 +761,7 @@ async def test_missing_asset_warning_only_on_used_ref(
 
     monkeypatch.setattr(
         "metadata.plugin_metadata_generator.get_release_asset_info",
-        AsyncMock(return_value={"name": "bundle.zip"}),
+        AsyncMock(return_value=AssetRecord(name="bundle.zip")),
     )
 
     releases = await plugin._build_releases_metadata(AsyncMock())
@@ -737,7 +789,7 @@ async def test_build_releases_metadata_skips_missing_and_duplicate_assets(
                 type("Asset", (), {"name": "plugin.zip"})(),
             ]
 
-    asset_lookup = AsyncMock(return_value={"name": "plugin.zip"})
+    asset_lookup = AsyncMock(return_value=AssetRecord(name="plugin.zip"))
     plugin.releases = [Release()]
     monkeypatch.setattr(
         "metadata.plugin_metadata_generator.get_release_asset_info",
@@ -746,7 +798,7 @@ async def test_build_releases_metadata_skips_missing_and_duplicate_assets(
 
     releases = await plugin._build_releases_metadata(AsyncMock())
 
-    assert releases == [
+    assert [release.as_dict() for release in releases] == [
         {
             "tag_name": "v1",
             "published_at": plugin.releases[0].published_at,
@@ -779,7 +831,7 @@ async def test_build_releases_metadata_warns_for_missing_manifest_zip_on_used_re
 
     releases = await plugin._build_releases_metadata(AsyncMock())
 
-    assert releases == [
+    assert [release.as_dict() for release in releases] == [
         {
             "tag_name": "v1",
             "published_at": plugin.releases[0].published_at,
@@ -792,16 +844,20 @@ async def test_build_releases_metadata_warns_for_missing_manifest_zip_on_used_re
     )
 
 
-def test_metadata_main_runs_summary_generator(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_metadata_main_runs_summary_generator(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """metadata/main.py should instantiate SummaryGenerator and run generate()."""
     calls: dict[str, object] = {}
     fake_output_dir = Path("/safe/test-output")
     fake_plugin_list_file = Path("/safe/test-plugins.json")
+    github_output = tmp_path / "github_output"
 
     class FakeSummaryGenerator:
         def __init__(self, plugin_file: str, output_dir: str) -> None:
             calls["plugin_file"] = plugin_file
             calls["output_dir"] = output_dir
+            self.changed = True
 
         async def generate(self, token: str) -> str:
             calls["token"] = token
@@ -811,6 +867,7 @@ def test_metadata_main_runs_summary_generator(monkeypatch: pytest.MonkeyPatch) -
         GITHUB_TOKEN=TEST_GITHUB_TOKEN,
         OUTPUT_DIR=str(fake_output_dir),
         PLUGIN_LIST_FILE=str(fake_plugin_list_file),
+        SHARD_DIR="/safe/test-shards",
     )
     fake_summary_module = types.SimpleNamespace(SummaryGenerator=FakeSummaryGenerator)
     original_asyncio_run = asyncio.run
@@ -822,9 +879,11 @@ def test_metadata_main_runs_summary_generator(monkeypatch: pytest.MonkeyPatch) -
     monkeypatch.setitem(sys.modules, "const", fake_const)
     monkeypatch.setitem(sys.modules, "summary_generator", fake_summary_module)
     monkeypatch.setattr(asyncio, "run", fake_run)
+    monkeypatch.setattr(sys, "argv", ["main.py"])
+    monkeypatch.setenv("GITHUB_OUTPUT", str(github_output))
 
     runpy.run_path(
-        "/home/klaas/community-plugins/metadata/main.py",
+        str(Path(__file__).resolve().parents[1] / "metadata" / "main.py"),
         run_name="__main__",
     )
 
@@ -833,3 +892,4 @@ def test_metadata_main_runs_summary_generator(monkeypatch: pytest.MonkeyPatch) -
     assert calls["token"] == TEST_GITHUB_TOKEN
     assert calls["awaitable"] is not None
     assert calls["result"] == "generated"
+    assert github_output.read_text() == "changed=true\n"
@@ -0,0 +1,63 @@
+"""Tests for content-hashed output files."""
+
+import json
+from pathlib import Path
+
+from metadata.generator.hashed_output import (
+    changed_files,
+    content_digest,
+    encode_json,
+    file_digests,
+    hashed_filename,
+    strip_volatile_keys,
+    write_hashed_files,
+)
+
+
+def test_hashed_filename_inserts_digest() -> None:
+    """The digest goes between the stem and the suffix."""
+    assert hashed_filename("data.json", "abcdef" * 10) == "data.abcdefabcdefabcd.json"
+
+
+def test_strip_volatile_keys() -> None:
+    """Volatile fields are removed from every plugin entry."""
+    data = {1: {"last_fetched": "now", "repository": "owner/repo"}}
+    assert strip_volatile_keys(data, ["last_fetched"]) == {
+        1: {"repository": "owner/repo"}
+    }
+
+
+def test_write_hashed_files_is_deterministic(tmp_path: Path) -> None:
+    """Equal data produces the same filename and bytes on every run."""
+    data = {"1": {"repository": "owner/repo", "stargazers_count": 1}}
+
+    first = write_hashed_files(str(tmp_path), {"data.json": data})
+    second = write_hashed_files(str(tmp_path), {"data.json": dict(data)})
+
+    assert first == second
+    payload = (tmp_path / first["data.json"]).read_bytes()
+    assert first["data.json"] == hashed_filename("data.json", content_digest(payload))
+    assert payload == encode_json(data)
+    assert json.loads(payload) == data
+
+
+def test_write_hashed_files_changes_name_on_change(tmp_path: Path) -> None:
+    """A change in content results in a new filename."""
+    before = write_hashed_files(str(tmp_path), {"data.json": {"a": 1}})
+    after = write_hashed_files(str(tmp_path), {"data.json": {"a": 2}})
+
+    assert before["data.json"] != after["data.json"]
+    assert (tmp_path / before["data.json"]).exists()
+    assert (tmp_path / after["data.json"]).exists()
+
+
+def test_changed_files_compares_digests(tmp_path: Path) -> None:
+    """Only new or modified files are reported as changed."""
+    (tmp_path / "data.json").write_text("{}")
+    (tmp_path / "repositories.json").write_text("[]")
+    digests = file_digests(str(tmp_path), ["data.json", "repositories.json", "x"])
+
+    assert set(digests) == {"data.json", "repositories.json"}
+    assert changed_files({}, digests) == ["data.json", "repositories.json"]
+    assert changed_files(digests, digests) == []
+    assert changed_files({**digests, "data.json": "old"}, digests) == ["data.json"]
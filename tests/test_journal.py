@@ -0,0 +1,104 @@
+"""Tests for the checkpoint journal and resumable runs."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from generator import CheckpointJournal
+from metadata.summary_generator import SummaryGenerator
+
+NOW = 1_800_000_000.0
+
+
+def test_fresh_entries_are_reused(journal_file: Path) -> None:
+    """Entries inside the window are loaded, older ones are not."""
+    with CheckpointJournal(journal_file, window=3600) as journal:
+        journal.record("owner/old", "owner/old", {"1": {}}, now=NOW - 7200)
+        journal.record("owner/Repo", "owner/repo", {2: {"a": 1}}, now=NOW - 60)
+
+    journal = CheckpointJournal(journal_file, window=3600).load(now=NOW)
+
+    assert journal.get("owner/old") is None
+    assert journal.get("owner/Repo")["result"] == {2: {"a": 1}}
+    assert journal.get("owner/Repo")["repository"] == "owner/repo"
+
+
+def test_entries_are_synced_in_batches(
+    journal_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """`fsync` runs once per batch, and once more on close."""
+    synced: list[int] = []
+    monkeypatch.setattr("os.fsync", synced.append)
+
+    with CheckpointJournal(journal_file, batch_size=2) as journal:
+        for n in range(5):
+            journal.record(f"owner/repo{n}", f"owner/repo{n}", {str(n): {}})
+        assert len(synced) == 2
+
+    assert len(synced) == 3
+    assert len(journal_file.read_text(encoding="utf-8").splitlines()) == 5
+
+
+def test_truncated_line_is_dropped(journal_file: Path) -> None:
+    """A line cut short by a crash does not hide later checkpoints."""
+    with CheckpointJournal(journal_file) as journal:
+        journal.record("owner/a", "owner/a", {"1": {}}, now=NOW)
+    with journal_file.open("a", encoding="utf-8") as file:
+        file.write('{"repo": "owner/b", "repos')
+
+    journal = CheckpointJournal(journal_file).load(now=NOW)
+    with journal:
+        journal.record("owner/c", "owner/c", {"3": {}}, now=NOW)
+
+    assert set(CheckpointJournal(journal_file).load(now=NOW).entries) == {
+        "owner/a",
+        "owner/c",
+    }
+
+
+async def test_generate_resumes_from_checkpoint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, journal_file: Path
+) -> None:
+    """Checkpointed plugins are not fetched again, and a full run clears them."""
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(["owner/done", "owner/todo"]))
+    output_dir = tmp_path / "output"
+    (output_dir / "diff").mkdir(parents=True)
+    with CheckpointJournal(journal_file) as journal:
+        journal.record(
+            "owner/done", "owner/renamed", {"1": {"repository": "owner/renamed"}}
+        )
+    fetched: list[str] = []
+
+    class FakeLogger:
+        def flush(self, _sink: object = None) -> None:
+            pass
+
+    class FakeGenerator:
+        def __init__(self, repo: str, _zip_inspector: object = None) -> None:
+            self.original_repo = self.repo = repo
+            self.logger = FakeLogger()
+            self.transient_failure = False
+
+        def log(self, _message: str) -> None:
+            pass
+
+        async def fetch_metadata(self, _github: AsyncMock) -> dict | None:
+            fetched.append(self.repo)
+            return {2: {"repository": self.repo}}
+
+    monkeypatch.setattr(
+        "metadata.summary_generator.PluginMetadataGenerator", FakeGenerator
+    )
+
+    await SummaryGenerator(str(plugin_file), str(output_dir)).generate("token")
+
+    assert fetched == ["owner/todo"]
+    assert json.loads((output_dir / "repositories.json").read_text()) == [
+        "owner/renamed",
+        "owner/todo",
+    ]
+    summary = json.loads((output_dir / "summary.json").read_text())
+    assert summary["renamed_plugins"] == 1
+    assert CheckpointJournal(journal_file).load().entries == {}
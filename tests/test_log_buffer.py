@@ -0,0 +1,91 @@
+"""Tests for the bounded, lazily formatted plugin log buffer."""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from generator import PluginLogBuffer, PluginLogSink
+from metadata import PluginMetadataGenerator
+
+
+class CountingArg:
+    """Argument that counts how often it is turned into a string."""
+
+    def __init__(self) -> None:
+        """Start counting at zero."""
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        """Count and return a fixed value."""
+        self.formatted += 1
+        return "value"
+
+
+def test_messages_are_formatted_only_when_read() -> None:
+    """Logging stores the template and arguments, not a formatted string."""
+    arg = CountingArg()
+    logger = PluginLogBuffer("owner/repo")
+    logger.log(logging.INFO, "Fetched %s", arg)
+    logger.log(logging.WARNING, "Version %s vs %s", "1.0", "1.1")
+
+    assert logger.entries[0].template == "Fetched %s"
+    assert arg.formatted == 0
+    assert logger.buffer == [
+        (logging.INFO, "Fetched value"),
+        (logging.WARNING, "Version 1.0 vs 1.1"),
+    ]
+    assert arg.formatted == 1
+
+
+def test_ring_buffer_keeps_warnings_and_errors() -> None:
+    """Routine messages are evicted first and never push out problems."""
+    logger = PluginLogBuffer("owner/repo", capacity=3)
+    logger.log(logging.ERROR, "first error")
+    for n in range(10):
+        logger.log(logging.INFO, "step %d", n)
+    logger.log(logging.WARNING, "late warning")
+
+    assert logger.buffer == [
+        (logging.ERROR, "first error"),
+        (logging.INFO, "step 7"),
+        (logging.INFO, "step 8"),
+        (logging.INFO, "step 9"),
+        (logging.WARNING, "late warning"),
+    ]
+    assert logger.dropped == 7
+
+
+def test_generator_log_takes_the_level_as_keyword() -> None:
+    """Plugin messages default to INFO, arguments follow the template."""
+    generator = PluginMetadataGenerator("owner/repo")
+    generator.log("Fetched %s releases", 3)
+    generator.log("Tag %s is not SemVer", "v1", level=logging.ERROR)
+
+    assert generator.logger.buffer == [
+        (logging.INFO, "Fetched 3 releases"),
+        (logging.ERROR, "Tag v1 is not SemVer"),
+    ]
+
+
+def test_flush_emits_groups_and_writes_json_lines(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Flushing logs each message once and appends it to the sink."""
+    logger = PluginLogBuffer("owner/repo")
+    logger.log(logging.INFO, "100% done")
+    logger.log(logging.ERROR, "Missing `%s`", "manifest.json")
+    sink_file = tmp_path / "logs" / "plugins.jsonl"
+
+    with caplog.at_level(logging.INFO), PluginLogSink(sink_file) as sink:
+        logger.flush(sink)
+        logger.flush(sink)
+
+    assert "<owner/repo> 100% done" in caplog.messages
+    assert "<owner/repo> Missing `manifest.json`" in caplog.messages
+    records = [json.loads(line) for line in sink_file.read_bytes().splitlines()]
+    assert [(r["repo"], r["level"], r["message"]) for r in records] == [
+        ("owner/repo", "INFO", "100% done"),
+        ("owner/repo", "ERROR", "Missing `manifest.json`"),
+    ]
+    assert not logger.entries
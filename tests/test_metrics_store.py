@@ -0,0 +1,81 @@
+"""Tests for the columnar metric history."""
+
+from pathlib import Path
+
+from generator import MetricsStore, Sample, sample_from_metadata
+from generator.metrics_store import DAY, RUNS_FILE
+
+NOW = 1_800_000_000
+
+
+def test_runs_are_appended_and_read_back(tmp_path: Path) -> None:
+    """Each run is a contiguous slice found by its timestamp."""
+    store = MetricsStore(tmp_path)
+    store.append_run(NOW, {1: Sample(5, 1, 100), 2: Sample(3, 0, 10)})
+    store.append_run(NOW + DAY, {2: Sample(4, 0, 12), 3: Sample(1, 1, 1)})
+
+    reloaded = MetricsStore(tmp_path).load()
+
+    assert reloaded.plugins == ["1", "2", "3"]
+    assert reloaded.snapshot(NOW - 1) == {}
+    assert reloaded.snapshot(NOW + 60) == {
+        "1": Sample(5, 1, 100),
+        "2": Sample(3, 0, 10),
+    }
+    assert reloaded.snapshot(NOW + 2 * DAY) == {
+        "2": Sample(4, 0, 12),
+        "3": Sample(1, 1, 1),
+    }
+    assert (tmp_path / "stars.bin").stat().st_size == 4 * 8
+    assert (tmp_path / "plugin.bin").stat().st_size == 4 * 4
+
+
+def test_uncommitted_rows_are_discarded(tmp_path: Path) -> None:
+    """Rows of an interrupted run are truncated by the next append."""
+    store = MetricsStore(tmp_path)
+    store.append_run(NOW, {1: Sample(5, 1, 100)})
+    runs = (tmp_path / RUNS_FILE).read_bytes()
+    store.append_run(NOW + DAY, {1: Sample(6, 1, 150)})
+    # Simulate a crash before the second run was committed
+    (tmp_path / RUNS_FILE).write_bytes(runs)
+
+    store.append_run(NOW + 2 * DAY, {1: Sample(7, 1, 200)})
+
+    assert (tmp_path / "downloads.bin").stat().st_size == 2 * 8
+    assert store.snapshot(NOW + 2 * DAY) == {"1": Sample(7, 1, 200)}
+
+
+def test_trending_scores_weekly_growth(tmp_path: Path) -> None:
+    """Growth is measured against the last run before the window starts."""
+    store = MetricsStore(tmp_path)
+    store.append_run(NOW - DAY, {1: Sample(0, 0, 0), 2: Sample(0, 0, 0)})
+    store.append_run(NOW, {1: Sample(10, 0, 5000), 2: Sample(10, 0, 100)})
+    store.append_run(NOW + 3 * DAY, {1: Sample(11, 0, 6000), 2: Sample(10, 0, 100)})
+    store.append_run(
+        NOW + 7 * DAY,
+        {1: Sample(12, 0, 800), 2: Sample(17, 0, 170), 3: Sample(50, 0, 900)},
+    )
+
+    trending = store.trending(NOW + 7 * DAY)
+
+    # Downloads of plugin 1 dropped as an old release was rotated out
+    assert trending == {
+        "2": {"score": 20.0, "downloads": 70, "stars": 7},
+        "1": {"score": 2.86, "downloads": 0, "stars": 2},
+    }
+    assert MetricsStore(tmp_path / "empty").trending(NOW) == {}
+
+
+def test_sample_from_metadata_sums_asset_downloads() -> None:
+    """Downloads are summed over every asset of every release."""
+    metadata = {
+        "stargazers_count": 4,
+        "forks_count": 2,
+        "releases": [
+            {"assets": [{"download_count": 3}, {"name": "x"}]},
+            {"assets": [{"download_count": 5}]},
+            {},
+        ],
+    }
+
+    assert sample_from_metadata(metadata) == Sample(4, 2, 8)
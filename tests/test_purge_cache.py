@@ -0,0 +1,127 @@
+"""Tests for scripts/purge_cache.py."""
+
+import importlib.util
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+
+def load_script_module() -> ModuleType:
+    """Load the purge_cache script as a module for testing."""
+    script_path = Path(__file__).resolve().parents[1] / "scripts" / "purge_cache.py"
+    spec = importlib.util.spec_from_file_location("purge_cache_module", script_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeCloudflare(HTTPServer):
+    """Local stand-in for the Cloudflare purge API."""
+
+    requests: list[dict]
+    succeed: bool = True
+
+
+class PurgeHandler(BaseHTTPRequestHandler):
+    """Record purge requests and answer like Cloudflare does."""
+
+    server: FakeCloudflare
+
+    def do_POST(self) -> None:
+        """Handle a purge request."""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(
+            {
+                "path": self.path,
+                "authorization": self.headers["Authorization"],
+                "body": json.loads(body),
+            }
+        )
+        payload = json.dumps({"success": self.server.succeed, "errors": []})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(payload.encode("utf-8"))
+
+    def log_message(self, *_args: object) -> None:
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def cloudflare() -> Iterator[FakeCloudflare]:
+    """Run a fake Cloudflare API on a random local port."""
+    server = FakeCloudflare(("127.0.0.1", 0), PurgeHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def api_url(server: FakeCloudflare) -> str:
+    """Return the base URL of the fake API."""
+    host, port = server.server_address
+    return f"http://{host}:{port}/client/v4"
+
+
+async def test_purge_urls_batches_requests(cloudflare: FakeCloudflare) -> None:
+    """URLs are split in batches that respect the per-request limit."""
+    module = load_script_module()
+    urls = [f"https://cdn.example.com/{i}.json" for i in range(7)]
+
+    failed = await module.purge_urls(
+        urls, "zone", "secret", api_url=api_url(cloudflare), batch_size=3
+    )
+
+    assert failed == 0
+    assert [len(r["body"]["files"]) for r in cloudflare.requests] == [3, 3, 1]
+    assert [u for r in cloudflare.requests for u in r["body"]["files"]] == urls
+    assert cloudflare.requests[0]["path"] == "/client/v4/zones/zone/purge_cache"
+    assert cloudflare.requests[0]["authorization"] == "Bearer secret"
+
+
+async def test_purge_urls_counts_rejected_batches(
+    cloudflare: FakeCloudflare,
+) -> None:
+    """A purge that Cloudflare rejects is reported as failed."""
+    module = load_script_module()
+    cloudflare.succeed = False
+
+    failed = await module.purge_urls(
+        ["https://cdn.example.com/data.json"],
+        "zone",
+        "secret",
+        api_url=api_url(cloudflare),
+    )
+
+    assert failed == 1
+
+
+async def test_purge_urls_counts_unreachable_api() -> None:
+    """A purge that cannot reach Cloudflare is reported as failed."""
+    module = load_script_module()
+
+    failed = await module.purge_urls(
+        ["https://cdn.example.com/data.json"],
+        "zone",
+        "secret",
+        api_url="http://127.0.0.1:9/client/v4",
+    )
+
+    assert failed == 1
+
+
+def test_load_urls_removes_duplicates(tmp_path: Path) -> None:
+    """Duplicate URLs are only purged once."""
+    module = load_script_module()
+    urls_file = tmp_path / "purge.json"
+    urls_file.write_text(json.dumps(["a", "b", "a"]), encoding="utf-8")
+
+    assert module.load_urls(urls_file) == ["a", "b"]
@@ -0,0 +1,67 @@
+"""Tests for the plugin metadata records."""
+
+from metadata.generator.records import AssetRecord, PluginRecord, ReleaseRecord
+
+
+def test_optional_fields_are_omitted_only_when_empty() -> None:
+    """`None` and empty lists are left out, falsy values are kept."""
+    assert AssetRecord(name="plugin.zip").as_dict() == {"name": "plugin.zip"}
+    assert AssetRecord(name="plugin.zip", size=0, download_count=0).as_dict() == {
+        "name": "plugin.zip",
+        "size": 0,
+        "download_count": 0,
+    }
+    release = ReleaseRecord(tag_name="v1", published_at=None, prerelease=False)
+    assert release.as_dict() == {
+        "tag_name": "v1",
+        "published_at": None,
+        "prerelease": False,
+    }
+
+
+def test_plugin_record_serialises_in_canonical_order() -> None:
+    """Manifest comes first, nested records become dicts."""
+    record = PluginRecord(
+        manifest={"domain": "test"},
+        etag_release=None,
+        etag_repository=None,
+        forks_count=1,
+        last_fetched="now",
+        last_prerelease=None,
+        last_updated="then",
+        last_version=None,
+        open_issues=0,
+        releases=[
+            ReleaseRecord(
+                tag_name="v1",
+                published_at="2025-01-01T00:00:00Z",
+                prerelease=False,
+                assets=[AssetRecord(name="plugin.zip", sha256="abc")],
+            )
+        ],
+        repository="owner/repo",
+        stargazers_count=2,
+        topics=[],
+        used_ref="v1",
+        watchers_count=3,
+    )
+
+    data = record.as_dict()
+
+    assert list(data) == [
+        "manifest",
+        "etag_release",
+        "etag_repository",
+        "forks_count",
+        "last_fetched",
+        "last_updated",
+        "last_version",
+        "open_issues",
+        "releases",
+        "repository",
+        "stargazers_count",
+        "topics",
+        "used_ref",
+        "watchers_count",
+    ]
+    assert data["releases"][0]["assets"] == [{"name": "plugin.zip", "sha256": "abc"}]
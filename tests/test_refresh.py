@@ -0,0 +1,113 @@
+"""Tests for the targeted single-plugin refresh."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from metadata.summary_generator import SummaryGenerator
+
+REPOS = ["owner/alpha", "owner/beta", "owner/gamma"]
+
+
+@pytest.fixture
+def fetched(monkeypatch: pytest.MonkeyPatch) -> dict[str, dict | None]:
+    """Replace the plugin generator; tests set the result per repository."""
+    results: dict[str, dict | None] = {}
+
+    class FakeLogger:
+        def flush(self, _sink: object = None) -> None:
+            pass
+
+    class FakeGenerator:
+        def __init__(self, repo: str, _zip_inspector: object = None) -> None:
+            self.original_repo = self.repo = repo
+            self.logger = FakeLogger()
+            self.transient_failure = False
+
+        async def fetch_metadata(self, _github: AsyncMock) -> dict | None:
+            result = results[self.repo]
+            if result:
+                self.repo = next(iter(result.values()))["repository"]
+            return result
+
+    monkeypatch.setattr(
+        "metadata.summary_generator.PluginMetadataGenerator", FakeGenerator
+    )
+    return results
+
+
+@pytest.fixture
+def summary(tmp_path: Path) -> SummaryGenerator:
+    """Create a generator whose output directory holds a published run."""
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(REPOS))
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    published = {
+        "1": {"repository": "owner/alpha", "version": "1.0.0"},
+        "2": {"repository": "owner/beta", "version": "2.0.0"},
+    }
+    (output_dir / "data.json").write_text(json.dumps(published))
+    (output_dir / "summary.json").write_text(
+        json.dumps({"archived_plugins": 0, "renamed_plugins": 1})
+    )
+    return SummaryGenerator(str(plugin_file), str(output_dir))
+
+
+def read(summary: SummaryGenerator, name: str) -> object:
+    """Read one of the generator's output files."""
+    return json.loads((Path(summary.output_dir) / name).read_text())
+
+
+async def test_refresh_replaces_the_entry_in_place(
+    summary: SummaryGenerator, fetched: dict[str, dict | None]
+) -> None:
+    """Only the refreshed plugin changes, and it keeps its position."""
+    fetched["owner/alpha"] = {1: {"repository": "owner/alpha", "version": "1.1.0"}}
+
+    assert await summary.refresh("token", "Owner/Alpha")
+
+    data = read(summary, "data.json")
+    assert list(data) == ["1", "2"]
+    assert data["1"]["version"] == "1.1.0"
+    assert data["2"]["version"] == "2.0.0"
+    assert read(summary, "repositories.json") == ["owner/alpha", "owner/beta"]
+    assert read(summary, "diff/after.json") == data
+    result = read(summary, "summary.json")
+    assert result["total_plugins"] == 3
+    assert result["valid_plugins"] == 2
+    assert result["skipped_plugins"] == 1
+    assert result["renamed_plugins"] == 1
+
+
+async def test_refresh_adds_new_and_drops_archived_plugins(
+    summary: SummaryGenerator, fetched: dict[str, dict | None]
+) -> None:
+    """A new plugin is appended and an archived one is removed."""
+    fetched["owner/gamma"] = {3: {"repository": "owner/gamma", "version": "0.1.0"}}
+    fetched["owner/beta"] = {2: {"repository": "owner/beta", "archived": True}}
+
+    assert await summary.refresh("token", "owner/gamma")
+    assert await summary.refresh("token", "owner/beta")
+
+    assert read(summary, "repositories.json") == ["owner/alpha", "owner/gamma"]
+
+
+async def test_failed_refresh_leaves_outputs_untouched(
+    summary: SummaryGenerator, fetched: dict[str, dict | None]
+) -> None:
+    """A plugin that cannot be fetched is not removed from the outputs."""
+    fetched["owner/beta"] = None
+    before = read(summary, "data.json")
+
+    assert not await summary.refresh("token", "owner/beta")
+    assert read(summary, "data.json") == before
+
+
+async def test_refresh_requires_a_listed_repository(
+    summary: SummaryGenerator,
+) -> None:
+    """Repositories missing from plugins.json are rejected."""
+    with pytest.raises(ValueError, match="not listed"):
+        await summary.refresh("token", "owner/unknown")
@@ -0,0 +1,58 @@
+"""Tests for scripts/release_selection.py."""
+
+from types import SimpleNamespace
+
+from metadata.generator.releases import parse_releases
+from release_selection import ReleaseIndex, parse_semver, select_used_ref
+
+
+def raw_release(tag: str, *, prerelease: bool, day: int) -> dict:
+    """Create a raw release object as returned by the releases endpoint."""
+    return {
+        "tag_name": tag,
+        "prerelease": prerelease,
+        "created_at": f"2026-01-{day:02d}T00:00:00Z",
+    }
+
+
+def test_parse_semver() -> None:
+    """Tags with and without a `v` prefix are parsed, others are rejected."""
+    assert parse_semver("v1.2.3") == (1, 2, 3)
+    assert parse_semver("2.0.0-beta.1+build") == (2, 0, 0)
+    assert parse_semver("v1.2") is None
+    assert parse_semver("main") is None
+
+
+def test_index_heads_versions_and_slice() -> None:
+    """Heads, versions and the newest slice are computed in one pass."""
+    releases = [
+        SimpleNamespace(tag_name="v3.0.0-rc.1", prerelease=True),
+        SimpleNamespace(tag_name="v2.1.0", prerelease=False),
+        SimpleNamespace(tag_name="nightly", prerelease=True),
+        SimpleNamespace(tag_name="v2.0.0", prerelease=False),
+    ]
+
+    index = ReleaseIndex(releases, keep=2)
+
+    assert index.stable_tag == "v2.1.0"
+    assert index.prerelease_tag == "v3.0.0-rc.1"
+    assert index.used_ref == "v2.1.0"
+    assert index.versions["nightly"] is None
+    assert index.versions["v2.0.0"] == (2, 0, 0)
+    assert [r.tag_name for r in index.newest] == ["v3.0.0-rc.1", "v2.1.0"]
+    assert ReleaseIndex([]).used_ref is None
+
+
+def test_generator_and_scripts_agree() -> None:
+    """The generator (parsed payload) and the PR checks select the same ref."""
+    payload = [
+        raw_release("v1.0.0", prerelease=False, day=1),
+        raw_release("v1.1.0-beta.1", prerelease=True, day=9),
+        raw_release("v1.0.1", prerelease=False, day=3),
+    ] + [raw_release(f"v2.0.0-rc.{n}", prerelease=True, day=10 + n) for n in range(6)]
+
+    generator_index = ReleaseIndex(parse_releases(payload, keep=5), keep=5)
+    script_ref = select_used_ref([SimpleNamespace(**release) for release in payload])
+
+    assert generator_index.used_ref == script_ref == "v1.0.1"
+    assert len(generator_index.newest) == 5
@@ -0,0 +1,52 @@
+"""Tests for parsing raw GitHub release payloads."""
+
+from metadata.generator.releases import ReleaseAssetInfo, parse_releases
+
+from . import load_fixture
+
+
+def raw_release(tag: str, day: int, *, prerelease: bool = False) -> dict:
+    """Create a minimal raw release object."""
+    return {
+        "tag_name": tag,
+        "prerelease": prerelease,
+        "created_at": f"2025-01-{day:02d}T00:00:00Z",
+        "published_at": f"2025-01-{day:02d}T00:00:00Z",
+        "body": "Long release notes " * 100,
+        "author": {"login": "someone"},
+    }
+
+
+def test_parse_releases_reads_asset_fields() -> None:
+    """Asset name, size, download count, digest and URL come from the payload."""
+    releases = parse_releases(load_fixture("releases_data.json"), keep=5)
+
+    assert [release.tag_name for release in releases] == [
+        "v1.0.1",
+        "v1.0.0",
+        "v1.0.0-beta",
+    ]
+    assert releases[0].assets[0] == ReleaseAssetInfo(
+        name="plugin.zip",
+        size=12345,
+        download_count=42,
+        digest="sha256:9a27e03cc6248fb656d2bb120bc8f0f75b9c6573c2bd8fa8700c55dc6f0d7a4a",
+        browser_download_url="https://example.com/releases/v1.0.1/plugin.zip",
+    )
+
+
+def test_parse_releases_keeps_only_newest_and_heads() -> None:
+    """Old releases are dropped, except the newest stable release."""
+    payload = [raw_release("v1.0.0", 1)] + [
+        raw_release(f"v2.0.0-beta.{day}", day, prerelease=True) for day in range(2, 20)
+    ]
+
+    releases = parse_releases(payload, keep=3)
+
+    assert [release.tag_name for release in releases] == [
+        "v2.0.0-beta.19",
+        "v2.0.0-beta.18",
+        "v2.0.0-beta.17",
+        "v1.0.0",
+    ]
+    assert not hasattr(releases[0], "body")
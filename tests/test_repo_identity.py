@@ -0,0 +1,120 @@
+"""Tests for scripts/repo_identity.py."""
+
+import asyncio
+from pathlib import Path
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import repo_identity
+from aiogithubapi import GitHubNotFoundException, GitHubRatelimitException
+from repo_identity import RepoIdentityCache, RepoResolver
+
+
+def test_cache_round_trip_and_ttl(tmp_path: Path) -> None:
+    """Entries survive a reload and expire after the TTL."""
+    path = tmp_path / "repo_identity.json"
+    cache = RepoIdentityCache(path, ttl=60)
+    cache.record(42, "Owner/New-Name", "owner/old-name", now=1000.0)
+    cache.save()
+
+    reloaded = RepoIdentityCache(path, ttl=60).load()
+
+    assert reloaded.lookup("owner/new-name", now=1030.0) == "Owner/New-Name"
+    assert reloaded.lookup("OWNER/OLD-NAME", now=1030.0) == "Owner/New-Name"
+    assert reloaded.lookup("owner/new-name", now=1061.0) is None
+    assert reloaded.lookup("owner/unknown", now=1030.0) is None
+
+
+def test_unreadable_cache_starts_empty(tmp_path: Path) -> None:
+    """A corrupt cache file is ignored instead of failing the check."""
+    path = tmp_path / "repo_identity.json"
+    path.write_text("not json", encoding="utf-8")
+
+    cache = RepoIdentityCache(path).load()
+
+    assert cache.repositories == {}
+    assert cache.names == {}
+
+
+async def test_resolver_only_calls_github_on_miss(
+    monkeypatch: pytest.MonkeyPatch, repo_cache_file: Path
+) -> None:
+    """Repeated lookups are served from the cache by a single client."""
+    get = AsyncMock(
+        return_value=MagicMock(data=MagicMock(id=7, full_name="Owner/Repo"))
+    )
+    opened = []
+
+    class FakeGitHub:
+        def __init__(self, token: str) -> None:
+            opened.append(token)
+            self.repos = MagicMock(get=get)
+
+        async def __aenter__(self) -> Self:
+            return self
+
+        async def __aexit__(self, *_args: object) -> None:
+            pass
+
+    monkeypatch.setattr(repo_identity, "github_client", FakeGitHub)
+
+    async with RepoResolver("token") as resolver:
+        assert await resolver.canonical_name("owner/repo") == "Owner/Repo"
+        assert await resolver.canonical_name("Owner/Repo") == "Owner/Repo"
+
+    async with RepoResolver("token") as resolver:
+        assert await resolver.canonical_name("OWNER/repo") == "Owner/Repo"
+
+    assert get.await_count == 1
+    assert opened == ["token"]
+    assert RepoIdentityCache(repo_cache_file).load().lookup("owner/repo")
+
+
+async def test_canonical_names_bounded_and_ordered() -> None:
+    """Lookups overlap up to the limit and come back in input order."""
+    in_flight = 0
+    peak = 0
+
+    async def get(repo: str) -> MagicMock:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later repositories answer first
+        await asyncio.sleep(0.001 * (10 - int(repo.rsplit("-", 1)[1])))
+        in_flight -= 1
+        if repo == "owner/repo-3":
+            raise GitHubNotFoundException("Not Found")
+        return MagicMock(data=MagicMock(id=repo, full_name=repo.upper()))
+
+    github = MagicMock()
+    github.repos.get = AsyncMock(side_effect=get)
+    repos = [f"owner/repo-{i}" for i in range(10)]
+
+    async with RepoResolver("token", github=github) as resolver:
+        results = await resolver.canonical_names(repos, concurrency=4)
+
+    assert peak == 4
+    assert isinstance(results[3], GitHubNotFoundException)
+    assert [r for i, r in enumerate(results) if i != 3] == [
+        repo.upper() for i, repo in enumerate(repos) if i != 3
+    ]
+
+
+async def test_rate_limited_lookup_is_retried(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A rate-limited lookup backs off and then retries."""
+    monkeypatch.setattr(repo_identity, "RATE_LIMIT_BACKOFF", 0)
+    github = MagicMock()
+    github.repos.get = AsyncMock(
+        side_effect=[
+            GitHubRatelimitException("API rate limit exceeded"),
+            MagicMock(data=MagicMock(id=1, full_name="Owner/Repo")),
+        ]
+    )
+
+    async with RepoResolver("token", github=github) as resolver:
+        assert await resolver.canonical_names(["owner/repo"]) == ["Owner/Repo"]
+
+    assert github.repos.get.await_count == 2
@@ -0,0 +1,179 @@
+"""Tests for the retry, deadline and hedging policy of GitHub requests."""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+import transport
+from aiohttp import web
+from metadata import PluginMetadataGenerator
+from metadata.summary_generator import SummaryGenerator
+from request_policy import PolicySession, RequestPolicy
+
+FAST = RequestPolicy(backoff_base=0.001, budget_floor=10)
+
+
+@pytest.fixture
+async def stand_in() -> AsyncIterator[tuple[str, dict]]:
+    """Run a server whose failures, delays and rate limit tests can script."""
+    state: dict = {"calls": 0, "failures": 0, "delays": [], "remaining": "5000"}
+
+    async def handler(request: web.Request) -> web.Response:
+        state["calls"] += 1
+        if state["delays"]:
+            await asyncio.sleep(state["delays"].pop(0))
+        headers = {"X-RateLimit-Remaining": state["remaining"]}
+        if state["failures"]:
+            state["failures"] -= 1
+            return web.Response(status=503, headers=headers)
+        return web.json_response({"method": request.method}, headers=headers)
+
+    app = web.Application()
+    app.router.add_route("*", "/item", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/item", state
+    await runner.cleanup()
+
+
+async def test_get_is_retried_on_server_errors(stand_in: tuple[str, dict]) -> None:
+    """A GET that fails with 5xx is retried until it succeeds."""
+    url, state = stand_in
+    state["failures"] = 2
+    async with aiohttp.ClientSession() as session:
+        policy_session = PolicySession(session, FAST)
+        response = await policy_session.request(method="GET", url=url)
+
+        assert response.status == 200
+        assert await response.json() == {"method": "GET"}
+    assert state["calls"] == 3
+    assert policy_session.retried == 2
+
+
+async def test_other_methods_and_low_budgets_are_not_retried(
+    stand_in: tuple[str, dict],
+) -> None:
+    """Non-idempotent requests and requests near the rate limit fail at once."""
+    url, state = stand_in
+    async with aiohttp.ClientSession() as session:
+        policy_session = PolicySession(session, FAST)
+        state["failures"] = 1
+        assert (await policy_session.request("POST", url)).status == 503
+
+        state["remaining"] = "10"
+        state["failures"] = 1
+        assert (await policy_session.request("GET", url)).status == 503
+    assert state["calls"] == 2
+
+
+async def test_call_deadline_covers_every_attempt(stand_in: tuple[str, dict]) -> None:
+    """A stalled server fails the call once its deadline has passed."""
+    url, state = stand_in
+    state["delays"] = [1.0]
+    policy = RequestPolicy(call_deadline=0.1)
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(TimeoutError):
+            await PolicySession(session, policy).request("GET", url)
+
+
+async def test_slow_requests_are_hedged(stand_in: tuple[str, dict]) -> None:
+    """A request slower than the recent p95 is answered by a second one."""
+    url, state = stand_in
+    policy = RequestPolicy(hedge=True, hedge_min_samples=5)
+    async with aiohttp.ClientSession() as session:
+        policy_session = PolicySession(session, policy)
+        for _ in range(5):
+            policy_session.latency.add(0.01)
+        state["delays"] = [1.0]
+
+        response = await asyncio.wait_for(
+            policy_session.request("GET", url), timeout=0.5
+        )
+
+    assert response.status == 200
+    assert policy_session.hedged == 1
+
+
+async def test_plugin_deadline_stops_a_stalled_plugin(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A plugin that takes too long is given up as a transient failure."""
+    monkeypatch.setenv("HTTP_PLUGIN_DEADLINE", "0.05")
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(["owner/stalled"]))
+    generators = []
+
+    class FakeGenerator:
+        def __init__(self, repo: str) -> None:
+            self.original_repo = self.repo = repo
+            self.transient_failure = False
+            generators.append(self)
+
+        def log(self, *_args: object, **_kwargs: object) -> None:
+            pass
+
+        async def fetch_metadata(self, _github: AsyncMock) -> dict | None:
+            await asyncio.sleep(1)
+            return {1: {}}
+
+    summary = SummaryGenerator(str(plugin_file), str(tmp_path / "output"))
+    journal = AsyncMock()
+    journal.get = lambda _repo: None
+
+    result = await summary.fetch_with_checkpoint(
+        FakeGenerator("owner/stalled"), AsyncMock(), journal
+    )
+
+    assert result is None
+    assert generators[0].transient_failure
+
+
+async def test_plugin_deadline_inside_a_github_request(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The deadline is kept when aiogithubapi wraps the cancellation."""
+    monkeypatch.setenv("HTTP_PLUGIN_DEADLINE", "0.1")
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(["owner/stalled"]))
+
+    release = asyncio.Event()
+
+    async def stall(_request: web.Request) -> web.Response:
+        await release.wait()
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/repos/owner/stalled", stall)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    config = transport.TransportConfig(base_url=f"http://127.0.0.1:{port}")
+
+    summary = SummaryGenerator(str(plugin_file), str(tmp_path / "output"))
+    generator = PluginMetadataGenerator("owner/stalled")
+    journal = AsyncMock()
+    journal.get = lambda _repo: None
+    try:
+        async with transport.github_client(None, config) as github:
+            result = await asyncio.wait_for(
+                summary.fetch_with_checkpoint(generator, github, journal), timeout=2
+            )
+    finally:
+        # Let the stalled handler answer before the server shuts down
+        release.set()
+        await asyncio.sleep(0.01)
+        await runner.cleanup()
+
+    assert result is None
+    assert generator.transient_failure
+    assert (logging.ERROR, "Gave up after 0.1 seconds.") in generator.logger.buffer
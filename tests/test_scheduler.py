@@ -0,0 +1,127 @@
+"""Tests for the activity-based refresh schedule."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from generator import RefreshSchedule
+from generator.scheduler import DAY, DORMANT_INTERVAL, HOUR, refresh_interval
+from metadata.summary_generator import SummaryGenerator
+
+NOW = 1_800_000_000.0
+
+
+def plugin(days_idle: float, stars: int = 1) -> dict:
+    """Build plugin metadata whose last push was `days_idle` days ago."""
+    updated = datetime.fromtimestamp(NOW - days_idle * DAY, UTC).isoformat()
+    return {
+        "last_updated": updated,
+        "releases": [],
+        "repository": "owner/repo",
+        "stargazers_count": stars,
+    }
+
+
+def test_interval_follows_activity() -> None:
+    """Recently active plugins are refreshed more often than idle ones."""
+    assert refresh_interval(plugin(1), 0.0, NOW) == 2 * HOUR
+    assert refresh_interval(plugin(20), 0.0, NOW) == 12 * HOUR
+    assert refresh_interval(plugin(400), 0.0, NOW) == DORMANT_INTERVAL
+    # Data that changes on most fetches moves the plugin one tier up
+    assert refresh_interval(plugin(400), 0.75, NOW) == DAY
+
+
+def test_change_rate_decays_while_data_is_stable(schedule_file: Path) -> None:
+    """Unchanged fetches lower the change rate, a change raises it again."""
+    schedule = RefreshSchedule(schedule_file)
+    schedule.record("owner/repo", 1, plugin(400), now=NOW)
+    schedule.record("owner/repo", 1, plugin(400), now=NOW)
+    schedule.record("owner/repo", 1, plugin(400), now=NOW)
+    assert schedule.entries["owner/repo"].change_rate == 0.25
+    assert schedule.entries["owner/repo"].interval == DORMANT_INTERVAL
+
+    schedule.record("owner/repo", 1, plugin(400, stars=2), now=NOW)
+    assert schedule.entries["owner/repo"].change_rate == 0.625
+
+
+def test_due_plugins_and_a_rotating_dormant_sample(schedule_file: Path) -> None:
+    """New and expired plugins are due, plus the longest-waiting dormant ones."""
+    schedule = RefreshSchedule(schedule_file, sample_size=1)
+    schedule.record("owner/active", 1, plugin(1), now=NOW - 3 * HOUR)
+    schedule.record("owner/fresh", 2, plugin(1), now=NOW - HOUR)
+    for n in range(3):
+        # Stable data settles the new entries into the dormant tier
+        for _ in range(2):
+            schedule.record(f"owner/idle{n}", 10 + n, plugin(400), now=NOW - n * HOUR)
+    schedule.save()
+
+    repos = ["owner/new", "owner/Active", "owner/fresh"] + [
+        f"owner/idle{n}" for n in range(3)
+    ]
+    due = RefreshSchedule(schedule_file, sample_size=1).load().due(repos, now=NOW)
+
+    assert due == {"owner/new", "owner/Active", "owner/idle2"}
+
+
+def test_active_plugins_are_due_on_every_cron_tick(schedule_file: Path) -> None:
+    """A 2-hour interval is due on each 2-hourly run, despite start jitter."""
+    schedule = RefreshSchedule(schedule_file)
+    fetched = []
+    for tick in range(6):
+        started = NOW + tick * 2 * HOUR + (90 if tick % 2 else -90)
+        if schedule.due(["owner/active"], now=started):
+            fetched.append(tick)
+            # Stamped when the run ends, a few minutes after it started
+            schedule.record("owner/active", 1, plugin(1), now=started + 150)
+
+    assert fetched == list(range(6))
+
+
+async def test_generate_fetches_only_due_plugins(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schedule_file: Path
+) -> None:
+    """Plugins that are not due keep their previous result without a fetch."""
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(["owner/idle", "owner/due"]))
+    output_dir = tmp_path / "output"
+    (output_dir / "diff").mkdir(parents=True)
+    previous = {"1": {**plugin(400), "repository": "owner/idle"}}
+    (output_dir / "diff" / "data_before.json").write_text(json.dumps(previous))
+    schedule = RefreshSchedule(schedule_file, sample_size=0)
+    schedule.record("owner/idle", 1, previous["1"])
+    schedule.save()
+    monkeypatch.setenv("SCHEDULE_SAMPLE_SIZE", "0")
+    fetched: list[str] = []
+
+    class FakeLogger:
+        def flush(self, _sink: object = None) -> None:
+            pass
+
+    class FakeGenerator:
+        def __init__(self, repo: str, _zip_inspector: object = None) -> None:
+            self.original_repo = self.repo = repo
+            self.logger = FakeLogger()
+            self.transient_failure = False
+
+        def log(self, _message: str) -> None:
+            pass
+
+        async def fetch_metadata(self, _github: AsyncMock) -> dict | None:
+            fetched.append(self.repo)
+            return {2: {**plugin(1), "repository": self.repo}}
+
+    monkeypatch.setattr(
+        "metadata.summary_generator.PluginMetadataGenerator", FakeGenerator
+    )
+
+    await SummaryGenerator(str(plugin_file), str(output_dir)).generate("token")
+
+    assert fetched == ["owner/due"]
+    data = json.loads((output_dir / "data.json").read_text())
+    assert data["1"] == previous["1"]
+    assert set(RefreshSchedule(schedule_file).load().entries) == {
+        "owner/idle",
+        "owner/due",
+    }
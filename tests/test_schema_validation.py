@@ -0,0 +1,105 @@
+"""Tests for scripts/schema_validation.py."""
+
+import base64
+import json
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+import schema_validation
+from jsonschema import SchemaError
+from plugin_metadata_generator import PluginMetadataGenerator
+from schema_validation import SchemaValidator, get_validator
+
+from . import load_fixture
+from .conftest import MockGitHubResponse
+
+
+def test_registry_files_match_their_schemas() -> None:
+    """The registry files in the repository are valid."""
+    assert not schema_validation.validate_files(
+        schema_validation.REGISTRY_SCHEMAS.items()
+    )
+
+
+def test_errors_report_the_path() -> None:
+    """Every problem is reported with the path of the offending value."""
+    validator = get_validator("removed")
+
+    errors = validator.validate(
+        [{"repository": "owner/repo", "removal_type": "remove"}, {"repository": 1}]
+    )
+
+    assert errors == [
+        "$[1]: 'removal_type' is a required property",
+        "$[1].repository: 1 is not of type 'string'",
+    ]
+    [error] = get_validator("categories").validate({"Timing": ["not a repo"]})
+    assert error.startswith("$.Timing[0]: 'not a repo' does not match")
+
+
+def test_semantics_follow_the_specification() -> None:
+    """Booleans are not numbers, and word characters are ASCII only."""
+    validator = SchemaValidator(
+        "test", {"type": "array", "items": {"enum": [1]}, "uniqueItems": True}
+    )
+
+    assert validator.validate([1, True]) == ["$[1]: True is not one of [1]"]
+    assert validator.validate([1, 1]) == ["$: [1, 1] has non-unique elements"]
+    assert get_validator("repositories").validate(["owner/plugin"]) == []
+    assert get_validator("repositories").validate(["ownér/plugin"])
+
+
+def test_results_are_cached_by_content() -> None:
+    """Identical documents are only validated once."""
+    validator = SchemaValidator("test", {"type": "array", "items": {"type": "string"}})
+    calls = []
+    validate = validator.validate
+    validator.validate = lambda data: calls.append(data) or validate(data)
+
+    assert validator.validate_bytes(b'["a"]') == ()
+    assert validator.validate_bytes(b'["a"]') == ()
+    assert validator.validate_bytes(b"[1]") == ("$[0]: 1 is not of type 'string'",)
+    assert len(calls) == 2
+    assert get_validator("manifest") is get_validator("manifest")
+
+
+def test_invalid_schema_is_rejected() -> None:
+    """Schemas that are not valid draft-07 fail to load."""
+    with pytest.raises(SchemaError):
+        SchemaValidator("test", {"type": "object", "oneOf": []})
+
+
+def test_validate_files_reports_unreadable_files(tmp_path: Path) -> None:
+    """Missing and malformed files count as failures."""
+    broken = tmp_path / "plugins.json"
+    broken.write_text("[", encoding="utf-8")
+
+    assert (
+        schema_validation.validate_files(
+            [(broken, "repositories"), (tmp_path / "missing.json", "removed")]
+        )
+        == 2
+    )
+
+
+async def test_invalid_manifest_is_reported(mock_github: AsyncMock) -> None:
+    """A manifest that does not match the schema is logged, not dropped."""
+    manifest = load_fixture("manifest_data.json")
+    del manifest["name"]
+    content = base64.b64encode(json.dumps(manifest).encode("utf-8")).decode("utf-8")
+    mock_github.repos.contents.get = AsyncMock(
+        return_value=MockGitHubResponse(data=type("Data", (), {"content": content}))
+    )
+    plugin = PluginMetadataGenerator("owner/repo")
+    plugin.domain = "testdomain"
+    plugin.releases = [SimpleNamespace(tag_name="v1.0.1", prerelease=False)]
+
+    assert await plugin.fetch_manifest_file(mock_github)
+    assert (
+        logging.WARNING,
+        "Invalid `custom_plugins/testdomain/manifest.json`: "
+        "$: 'name' is a required property",
+    ) in plugin.logger.buffer
@@ -0,0 +1,93 @@
+"""Tests for scripts/serialization.py."""
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+import serialization
+from metadata import PluginMetadataGenerator
+
+SAMPLE = {
+    1: {
+        "manifest": {"description": "Zeitmessung für FPV ✅", "dependencies": []},
+        "releases": [{"tag_name": "v1.0.0", "prerelease": False, "size": 1.5}],
+        "topics": [],
+        "last_prerelease": None,
+    },
+    "2": {},
+}
+
+
+def test_fast_backend_matches_stdlib() -> None:
+    """The fast backend writes exactly the same bytes as the standard library."""
+    pytest.importorskip("orjson")
+    assert serialization.BACKEND == "orjson"
+    assert serialization.dumps(SAMPLE) == serialization.dumps_stdlib(SAMPLE)
+
+
+@pytest.fixture
+async def data_json(tmp_path: Path, mock_github: AsyncMock) -> Path:
+    """Return the published data.json, or one generated from the fixtures.
+
+    CI points `PUBLISHED_DATA_JSON` at a download of the live file.
+    """
+    if published := os.getenv("PUBLISHED_DATA_JSON"):
+        return Path(published)
+    plugin_data = await PluginMetadataGenerator("owner/repo").fetch_metadata(
+        mock_github
+    )
+    path = tmp_path / "data.json"
+    path.write_bytes(serialization.dumps_stdlib(plugin_data))
+    return path
+
+
+def test_backends_match_on_data_json(data_json: Path) -> None:
+    """Both backends write the same bytes for the registry's data."""
+    pytest.importorskip("orjson")
+    data = serialization.load(data_json)
+
+    assert data
+    assert serialization.dumps(data) == serialization.dumps_stdlib(data)
+
+
+def test_wide_integers_fall_back_to_stdlib() -> None:
+    """Integers orjson cannot encode are written by the standard library."""
+    data = {"downloads": 2**70}
+
+    assert serialization.dumps(data) == serialization.dumps_stdlib(data)
+
+
+def test_dumps_line_writes_one_compact_line() -> None:
+    """JSON lines entries have no newlines or padding, whatever the backend."""
+    line = serialization.dumps_line({**SAMPLE, "big": 2**70})
+
+    assert b"\n" not in line
+    assert b": " not in line
+    assert serialization.loads(line)["1"] == SAMPLE[1]
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_round_trip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, fast: bool
+) -> None:
+    """Data written to disk loads back with stringified keys."""
+    if not fast:
+        monkeypatch.setattr(serialization, "orjson", None)
+    path = tmp_path / "data.json"
+
+    serialization.dump(path, SAMPLE, trailing_newline=True)
+
+    assert path.read_bytes().endswith(b"}\n")
+    assert serialization.load(path) == {"1": SAMPLE[1], "2": {}}
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_invalid_json_raises_decode_error(
+    monkeypatch: pytest.MonkeyPatch, *, fast: bool
+) -> None:
+    """Both backends raise the same exception type on invalid input."""
+    if not fast:
+        monkeypatch.setattr(serialization, "orjson", None)
+    with pytest.raises(serialization.JSONDecodeError):
+        serialization.loads(b"not a json")
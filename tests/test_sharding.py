@@ -0,0 +1,90 @@
+"""Tests for sharded generation and the merge step."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from metadata.summary_generator import SummaryGenerator, shard_of
+
+REPOS = [f"owner/plugin-{n:02d}" for n in range(12)] + ["owner/skip"]
+
+
+@pytest.fixture
+def fake_generator(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the plugin generator with one that needs no API."""
+
+    class FakeLogger:
+        def flush(self, _sink: object = None) -> None:
+            pass
+
+    class FakeGenerator:
+        def __init__(self, repo: str, _zip_inspector: object = None) -> None:
+            self.original_repo = self.repo = repo
+            self.logger = FakeLogger()
+            self.transient_failure = False
+
+        async def fetch_metadata(self, _github: AsyncMock) -> dict | None:
+            if self.repo == "owner/skip":
+                return None
+            return {
+                REPOS.index(self.repo) + 100: {
+                    "repository": self.repo,
+                    "last_fetched": "now",
+                }
+            }
+
+    monkeypatch.setattr(
+        "metadata.summary_generator.PluginMetadataGenerator", FakeGenerator
+    )
+
+
+def make_summary(tmp_path: Path, name: str) -> SummaryGenerator:
+    """Create a generator writing to its own output directory."""
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(REPOS))
+    output_dir = tmp_path / name
+    (output_dir / "diff").mkdir(parents=True)
+    return SummaryGenerator(str(plugin_file), str(output_dir))
+
+
+def test_shard_of_partitions_stably() -> None:
+    """Every repository lands in exactly one shard, independent of case."""
+    shards = [shard_of(repo, 3) for repo in REPOS]
+
+    assert all(0 <= shard < 3 for shard in shards)
+    assert len(set(shards)) == 3
+    assert shard_of("Owner/Plugin-01", 3) == shard_of("owner/plugin-01", 3)
+
+
+@pytest.mark.usefixtures("fake_generator")
+async def test_merged_shards_match_a_single_run(tmp_path: Path) -> None:
+    """Merging the shards gives the same outputs as one run over all plugins."""
+    shard_dir = str(tmp_path / "shards")
+    for shard in range(3):
+        await make_summary(tmp_path, f"shard{shard}").generate_shard(
+            "token", shard, 3, shard_dir
+        )
+    merged = make_summary(tmp_path, "merged")
+    merged.merge(shard_dir)
+    single = make_summary(tmp_path, "single")
+    await single.generate("token")
+
+    merged_dir, single_dir = Path(merged.output_dir), Path(single.output_dir)
+    for name in ("data.json", "repositories.json", "diff/after.json"):
+        assert (merged_dir / name).read_bytes() == (single_dir / name).read_bytes()
+    summary = json.loads((merged_dir / "summary.json").read_text())
+    assert summary["total_plugins"] == 13
+    assert summary["valid_plugins"] == 12
+    assert summary["skipped_plugins"] == 1
+    assert summary["stale_plugins"] == 0
+
+
+@pytest.mark.usefixtures("fake_generator")
+async def test_merge_requires_every_shard(tmp_path: Path) -> None:
+    """A missing shard fails the merge instead of dropping plugins."""
+    shard_dir = str(tmp_path / "shards")
+    await make_summary(tmp_path, "shard0").generate_shard("token", 0, 2, shard_dir)
+
+    with pytest.raises(ValueError, match="Incomplete"):
+        make_summary(tmp_path, "merged").merge(shard_dir)
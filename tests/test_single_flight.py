@@ -0,0 +1,108 @@
+"""Tests for sharing identical in-flight GitHub requests."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import aiohttp
+import pytest
+import transport
+from aiohttp import web
+from request_policy import PolicySession, RequestPolicy, request_key
+
+
+@pytest.fixture
+async def stand_in() -> AsyncIterator[tuple[str, list[str]]]:
+    """Run a slow stand-in for the GitHub API and record every request."""
+    seen: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        seen.append(request.path_qs)
+        await asyncio.sleep(0.1)
+        return web.json_response({"ref": request.query.get("ref")})
+
+    app = web.Application()
+    app.router.add_get("/repos/{owner}/{repo}/contents/{path}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", seen
+    await runner.cleanup()
+
+
+async def test_concurrent_identical_requests_share_one_response(
+    stand_in: tuple[str, list[str]],
+) -> None:
+    """Clients in a shared session send one request, each gets its own data."""
+    base_url, seen = stand_in
+    config = transport.TransportConfig(base_url=base_url)
+    endpoint = "/repos/owner/repo/contents/hacs.json"
+
+    async with transport.shared_session(config):
+
+        async def fetch(repo_path: str) -> dict:
+            async with transport.github_client(None, config) as github:
+                response = await github.generic(repo_path, params={"ref": "v1"})
+                return response.data
+
+        results = await asyncio.gather(
+            fetch(endpoint),
+            fetch(endpoint),
+            fetch("/repos/Owner/Repo/contents/hacs.json"),
+        )
+
+    assert seen == ["/repos/owner/repo/contents/hacs.json?ref=v1"]
+    assert results == [{"ref": "v1"}] * 3
+    results[0]["ref"] = "changed"
+    assert results[1] == {"ref": "v1"}
+
+
+async def test_different_refs_and_later_calls_are_sent(
+    stand_in: tuple[str, list[str]],
+) -> None:
+    """Only requests that overlap and match exactly are shared."""
+    base_url, seen = stand_in
+    url = f"{base_url}/repos/owner/repo/contents/hacs.json"
+    async with aiohttp.ClientSession() as session:
+        policy_session = PolicySession(session, RequestPolicy())
+        await asyncio.gather(
+            policy_session.request("GET", url, params={"ref": "v1"}),
+            policy_session.request("GET", url, params={"ref": "v2"}),
+        )
+        await policy_session.request("GET", url, params={"ref": "v1"})
+
+    assert len(seen) == 3
+    assert policy_session.deduplicated == 0
+
+
+async def test_cancelled_caller_does_not_cancel_the_others(
+    stand_in: tuple[str, list[str]],
+) -> None:
+    """A caller that gives up leaves the shared request running."""
+    base_url, seen = stand_in
+    url = f"{base_url}/repos/owner/repo/contents/hacs.json"
+    async with aiohttp.ClientSession() as session:
+        policy_session = PolicySession(session, RequestPolicy())
+        first = asyncio.ensure_future(policy_session.request("GET", url))
+        second = asyncio.ensure_future(policy_session.request("GET", url))
+        await asyncio.sleep(0.02)
+        first.cancel()
+
+        response = await second
+
+    assert await response.json() == {"ref": None}
+    assert first.cancelled()
+    assert len(seen) == 1
+
+
+def test_request_key() -> None:
+    """Owner and repository names are case-insensitive, paths and headers not."""
+    url = "https://api.github.com/repos/Owner/Repo/contents/README.md"
+    assert request_key(url, {}) == request_key(
+        url.replace("Owner/Repo", "owner/repo"), {}
+    )
+    assert request_key(url, {}) != request_key(url.replace("README", "readme"), {})
+    assert request_key(url, {"headers": {"If-None-Match": "a"}}) != request_key(
+        url, {"headers": {"If-None-Match": "b"}}
+    )
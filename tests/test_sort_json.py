@@ -0,0 +1,76 @@
+"""Tests for scripts/sort_json.py."""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+import sort_json
+
+
+def test_first_unsorted_index() -> None:
+    """Order is case-insensitive and non-strings sort by their JSON form."""
+    assert sort_json.first_unsorted_index(["a", "B", "c"]) is None
+    assert sort_json.first_unsorted_index({"a": 1, "C": 2, "b": 3}) == 2
+    assert sort_json.first_unsorted_index([{"r": "a"}, {"r": "c"}, {"r": "b"}]) == 2
+    assert sort_json.first_unsorted_index([]) is None
+
+
+def test_diff_covers_first_unsorted_region_only(tmp_path: Path) -> None:
+    """The diff is built from the items around the first unsorted one."""
+    items = [f"owner/repo-{i:03d}" for i in range(100)]
+    items[50], items[51] = items[51], items[50]
+    items[90], items[91] = items[91], items[90]
+
+    diff = sort_json.unsorted_region_diff(tmp_path / "plugins.json", items, 51)
+
+    assert "items 48-55" in diff
+    assert "owner/repo-050" in diff
+    assert "owner/repo-090" not in diff
+
+
+def test_sort_json_accepts_dicts_in_any_key_order(tmp_path: Path) -> None:
+    """Dict files pass the check and are left as they are."""
+    path = tmp_path / "categories.json"
+    content = json.dumps({"b": [], "A": []})
+    path.write_text(content, encoding="utf-8")
+
+    assert sort_json.sort_json(path, check_only=True)
+    assert sort_json.sort_json(path)
+    assert path.read_text(encoding="utf-8") == content
+
+
+def test_worker_count_stays_serial_for_few_small_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The process pool is only used for many files or when asked for."""
+    monkeypatch.setattr(sort_json.os, "cpu_count", lambda: 4)
+    files = []
+    for i in range(sort_json.PARALLEL_MIN_FILES):
+        path = tmp_path / f"{i}.json"
+        path.write_text("[]", encoding="utf-8")
+        files.append(path)
+
+    assert sort_json.worker_count(files[:2], None) == 1
+    assert sort_json.worker_count(files[:2], 3) == 3
+    assert sort_json.worker_count(files, None) == 4
+
+
+def test_process_files_in_pool_keeps_log_order(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Worker logs are replayed in file order."""
+    files = []
+    for name, data in (("a", ["x", "y"]), ("b", ["y", "x"]), ("c", ["z"])):
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        files.append(path)
+
+    with caplog.at_level(logging.INFO):
+        assert not sort_json.process_files(files, check_only=True, jobs=3)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        f"✅ {files[0]} is already sorted.",
+        f"❌ {files[1]} is not sorted.",
+        f"✅ {files[2]} is already sorted.",
+    ]
@@ -0,0 +1,82 @@
+"""Tests for publishing the previous entry after a transient failure."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from aiogithubapi import (
+    GitHubConnectionException,
+    GitHubException,
+    GitHubNotFoundException,
+    GitHubRatelimitException,
+)
+from metadata.summary_generator import SummaryGenerator
+from transport import is_transient
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (GitHubConnectionException("reset"), True),
+        (GitHubRatelimitException("rate limit"), True),
+        (GitHubException("Server Error"), True),
+        (aiohttp.ClientConnectionError(), True),
+        (TimeoutError(), True),
+        (GitHubNotFoundException("Not Found"), False),
+        (GitHubException("Validation Failed"), False),
+    ],
+)
+def test_is_transient(error: BaseException, *, expected: bool) -> None:
+    """Network errors, rate limits and server errors are transient."""
+    assert is_transient(error) is expected
+
+
+async def test_transient_failures_keep_the_previous_entry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Transient failures publish a stale entry, hard failures drop the plugin."""
+    plugin_file = tmp_path / "plugins.json"
+    plugin_file.write_text(json.dumps(["owner/flaky", "owner/broken", "owner/ok"]))
+    output_dir = tmp_path / "output"
+    (output_dir / "diff").mkdir(parents=True)
+    previous = {
+        "1": {"repository": "owner/flaky", "version": "1.0.0"},
+        "2": {"repository": "owner/broken", "version": "1.0.0"},
+    }
+    (output_dir / "diff" / "data_before.json").write_text(json.dumps(previous))
+
+    class FakeLogger:
+        def flush(self, _sink: object = None) -> None:
+            pass
+
+    class FakeGenerator:
+        def __init__(self, repo: str, _zip_inspector: object = None) -> None:
+            self.original_repo = self.repo = repo
+            self.logger = FakeLogger()
+            self.transient_failure = False
+
+        def log(self, *_args: object, **_kwargs: object) -> None:
+            pass
+
+        async def fetch_metadata(self, _github: AsyncMock) -> dict | None:
+            if self.repo == "owner/ok":
+                return {3: {"repository": self.repo}}
+            self.transient_failure = self.repo == "owner/flaky"
+            return None
+
+    monkeypatch.setattr(
+        "metadata.summary_generator.PluginMetadataGenerator", FakeGenerator
+    )
+
+    await SummaryGenerator(str(plugin_file), str(output_dir)).generate("token")
+
+    data = json.loads((output_dir / "data.json").read_text())
+    assert list(data) == ["1", "3"]
+    assert data["1"]["version"] == "1.0.0"
+    assert "stale_since" in data["1"]
+    summary = json.loads((output_dir / "summary.json").read_text())
+    assert summary["valid_plugins"] == 2
+    assert summary["stale_plugins"] == 1
+    assert summary["skipped_plugins"] == 1
@@ -0,0 +1,97 @@
+"""Tests for scripts/transport.py."""
+
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+
+import aiohttp
+import pytest
+import transport
+from aiohttp import web
+
+
+@pytest.fixture
+async def stand_in() -> AsyncIterator[tuple[str, list[str]]]:
+    """Run a local stand-in for the GitHub API and record Accept-Encoding."""
+    seen: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        seen.append(request.headers.get("Accept-Encoding", ""))
+        return web.json_response({"full_name": request.match_info["repo"]})
+
+    app = web.Application()
+    app.router.add_get("/repos/owner/{repo}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", seen
+    await runner.cleanup()
+
+
+async def test_shared_session_reuses_connections(
+    stand_in: tuple[str, list[str]],
+) -> None:
+    """Sequential calls through one client share a single pooled connection."""
+    base_url, _ = stand_in
+    created = 0
+
+    async def on_create(*_: object) -> None:
+        nonlocal created
+        created += 1
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_end.append(on_create)
+    config = transport.TransportConfig(base_url=base_url)
+
+    async with (
+        transport.create_session(config, [trace]) as session,
+        transport.github_client(None, config, session=session) as github,
+    ):
+        for i in range(10):
+            response = await github.generic(f"/repos/owner/repo{i}")
+            assert response.data == {"full_name": f"repo{i}"}
+        assert not session.closed
+
+    assert created == 1
+
+
+async def test_compression_can_be_disabled(
+    stand_in: tuple[str, list[str]],
+) -> None:
+    """With compression off the client asks for identity encoding."""
+    base_url, seen = stand_in
+    config = transport.TransportConfig(base_url=base_url, compression=False)
+
+    async with transport.github_client(None, config) as github:
+        await github.generic("/repos/owner/repo")
+
+    assert seen == ["identity"]
+
+
+def test_from_env_reads_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Environment variables override the defaults."""
+    monkeypatch.setenv("HTTP_POOL_SIZE", "8")
+    monkeypatch.setenv("HTTP_TIMEOUT", "5")
+    monkeypatch.setenv("HTTP_COMPRESSION", "0")
+    monkeypatch.setenv("USE_UVLOOP", "1")
+
+    config = transport.TransportConfig.from_env()
+
+    assert config.pool_size == 8
+    assert config.request_timeout == 5
+    assert config.compression is False
+    assert config.use_uvloop is True
+
+
+def test_run_falls_back_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An unavailable uvloop falls back to the default event loop."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    async def answer() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    config = transport.TransportConfig(use_uvloop=True)
+    assert transport.run(answer(), config) == 42
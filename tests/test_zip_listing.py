@@ -0,0 +1,197 @@
+"""Tests for reading zip central directories with range requests."""
+
+import io
+import logging
+import os
+import struct
+import zipfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from aiohttp import web
+from generator import ZipInspector, ZipListingCache, ZipListingError
+from generator.records import AssetRecord
+from generator.releases import ReleaseAssetInfo
+from generator.zip_listing import (
+    TAIL_SIZE,
+    fetch_zip_listing,
+    find_end_of_central_directory,
+    parse_central_directory,
+)
+from plugin_metadata_generator import PluginMetadataGenerator
+
+
+def build_zip(*, comment: bytes = b"") -> bytes:
+    """Build a plugin zip with a directory entry and an incompressible file."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("custom_plugins/testdomain/", "")
+        archive.writestr("custom_plugins/testdomain/manifest.json", '{"a": 1}')
+        archive.writestr("custom_plugins/testdomain/__init__.py", "x = 1\n" * 100)
+        archive.writestr("custom_plugins/testdomain/data.bin", os.urandom(64 * 1024))
+        archive.comment = comment
+    return buffer.getvalue()
+
+
+def central_directory(data: bytes) -> bytes:
+    """Return the central directory of a zip."""
+    offset, size = find_end_of_central_directory(data, 0)
+    return data[offset : offset + size]
+
+
+@pytest.mark.parametrize("cut", [10, 46, 60])
+def test_truncated_central_directory_is_a_listing_error(cut: int) -> None:
+    """A directory cut inside a header or a name fails like a malformed one."""
+    directory = central_directory(build_zip())
+
+    with pytest.raises(ZipListingError, match="Truncated"):
+        parse_central_directory(directory[:cut])
+
+
+def test_truncated_zip64_extra_is_a_listing_error() -> None:
+    """A Zip64 size whose extra field is too short fails cleanly."""
+    extra = struct.pack("<HH", 0x0001, 8) + bytes(4)
+    header = (
+        b"PK\x01\x02"
+        + bytes(20)
+        + struct.pack("<I", 0xFFFFFFFF)
+        + struct.pack("<HHH", 4, len(extra), 0)
+        + bytes(12)
+    )
+
+    with pytest.raises(ZipListingError, match="Zip64 extra field"):
+        parse_central_directory(header + b"file" + extra)
+
+
+def test_truncated_zip64_record_is_a_listing_error() -> None:
+    """A Zip64 end of central directory record cut short fails cleanly."""
+    record = b"PK\x06\x06" + bytes(8)
+    locator = b"PK\x06\x07" + struct.pack("<IQI", 0, 0, 1)
+    eocd = b"PK\x05\x06" + struct.pack("<4H2IH", 0, 0, 0, 0, *[0xFFFFFFFF] * 2, 0)
+
+    with pytest.raises(ZipListingError, match="truncated"):
+        find_end_of_central_directory(record + locator + eocd, 0)
+
+
+@pytest.fixture
+async def asset_server() -> AsyncIterator[tuple[str, dict[str, bytes], list[str]]]:
+    """Serve zips from memory, honouring `Range` unless the name says otherwise."""
+    files: dict[str, bytes] = {}
+    ranges: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        body = files[request.match_info["name"]]
+        header = request.headers.get("Range")
+        if header is None or request.match_info["name"].startswith("norange"):
+            return web.Response(body=body)
+        ranges.append(header)
+        start, end = (int(value) for value in header.removeprefix("bytes=").split("-"))
+        return web.Response(
+            status=206,
+            body=body[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(body)}"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", files, ranges
+    await runner.cleanup()
+
+
+async def test_listing_reads_only_the_central_directory(
+    asset_server: tuple[str, dict[str, bytes], list[str]],
+) -> None:
+    """File count, size and manifests come from one request for the tail."""
+    base_url, files, ranges = asset_server
+    files["plugin.zip"] = data = build_zip()
+    entries = zipfile.ZipFile(io.BytesIO(data)).infolist()
+
+    async with aiohttp.ClientSession() as session:
+        listing = await fetch_zip_listing(session, f"{base_url}/plugin.zip", len(data))
+
+    assert listing.file_count == 3
+    assert listing.uncompressed_size == sum(entry.file_size for entry in entries)
+    assert listing.has_manifest("testdomain")
+    assert not listing.has_manifest("otherdomain")
+    assert ranges == [f"bytes={len(data) - TAIL_SIZE}-{len(data) - 1}"]
+
+
+async def test_listing_with_long_comment_widens_the_tail(
+    asset_server: tuple[str, dict[str, bytes], list[str]],
+) -> None:
+    """A comment longer than the first tail request triggers a wider one."""
+    base_url, files, ranges = asset_server
+    files["plugin.zip"] = data = build_zip(comment=b"c" * (TAIL_SIZE * 2))
+
+    async with aiohttp.ClientSession() as session:
+        listing = await fetch_zip_listing(session, f"{base_url}/plugin.zip", len(data))
+
+    assert listing.file_count == 3
+    assert len(ranges) == 2
+
+
+async def test_listing_requires_range_support(
+    asset_server: tuple[str, dict[str, bytes], list[str]],
+) -> None:
+    """Servers that ignore `Range` are not downloaded from."""
+    base_url, files, _ = asset_server
+    files["norange.zip"] = data = build_zip()
+
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(ZipListingError, match="HTTP 200"):
+            await fetch_zip_listing(session, f"{base_url}/norange.zip", len(data))
+
+
+async def test_inspector_caches_by_digest(
+    asset_server: tuple[str, dict[str, bytes], list[str]], zip_cache_file: Path
+) -> None:
+    """A digest is only inspected once, and the cache survives a reload."""
+    base_url, files, ranges = asset_server
+    files["plugin.zip"] = data = build_zip()
+    url = f"{base_url}/plugin.zip"
+
+    async with aiohttp.ClientSession() as session:
+        inspector = ZipInspector(session, ZipListingCache.from_env())
+        first = await inspector.inspect(url, len(data), "abc")
+        second = await inspector.inspect(url, len(data), "abc")
+    inspector.cache.save()
+
+    assert first is second
+    assert len(ranges) == 1
+    assert ZipListingCache(zip_cache_file).load().get("abc") == first
+
+
+async def test_generator_records_zip_footprint(
+    asset_server: tuple[str, dict[str, bytes], list[str]],
+) -> None:
+    """The plugin zip gets its footprint and a missing manifest is reported."""
+    base_url, files, _ = asset_server
+    files["plugin.zip"] = data = build_zip()
+    asset = ReleaseAssetInfo(
+        name="plugin.zip",
+        size=len(data),
+        browser_download_url=f"{base_url}/plugin.zip",
+    )
+
+    async with aiohttp.ClientSession() as session:
+        inspector = ZipInspector(session, ZipListingCache.from_env())
+        plugin = PluginMetadataGenerator("owner/repo", inspector)
+        plugin.releases = [SimpleNamespace(tag_name="v1.0.1", prerelease=False)]
+        plugin.domain = "otherdomain"
+        record = AssetRecord(name="plugin.zip", sha256="abc")
+        await plugin._inspect_zip(asset, record)
+
+    assert record.as_dict()["file_count"] == 3
+    assert record.uncompressed_size > 64 * 1024
+    assert (
+        logging.WARNING,
+        "'plugin.zip' does not contain `custom_plugins/otherdomain/manifest.json`.",
+    ) in plugin.logger.buffer